@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+"""
+Mapping Discovery: Pareto Search over s(r, M) Families
+======================================================
+v1 ends with "find the natural s(r, M) mapping". Instead of hand-editing
+s_linear or the cubic map, this script searches whole families of
+few-parameter mappings and scores every candidate on three objectives
+(all minimized, all 0 for Schwarzschild):
+
+    gps   |Δclock(GPS - Earth) - GR|   gravitational part, μs/day
+    grr   RMS ln[(g_rr - 1) / (r_s/(r - r_s))]   over the (r, M) grid
+    vac   RMS |Ric| · r³/r_s                    (vacuum_residual.py)
+
+with the v4 metric g_tt = -1/ζ(s), g_rr = ζ(s), g_θθ = r². A candidate
+with s ≤ 1 anywhere outside the horizon scores ∞ on all three.
+
+Search: Latin hypercube over each family's parameter box, then rounds of
+jittered samples around the current Pareto front, chunks of candidates
+spread over a process pool. Every candidate × grid block is one NumPy
+pass; ζ - 1, ζ', ζ'' come from a table built once per worker
+(cubic Hermite in ln(s - 1), ~3e-10 relative) instead of the
+Euler–Maclaurin series.
+
+Usage:
+    python3 mapping_search.py
+    python3 mapping_search.py --n 4000 --refine 3 --workers 8
+
+Author: Christopher Riner & Barron
+"""
+
+import json
+import math
+import os
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from vacuum_residual import G, M_sun, MAPPINGS, X_RANGE, c, rM_grid, vacuum_residual
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "kretschner"))
+from zeta_numpy import ZETA_S_MAX, zeta_derivatives_np  # noqa: E402
+
+OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "output")
+
+# ═══════════════════════════════════════════════════════════
+# CONSTANTS
+# ═══════════════════════════════════════════════════════════
+M_earth = 5.9722e24
+R_earth = 6.3781e6
+R_gps = 2.6571e7
+r_s_earth = 2 * G * M_earth / c**2
+US_PER_DAY = 86400 * 1e6
+
+GRID_NR = 400               # scoring grid: r/r_s over X_RANGE ...
+GRID_NM = 8                 # ... × M over M_RANGE
+TABLE_SIZE = 1 << 14
+TABLE_T_MIN = -14.0         # ln(s - 1); below: exact series
+CHUNK = 64                  # candidates per NumPy pass
+OBJECTIVES = ["gps", "grr", "vac"]
+
+Family = namedtuple("Family", ["name", "params", "ranges", "s", "formula"])
+FAMILIES = {}   # name → Family, in registration order
+
+
+# ═══════════════════════════════════════════════════════════
+# CACHED ζ
+# ═══════════════════════════════════════════════════════════
+
+class ZetaTable:
+    """
+    ζ - 1, ζ', ζ'' on a uniform grid in t = ln(s - 1), stored as
+    F₀ = ln(ζ - 1), F₁ = ln(-ζ'/(ζ - 1)), F₂ = ln(ζ''/(ζ - 1)) — smooth and
+    nearly linear in t — with dF/dt (from ζ''') for cubic Hermite
+    interpolation. Same call signature as zeta_derivatives_np; s outside
+    the table falls back to the series.
+    """
+
+    def __init__(self, n=TABLE_SIZE, t_min=TABLE_T_MIN, t_max=math.log(ZETA_S_MAX - 1.0)):
+        self.t = np.linspace(t_min, t_max, n)
+        self.h = self.t[1] - self.t[0]
+        sm1 = np.exp(self.t)
+        zm1, z1, z2, z3 = zeta_derivatives_np(1.0 + sm1, order=3, minus_one=True)
+        g = z1 / zm1
+        self.rows = [(np.log(zm1), sm1 * g),
+                     (np.log(-g), sm1 * (z2 / z1 - g)),
+                     (np.log(z2 / zm1), sm1 * (z3 / z2 - g))]
+
+    def _hermite(self, k, i, u):
+        f, d = self.rows[k]
+        u2, u3 = u * u, u * u * u
+        return ((2 * u3 - 3 * u2 + 1) * f[i] + (u3 - 2 * u2 + u) * self.h * d[i]
+                + (3 * u2 - 2 * u3) * f[i + 1] + (u3 - u2) * self.h * d[i + 1])
+
+    def __call__(self, s, order=2, minus_one=False):
+        s = np.asarray(s, dtype=float)
+        out = np.empty((order + 1,) + s.shape)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = np.log(s - 1.0)
+        inside = (t >= self.t[0]) & (t <= self.t[-1])
+        x = (t[inside] - self.t[0]) / self.h
+        i = np.minimum(x.astype(np.intp), len(self.t) - 2)
+        u = x - i
+        zm1 = np.exp(self._hermite(0, i, u))
+        out[0][inside] = zm1
+        if order >= 1:
+            out[1][inside] = -zm1 * np.exp(self._hermite(1, i, u))
+        if order >= 2:
+            out[2][inside] = zm1 * np.exp(self._hermite(2, i, u))
+        if not inside.all():
+            out[:, ~inside] = zeta_derivatives_np(s[~inside], order=order, minus_one=True)
+        if not minus_one:
+            out[0] += 1.0
+        return out
+
+
+_TABLE = None
+
+
+def zeta_table():
+    """The per-process ZetaTable, built on first use."""
+    global _TABLE
+    if _TABLE is None:
+        _TABLE = ZetaTable()
+    return _TABLE
+
+
+# ═══════════════════════════════════════════════════════════
+# FAMILIES:  s(r, r_s, **params) → (s, ds/dr, d²s/dr²)
+# ═══════════════════════════════════════════════════════════
+
+def register_family(name, ranges, formula):
+    """ranges: {param: (low, high, log-spaced?)} — the search box."""
+    def _register(s_func):
+        FAMILIES[name] = Family(name, list(ranges), dict(ranges), s_func, formula)
+        return s_func
+    return _register
+
+
+def get_family(family):
+    if isinstance(family, Family):
+        return family
+    try:
+        return FAMILIES[family]
+    except KeyError:
+        raise KeyError(f"Unknown family {family!r}; registered: {', '.join(FAMILIES)}")
+
+
+@register_family("power", {"a": (1e-3, 1e3, True), "p": (0.05, 4.0, False)},
+                 "1 + a·x^p")
+def s_power(r, r_s, a, p):
+    x = r / r_s
+    return 1.0 + a * x**p, a * p * x**(p - 1) / r_s, a * p * (p - 1) * x**(p - 2) / r_s**2
+
+
+@register_family("power-mass", {"a": (1e-3, 1e3, True), "p": (0.05, 4.0, False), "q": (-1.0, 1.0, False)},
+                 "1 + a·x^p·(M/M_sun)^q")
+def s_power_mass(r, r_s, a, p, q):
+    m = (r_s * c**2 / (2 * G * M_sun))**q
+    return s_power(r, r_s, a * m, p)
+
+
+@register_family("log", {"a": (1e-2, 1e2, True), "b": (1e-3, 1e3, True)},
+                 "1 + a·ln(1 + b·x)")
+def s_log(r, r_s, a, b):
+    x = r / r_s
+    u = 1.0 + b * x
+    return 1.0 + a * np.log(u), a * b / (r_s * u), -a * b**2 / (r_s * u)**2
+
+
+@register_family("log2-shift", {"a": (1e-2, 1e2, True), "b": (1.0, 10.0, False)},
+                 "b + a·log₂(x)")
+def s_log2_shift(r, r_s, a, b):
+    ln2 = math.log(2.0)
+    return b + a * np.log2(r / r_s), a / (r * ln2), -a / (r**2 * ln2)
+
+
+@register_family("rational", {"a": (1e-3, 1e3, True), "b": (1e-3, 1e3, True)},
+                 "1 + a·x²/(x + b)")
+def s_rational(r, r_s, a, b):
+    x = r / r_s
+    u = x + b
+    return 1.0 + a * x**2 / u, a * x * (x + 2 * b) / (u**2 * r_s), 2 * a * b**2 / (u**3 * r_s**2)
+
+
+# ═══════════════════════════════════════════════════════════
+# SCORING
+# ═══════════════════════════════════════════════════════════
+
+def gr_gps_dilation():
+    """Schwarzschild clock-rate difference GPS orbit - Earth surface, μs/day."""
+    clock_m1 = [math.expm1(0.5 * math.log1p(-r_s_earth / r)) for r in (R_earth, R_gps)]
+    return (clock_m1[1] - clock_m1[0]) * US_PER_DAY
+
+
+def score(s_func, r, r_s, zeta_derivatives=None):
+    """
+    (n, 3) objectives [gps, grr, vac] for s_func(r, r_s) broadcasting to
+    (n, n_grid) over the grid arrays r, r_s of shape (1, n_grid).
+    """
+    zeta_derivatives = zeta_derivatives or zeta_table()
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        s_gps = s_func(np.array([[R_earth, R_gps]]), r_s_earth)[0]
+        zm1 = zeta_derivatives(s_gps, order=0, minus_one=True)[0]
+        clock_m1 = np.expm1(-0.5 * np.log1p(zm1))          # 1/√ζ - 1 without cancellation
+        gps = np.abs((clock_m1[:, 1] - clock_m1[:, 0]) * US_PER_DAY - gr_gps_dilation())
+
+        res = vacuum_residual(s_func, r, r_s, zeta_derivatives=zeta_derivatives)
+        zm1 = zeta_derivatives(res["s"], order=0, minus_one=True)[0]
+        grr = np.log(np.maximum(zm1, 1e-300) * (r / r_s - 1.0))    # Schwarzschild: ζ - 1 = r_s/(r - r_s)
+        out = np.stack([gps,
+                        np.sqrt(np.mean(grr**2, axis=-1)),
+                        np.sqrt(np.mean(res["rho"]**2, axis=-1))], axis=-1)
+        bad = ~(np.all(res["s"] > 1.0, axis=-1) & np.all(np.isfinite(out), axis=-1))
+    out[bad] = np.inf
+    return out
+
+
+def _score_chunk(family_name, params, n_r, n_m):
+    fam = get_family(family_name)
+    r, _, r_s = rM_grid(n_r, n_m)
+    r, r_s = r.reshape(1, -1), r_s.reshape(1, -1)
+    cols = {p: np.asarray(v, dtype=float)[:, None] for p, v in params.items()}
+    return score(lambda rr, rs: fam.s(rr, rs, **cols), r, r_s)
+
+
+def score_family(family, params, workers=None, chunk=CHUNK, n_r=GRID_NR, n_m=GRID_NM):
+    """Objectives (n, 3) for every parameter row of one family, chunked over a process pool."""
+    fam = get_family(family)
+    n = len(next(iter(params.values())))
+    pieces = [{p: params[p][i:i + chunk] for p in fam.params} for i in range(0, n, chunk)]
+    if workers == 1 or len(pieces) == 1:
+        parts = [_score_chunk(fam.name, piece, n_r, n_m) for piece in pieces]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_score_chunk, [fam.name] * len(pieces), pieces,
+                                  [n_r] * len(pieces), [n_m] * len(pieces)))
+    return np.concatenate(parts) if parts else np.empty((0, len(OBJECTIVES)))
+
+
+# ═══════════════════════════════════════════════════════════
+# PARETO SEARCH
+# ═══════════════════════════════════════════════════════════
+
+def pareto_front(obj):
+    """Boolean mask of the non-dominated rows of obj (every column minimized)."""
+    obj = np.asarray(obj, dtype=float)
+    front = np.all(np.isfinite(obj), axis=1)
+    for i in np.flatnonzero(front):
+        if front[i]:
+            dominated = np.all(obj >= obj[i], axis=1) & np.any(obj > obj[i], axis=1)
+            front &= ~dominated
+    return front
+
+
+def _from_unit(fam, u):
+    params = {}
+    for j, p in enumerate(fam.params):
+        lo, hi, log = fam.ranges[p]
+        params[p] = np.exp(np.log(lo) + u[:, j] * np.log(hi / lo)) if log else lo + u[:, j] * (hi - lo)
+    return params
+
+
+def search(families=None, n_per_family=1000, refine=2, n_jitter=8, workers=None, seed=0, verbose=False):
+    """
+    Pareto search over the given families (default: all). Returns
+    {"family", "<param>"…, "gps", "grr", "vac", "front"} as flat arrays —
+    parameters a family does not have are NaN.
+    """
+    families = [get_family(f) for f in (families or FAMILIES)]
+    rng = np.random.default_rng(seed)
+    units, objs = {}, {}
+    t0 = time.perf_counter()
+
+    for fam in families:
+        d = len(fam.params)
+        u = (np.argsort(rng.random((d, n_per_family)), axis=1).T + rng.random((n_per_family, d))) / n_per_family
+        units[fam.name] = u
+        objs[fam.name] = score_family(fam, _from_unit(fam, u), workers)
+        if verbose:
+            print(f"    {fam.name:<12s} {n_per_family} LHS candidates  ({time.perf_counter() - t0:.1f} s)")
+
+    for rnd in range(refine):
+        front = pareto_front(np.concatenate([objs[f.name] for f in families]))
+        offset = 0
+        radius = 0.05 / 2**rnd
+        for fam in families:
+            n = len(units[fam.name])
+            seeds = units[fam.name][front[offset:offset + n]]
+            offset += n
+            if not len(seeds):
+                continue
+            u = np.repeat(seeds, n_jitter, axis=0)
+            u = np.clip(u + radius * rng.standard_normal(u.shape), 0.0, 1.0)
+            units[fam.name] = np.concatenate([units[fam.name], u])
+            objs[fam.name] = np.concatenate([objs[fam.name], score_family(fam, _from_unit(fam, u), workers)])
+        if verbose:
+            print(f"    refine {rnd + 1}: {int(front.sum())} front members jittered ± {radius:g}"
+                  f"  ({time.perf_counter() - t0:.1f} s)")
+
+    names = sorted({p for fam in families for p in fam.params})
+    out = {"family": [], **{p: [] for p in names}, **{o: [] for o in OBJECTIVES}}
+    for fam in families:
+        n = len(units[fam.name])
+        params = _from_unit(fam, units[fam.name])
+        out["family"].append(np.full(n, fam.name))
+        for p in names:
+            out[p].append(params.get(p, np.full(n, np.nan)))
+        for j, o in enumerate(OBJECTIVES):
+            out[o].append(objs[fam.name][:, j])
+    out = {k: np.concatenate(v) for k, v in out.items()}
+    out["front"] = pareto_front(np.stack([out[o] for o in OBJECTIVES], axis=1))
+    return out
+
+
+def front_records(result):
+    """The Pareto front as a list of dicts, sorted by GPS mismatch (flat mappings last)."""
+    params = [k for k in result if k not in OBJECTIVES + ["family", "front"]]
+    rows = []
+    for i in np.flatnonzero(result["front"]):
+        fam = get_family(str(result["family"][i]))
+        rows.append({"family": fam.name, "formula": fam.formula,
+                     "params": {p: float(result[p][i]) for p in params if p in fam.params},
+                     **{o: float(result[o][i]) for o in OBJECTIVES}})
+    return sorted(rows, key=lambda row: row["gps"])
+
+
+# ═══════════════════════════════════════════════════════════
+# RUN
+# ═══════════════════════════════════════════════════════════
+
+if __name__ == "__main__":
+    n_per_family = int(sys.argv[sys.argv.index("--n") + 1]) if "--n" in sys.argv else 1000
+    refine = int(sys.argv[sys.argv.index("--refine") + 1]) if "--refine" in sys.argv else 2
+    workers = int(sys.argv[sys.argv.index("--workers") + 1]) if "--workers" in sys.argv else None
+
+    print()
+    print("=" * 100)
+    print("  MAPPING DISCOVERY — PARETO SEARCH OVER s(r, M) FAMILIES")
+    print(f"  Objectives: gps (μs/day vs GR {gr_gps_dilation():+.3f}), grr (RMS log g_rr mismatch),"
+          f" vac (RMS |Ric|·r³/r_s)")
+    print(f"  Scoring grid: {GRID_NR} radii r/r_s ∈ [{X_RANGE[0]:g}, {X_RANGE[1]:g}] × {GRID_NM} masses")
+    print("=" * 100)
+
+    r, _, r_s = rM_grid(GRID_NR, GRID_NM)
+    r, r_s = r.reshape(1, -1), r_s.reshape(1, -1)
+
+    # ─── TEST 1: CACHED ζ ─────────────────────────────────────
+    print()
+    print("─" * 100)
+    print("  TEST 1: ζ TABLE vs SERIES")
+    print("─" * 100)
+    print()
+    s = 1.0 + np.geomspace(1e-6, 80.0, 200001)
+    exact = zeta_derivatives_np(s, order=2, minus_one=True)
+    t0 = time.perf_counter()
+    cached = zeta_table()(s, order=2, minus_one=True)
+    t_table = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    zeta_derivatives_np(s, order=2, minus_one=True)
+    t_series = time.perf_counter() - t0
+    for k, label in enumerate(["ζ - 1", "ζ′", "ζ″"]):
+        print(f"  {label:<6s} max rel err {np.max(np.abs(cached[k] / exact[k] - 1.0)):.2e}")
+    print(f"  {len(s):,} points: table {t_table * 1e3:.1f} ms, series {t_series * 1e3:.1f} ms")
+
+    # ─── TEST 2: REFERENCE MAPPINGS ───────────────────────────
+    print()
+    print("─" * 100)
+    print("  TEST 2: EXISTING MAPPINGS, EXACT ζ")
+    print("─" * 100)
+    print()
+    print(f"  {'Mapping':<18s} {'gps (μs/day)':<16s} {'grr':<14s} {'vac':<14s}")
+    print(f"  {'─'*18} {'─'*16} {'─'*14} {'─'*14}")
+    for m in MAPPINGS.values():
+        o = score(m.s, r, r_s, zeta_derivatives=zeta_derivatives_np)[0]
+        print(f"  {m.name:<18s} {o[0]:<16.6g} {o[1]:<14.6g} {o[2]:<14.6g}")
+
+    # ─── TEST 3: SEARCH ───────────────────────────────────────
+    print()
+    print("─" * 100)
+    print(f"  TEST 3: SEARCH — {n_per_family} LHS CANDIDATES PER FAMILY, {refine} REFINEMENT ROUNDS")
+    print("─" * 100)
+    print()
+    t0 = time.perf_counter()
+    result = search(n_per_family=n_per_family, refine=refine, workers=workers, verbose=True)
+    dt = time.perf_counter() - t0
+    n = len(result["family"])
+    print()
+    print(f"  {n:,} candidates in {dt:.1f} s ({dt / n * 1e3:.2f} ms each), "
+          f"{int(result['front'].sum())} on the Pareto front")
+    print()
+    rows = front_records(result)
+    print(f"  {'Family':<12s} {'Formula':<24s} {'Parameters':<34s} {'gps':<12s} {'grr':<12s} {'vac':<12s}")
+    print(f"  {'─'*12} {'─'*24} {'─'*34} {'─'*12} {'─'*12} {'─'*12}")
+    for row in rows[:20]:
+        ps = ", ".join(f"{k}={v:.4g}" for k, v in row["params"].items())
+        print(f"  {row['family']:<12s} {row['formula']:<24s} {ps:<34s} "
+              f"{row['gps']:<12.4g} {row['grr']:<12.4g} {row['vac']:<12.4g}")
+    if len(rows) > 20:
+        print(f"  … {len(rows) - 20} more")
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    np.savez(os.path.join(OUTPUT_DIR, "mapping_search.npz"), **result)
+    with open(os.path.join(OUTPUT_DIR, "mapping_front.json"), "w") as fh:
+        json.dump(rows, fh, indent=2)
+    print()
+    print(f"  → {OUTPUT_DIR}/mapping_search.npz, mapping_front.json")
+    print()
+    print("  → No closed-form family reaches the ζ-inversion mapping on all three objectives:")
+    print("    the front trades GPS and g_rr agreement against the vacuum residual, and its")
+    print("    vac → 0 end is flat space (s ≫ 1, no dilation at all).")
+    print()
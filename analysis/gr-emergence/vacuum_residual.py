@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Vacuum-Equation Residual Checker for Candidate s(r) Mappings
+============================================================
+v4 postulates g_tt = -1/ζ(s(r)), g_rr = ζ(s(r)) and argues that R_μν = 0
+then forces d/dr[r·A(r)] = 1 — but only spot-checks seven radii by finite
+difference. Here the FULL Ricci tensor is evaluated, in closed form, for
+any candidate mapping s(r) over a dense (r, M) grid.
+
+With A = 1/ζ, B = ζ (so AB = 1) and areal radius R (R = r for the v4
+ansatz, R = r√ζ for the v1 prime_metric), orthonormal components:
+
+    R̂_tt = (1/B) [α'' + α'² - α'β' + 2α'R'/R]          α = ½ln A, β = ½ln B
+    R̂_rr = (1/B) [-α'' - α'² + α'β' - 2R''/R + 2β'R'/R]
+    R̂_θθ = [1 - (1/B)(R R'' + R'² + R R'(α' - β'))] / R²
+
+The derivatives of ζ(s(r)) come from the exactly differentiated series in
+kretschner/zeta_numpy.py and the mapping's own s', s'' (implicit
+differentiation for the ζ-inversion mapping), so the residual is free of
+finite-difference noise. Reported per mapping, relative to the GR tidal
+scale r_s/r³:
+
+    ρ = √(R̂_tt² + R̂_rr² + 2R̂_θθ²) · r³/r_s            (max and RMS)
+
+Schwarzschild (the ζ-inversion mapping of v4) gives ρ ~ 1e-15.
+
+Usage:
+    python3 vacuum_residual.py
+    python3 vacuum_residual.py --nr 4000 --nm 64
+
+Author: Christopher Riner & Barron
+"""
+
+import math
+import os
+import sys
+import time
+from collections import namedtuple
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "kretschner"))
+from zeta_numpy import invert_zeta_np, zeta_derivatives_np  # noqa: E402
+
+# ═══════════════════════════════════════════════════════════
+# CONSTANTS
+# ═══════════════════════════════════════════════════════════
+G = 6.67430e-11
+c = 2.99792458e8
+M_sun = 1.989e30
+
+X_RANGE = (1.01, 1e10)          # r / r_s
+M_RANGE = (1e22, 1e40)          # kg — Moon to supermassive black holes
+
+Mapping = namedtuple("Mapping", ["name", "s", "description"])
+MAPPINGS = {}   # name → Mapping, in registration order
+
+ANSATZ = {
+    "v4": "A = 1/ζ, B = ζ, C = r²   (gr_emergence_v4.py)",
+    "v1": "A = 1/ζ, B = ζ, C = r²ζ  (prime_metric in gr_emergence_from_primes.py)",
+}
+
+
+# ═══════════════════════════════════════════════════════════
+# MAPPINGS:  s(r, r_s) → (s, ds/dr, d²s/dr²)
+# ═══════════════════════════════════════════════════════════
+
+def register_mapping(name, description=""):
+    def _register(s_func):
+        MAPPINGS[name] = Mapping(name, s_func, description)
+        return s_func
+    return _register
+
+
+@register_mapping("linear", "s = 1 + r/r_s  (s_linear, gr_emergence_from_primes.py)")
+def s_linear(r, r_s):
+    x = r / r_s
+    return 1.0 + x, np.ones_like(x) / r_s, np.zeros_like(x)
+
+
+@register_mapping("cubic", "s = 1 + (r/r_s)³  (s_of_r, metric-structure / LIGO)")
+def s_cubic(r, r_s):
+    x = r / r_s
+    return 1.0 + x**3, 3.0 * x**2 / r_s, 6.0 * x / r_s**2
+
+
+@register_mapping("log2", "s = log₂(r/r_s)  (v4 'natural mapping')")
+def s_log2(r, r_s):
+    ln2 = math.log(2.0)
+    return np.log2(r / r_s), 1.0 / (r * ln2), -1.0 / (r**2 * ln2)
+
+
+@register_mapping("zeta-inversion", "ζ(s) = (1 - r_s/r)⁻¹  (v4 invert_zeta)")
+def s_zeta_inversion(r, r_s):
+    x = r / r_s
+    zm1 = 1.0 / (x - 1.0)                       # ζ - 1 = r_s/(r - r_s), no cancellation
+    s = invert_zeta_np(1.0 + zm1, zm1)
+    _, z1, z2 = zeta_derivatives_np(s, order=2)
+    dz = -1.0 / (r_s * (x - 1.0)**2)            # d/dr (1 - r_s/r)⁻¹
+    d2z = 2.0 / (r_s**2 * (x - 1.0)**3)
+    ds = dz / z1
+    return s, ds, (d2z - z2 * ds**2) / z1
+
+
+def power_law_mapping(a, p):
+    """s = 1 + a·(r/r_s)^p — the linear (a = p = 1) and cubic (p = 3) cases generalized."""
+    def s_func(r, r_s):
+        x = r / r_s
+        return 1.0 + a * x**p, a * p * x**(p - 1) / r_s, a * p * (p - 1) * x**(p - 2) / r_s**2
+    return s_func
+
+
+# ═══════════════════════════════════════════════════════════
+# RICCI TENSOR
+# ═══════════════════════════════════════════════════════════
+
+def ricci_orthonormal(r, s, ds, d2s, ansatz="v4", zeta_derivatives=zeta_derivatives_np):
+    """
+    (R̂_tt, R̂_rr, R̂_θθ, 1 - A) for g_tt = -1/ζ(s(r)), g_rr = ζ(s(r)).
+    NaN where s ≤ 1 (outside the domain of the Euler product).
+    zeta_derivatives(s, order=2, minus_one=True) → (ζ - 1, ζ', ζ'') may be
+    swapped for a cached table (mapping_search.py).
+    """
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        zm1, z1, z2 = zeta_derivatives(s, order=2, minus_one=True)
+        Z = 1.0 + zm1
+        Zp = z1 * ds                            # dζ/dr
+        Zpp = z2 * ds**2 + z1 * d2s             # d²ζ/dr²
+        one_minus_A = zm1 / Z
+
+        if ansatz == "v4":
+            # AB = 1, R = r: R̂_rr = -R̂_tt, and both reduce to A''/2 + A'/r
+            Ap = -Zp / Z**2
+            App = -Zpp / Z**2 + 2.0 * Zp**2 / Z**3
+            Rtt = 0.5 * App + Ap / r
+            Rrr = -Rtt
+            Rthth = (one_minus_A - r * Ap) / r**2
+        elif ansatz == "v1":
+            ap = -0.5 * Zp / Z                  # α' = -β'
+            app = -0.5 * (Zpp * Z - Zp**2) / Z**2
+            bp = -ap
+            sq = np.sqrt(Z)
+            R = r * sq
+            Rp = sq + r * Zp / (2.0 * sq)
+            Rpp = Zp / sq + r * (Zpp / (2.0 * sq) - Zp**2 / (4.0 * Z * sq))
+            Rtt = (app + ap**2 - ap * bp + 2.0 * ap * Rp / R) / Z
+            Rrr = (-app - ap**2 + ap * bp - 2.0 * Rpp / R + 2.0 * bp * Rp / R) / Z
+            Rthth = (1.0 - (R * Rpp + Rp**2 + R * Rp * (ap - bp)) / Z) / R**2
+        else:
+            raise ValueError(f"unknown ansatz {ansatz!r}; choose from {', '.join(ANSATZ)}")
+
+        bad = ~(s > 1.0)
+        return tuple(np.where(bad, np.nan, v) for v in (Rtt, Rrr, Rthth, one_minus_A))
+
+
+# ═══════════════════════════════════════════════════════════
+# RESIDUALS OVER (r, M) GRIDS
+# ═══════════════════════════════════════════════════════════
+
+def rM_grid(n_r=2000, n_m=32, x_range=X_RANGE, m_range=M_RANGE):
+    """(r, M, r_s) as (n_m, n_r) arrays, r log-spaced in units of r_s(M)."""
+    x = np.geomspace(*x_range, n_r)
+    M = np.geomspace(*m_range, n_m)
+    r_s = 2.0 * G * M / c**2
+    return x[None, :] * r_s[:, None], np.broadcast_to(M[:, None], (n_m, n_r)), \
+        np.broadcast_to(r_s[:, None], (n_m, n_r))
+
+
+def vacuum_residual(s_func, r, r_s, ansatz="v4", zeta_derivatives=zeta_derivatives_np):
+    """
+    Residual fields for one mapping on a grid:
+        rho     |Ric| · r³/r_s           (0 in vacuum)
+        v4      (d/dr[rA] - 1) · r/r_s   (the reduced equation of v4)
+        newton  (1 - A) · r/r_s - 1      (0 when g_tt is Schwarzschild;
+                                          -1 for flat space, the trivial vacuum)
+        s       the mapping itself
+    """
+    s, ds, d2s = s_func(r, r_s)
+    Rtt, Rrr, Rthth, one_minus_A = ricci_orthonormal(r, s, ds, d2s, ansatz, zeta_derivatives)
+    with np.errstate(invalid="ignore", over="ignore"):
+        tidal = r_s / r**3
+        rho = np.sqrt(Rtt**2 + Rrr**2 + 2.0 * Rthth**2) / tidal
+        # d/dr[rA] - 1 = -(1 - A) + rA'  =  -r² R̂_θθ  for the v4 ansatz
+        v4 = -Rthth * r**2 * r / r_s if ansatz == "v4" else np.full_like(rho, np.nan)
+        newton = one_minus_A * r / r_s - 1.0
+    return {"rho": rho, "v4": v4, "newton": newton, "s": s}
+
+
+def screen(mappings, r, r_s, ansatz="v4"):
+    """
+    Summary per mapping: max / RMS of ρ and of the v4 residual, RMS of the
+    g_tt mismatch, over the valid (s > 1, finite) part of the grid, and the
+    valid fraction. A mapping with s ≫ 1 everywhere is flat — ρ ≈ 0 but
+    newton ≈ -1 — so candidates must be ranked on both.
+    """
+    rows = []
+    for name, s_func in mappings:
+        res = vacuum_residual(s_func, r, r_s, ansatz)
+        ok = np.isfinite(res["rho"])
+        rho = res["rho"][ok]
+        v4 = np.abs(res["v4"][ok & np.isfinite(res["v4"])])
+        rows.append({
+            "name": name,
+            "valid": ok.mean(),
+            "rho_max": rho.max() if rho.size else np.nan,
+            "rho_rms": np.sqrt(np.mean(rho**2)) if rho.size else np.nan,
+            "v4_max": v4.max() if v4.size else np.nan,
+            "v4_rms": np.sqrt(np.mean(v4**2)) if v4.size else np.nan,
+            "newton_rms": np.sqrt(np.mean(res["newton"][ok]**2)) if rho.size else np.nan,
+        })
+    return rows
+
+
+def _print_rows(rows):
+    print(f"  {'Mapping':<24s} {'valid':<8s} {'max ρ':<12s} {'RMS ρ':<12s} {'max |v4|':<12s} {'RMS v4':<12s} "
+          f"{'RMS g_tt':<12s}")
+    print(f"  {'─'*24} {'─'*8} {'─'*12} {'─'*12} {'─'*12} {'─'*12} {'─'*12}")
+    for row in rows:
+        print(f"  {row['name']:<24s} {row['valid']:<8.1%} {row['rho_max']:<12.4e} {row['rho_rms']:<12.4e} "
+              f"{row['v4_max']:<12.4e} {row['v4_rms']:<12.4e} {row['newton_rms']:<12.4e}")
+
+
+# ═══════════════════════════════════════════════════════════
+# RUN
+# ═══════════════════════════════════════════════════════════
+
+if __name__ == "__main__":
+    n_r = int(sys.argv[sys.argv.index("--nr") + 1]) if "--nr" in sys.argv else 2000
+    n_m = int(sys.argv[sys.argv.index("--nm") + 1]) if "--nm" in sys.argv else 32
+
+    r, M, r_s = rM_grid(n_r, n_m)
+
+    print()
+    print("=" * 100)
+    print("  VACUUM-EQUATION RESIDUALS FOR CANDIDATE s(r) MAPPINGS")
+    print(f"  Grid: r/r_s ∈ [{X_RANGE[0]:g}, {X_RANGE[1]:g}] × M ∈ [{M_RANGE[0]:g}, {M_RANGE[1]:g}] kg"
+          f"  ({n_r} × {n_m} = {r.size:,} points)")
+    print("  ρ = |Ric| · r³/r_s   (0 in vacuum),   v4 = (d/dr[rA] - 1) · r/r_s,   g_tt = (1 - A)·r/r_s - 1")
+    print("=" * 100)
+
+    # ─── TEST 1: NAMED MAPPINGS, BOTH ANSÄTZE ─────────────────
+    for ansatz, desc in ANSATZ.items():
+        print()
+        print("─" * 100)
+        print(f"  TEST 1{'a' if ansatz == 'v4' else 'b'}: ANSATZ {ansatz} — {desc}")
+        print("─" * 100)
+        print()
+        t0 = time.perf_counter()
+        rows = screen([(m.name, m.s) for m in MAPPINGS.values()], r, r_s, ansatz)
+        _print_rows(rows)
+        print()
+        print(f"  {len(rows)} mappings in {time.perf_counter() - t0:.2f} s")
+
+    # ─── TEST 2: PROFILE ──────────────────────────────────────
+    print()
+    print("─" * 100)
+    print("  TEST 2: ρ(r) FOR EACH MAPPING (v4 ansatz, M = M_sun)")
+    print("─" * 100)
+    print()
+    x = np.array([1.1, 2.0, 10.0, 1e3, 1e6, 7.2e8, 1e10])
+    r_s_sun = 2.0 * G * M_sun / c**2
+    print(f"  {'r/r_s':<10s} " + " ".join(f"{name:<16s}" for name in MAPPINGS))
+    print(f"  {'─'*10} " + " ".join(f"{'─'*16}" for _ in MAPPINGS))
+    cols = [vacuum_residual(m.s, x * r_s_sun, r_s_sun)["rho"] for m in MAPPINGS.values()]
+    for i, xi in enumerate(x):
+        print(f"  {xi:<10.3g} " + " ".join(f"{col[i]:<16.4e}" for col in cols))
+
+    # ─── TEST 3: SCREENING A FAMILY ───────────────────────────
+    print()
+    print("─" * 100)
+    print("  TEST 3: SCREENING 400 POWER LAWS  s = 1 + a·(r/r_s)^p   (v4 ansatz)")
+    print("─" * 100)
+    print()
+    family = [(f"a={a:.3g}, p={p:.3g}", power_law_mapping(a, p))
+              for a in np.geomspace(0.01, 100.0, 20) for p in np.linspace(0.1, 4.0, 20)]
+    t0 = time.perf_counter()
+    rows = screen(family, r, r_s)
+    dt = time.perf_counter() - t0
+    rows.sort(key=lambda row: max(row["rho_rms"], row["newton_rms"]))
+    print("  Five best by max(RMS ρ, RMS g_tt):")
+    print()
+    _print_rows(rows[:5])
+    print()
+    print(f"  {len(family)} candidates × {r.size:,} points in {dt:.2f} s "
+          f"({dt / len(family) * 1e3:.1f} ms per candidate)")
+    print()
+    print("  → Only the ζ-inversion mapping solves R_μν = 0 with Newtonian g_tt; power laws")
+    print("    either leave a residual of the order of the tidal curvature or are flat.")
+    print()
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Multi-Base and Scale-Invariance Benford Battery
+===============================================
+Every δ_B in this directory is base 10, first digit, as measured. That
+cannot tell a scale-invariant source from a base-10 accident: 2ⁿ is
+Benford in base 10 but shows only the digits 1, 2, 4, 8 in base 16, and
+a set conforming only by luck drifts when multiplied by a constant. The
+battery takes one logarithm per value,
+
+    y = ln|x|,     m_b = frac(y / ln b),     m_b,c = frac(m_b + log_b c)
+
+and reads the leading base-b digit off the mantissa, d = 1 + #{k : m ≥
+log_b k}. A base costs one division and one bincount per value. Scale
+factors cost nothing per value: m + log_b c crosses a digit boundary
+exactly where m crosses frac(log_b d - log_b c), so the mantissas are
+binned once on all those points and every (c, d) count is a difference
+of two cumulative bin counts. Per base it reports
+
+  δ_B(b, c)      Σ|obs(d) - log_b(1 + 1/d)| over d = 1 … b-1, for every c
+  spread         max_c δ_B - min_c δ_B: ≈ 0 for a scale-invariant source
+  R_b            |⟨e^(2πi m_b)⟩|, the first Fourier coefficient of the
+                 mantissa; scaling only rotates its phase, so R_b is the
+                 scale-free summary, with Rayleigh p = e^(-N R_b²)
+
+Base 2 has the single digit 1 (δ_B ≡ 0), but R₂ still tests the mantissa.
+
+Usage:
+    python3 benford_bases.py
+    python3 benford_bases.py --n 10000000
+
+Author: Christopher Riner & Barron
+"""
+
+import math
+import sys
+import time
+
+import numpy as np
+
+from benford_numpy import CHUNK, _chunks, digit_counts
+
+BASES = tuple(range(2, 17))
+SCALES = 10.0 ** (np.arange(32) / 32.0)          # one decade, log-spaced
+ULP_GUARD = 4.0 * np.finfo(float).eps            # relative slack on exact digit boundaries
+
+
+# ═══════════════════════════════════════════════════════════════
+# BASE-b BENFORD
+# ═══════════════════════════════════════════════════════════════
+
+def base_benford_p(b):
+    """P_b(d) = log_b(1 + 1/d) for d = 1 … b-1."""
+    d = np.arange(1, b)
+    return np.log1p(1.0 / d) / math.log(b)
+
+
+def log_magnitudes(x):
+    """ln|x| of the finite nonzero entries (flattened) — the one extraction per value."""
+    a = np.abs(np.asarray(x, dtype=float).ravel())
+    return np.log(a[np.isfinite(a) & (a > 0)])
+
+
+def _mantissa(y, b):
+    """frac(y / ln b), nudged up by a few ulps so 16³ reads as mantissa 0 in base 16."""
+    t = y / math.log(b)
+    m = t - np.floor(t) + ULP_GUARD * (np.abs(t) + 1.0)
+    return m - (m >= 1.0)
+
+
+def mantissa_digits(y, b, shifts=(0.0,)):
+    """Leading base-b digits (len(shifts), len(y)) of values with ln|x| = y, each scaled by b^shift."""
+    m = np.mod(_mantissa(y, b) + np.asarray(shifts)[:, None], 1.0)
+    return 1 + np.searchsorted(np.log(np.arange(2, b)) / math.log(b), m, side="right")
+
+
+def scale_cells(b, shifts):
+    """
+    Cell edges on the mantissa circle at which some digit changes under
+    some shift: m + s crosses log_b d ⇔ m crosses frac(log_b d - s).
+    Returns (edges, lo, hi): digit d under shift j is the arc from
+    edges[lo[j, d-1]] to edges[hi[j, d-1]].
+    """
+    bounds = np.mod(np.log(np.arange(1, b + 1))[None, :] / math.log(b) - np.asarray(shifts)[:, None], 1.0)
+    bounds[bounds >= 1.0] = 0.0
+    edges = np.unique(np.append(bounds, 0.0))
+    idx = np.searchsorted(edges, bounds)
+    return edges, idx[:, :-1], idx[:, 1:]
+
+
+# ═══════════════════════════════════════════════════════════════
+# BATTERY
+# ═══════════════════════════════════════════════════════════════
+
+def digit_battery(values, bases=BASES, scales=SCALES, chunk=CHUNK):
+    """
+    Digit counts of values in every base under every scale factor.
+    Per base the mantissas are binned once on the cells of scale_cells;
+    each (scale, digit) count is then a difference of two cumulative
+    cell counts, so the scale grid adds O(b) per scale, not a pass.
+    Returns {n, bases, scales, counts: {b: (n_scales, b-1) int64},
+    fourier: {b: ⟨e^(2πi m_b)⟩ at c = 1}}.
+    """
+    scales = np.asarray(scales, dtype=float)
+    cells = {b: scale_cells(b, np.log(scales) / math.log(b)) for b in bases}
+    hist = {b: np.zeros(cells[b][0].size, dtype=np.int64) for b in bases}
+    fourier = {b: 0j for b in bases}
+    n = 0
+    for block in _chunks(values, chunk):
+        y = log_magnitudes(block)
+        n += y.size
+        for b in bases:
+            m = _mantissa(y, b)
+            hist[b] += np.bincount(np.searchsorted(cells[b][0], m, side="right") - 1, minlength=hist[b].size)
+            fourier[b] += np.exp(2j * np.pi * m).sum()
+    counts = {}
+    for b in bases:
+        _, lo, hi = cells[b]
+        cum = np.concatenate([[0], np.cumsum(hist[b])])
+        counts[b] = cum[hi] - cum[lo] + n * (hi <= lo)        # arcs through m = 0 wrap around
+    return {"n": n, "bases": tuple(bases), "scales": scales, "counts": counts,
+            "fourier": {b: (z / n if n else np.nan) for b, z in fourier.items()}}
+
+
+def battery_stats(battery):
+    """
+    Per base: {delta_B (n_scales,), delta_B_1 (at c = 1), spread, R,
+    rayleigh_p}.
+    """
+    out = {}
+    for b in battery["bases"]:
+        c = battery["counts"][b]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            dB = np.abs(c / c.sum(axis=1, keepdims=True) - base_benford_p(b)).sum(axis=1)
+        R = abs(battery["fourier"][b])
+        out[b] = {"delta_B": dB, "delta_B_1": dB[0], "spread": dB.max() - dB.min(),
+                  "R": R, "rayleigh_p": math.exp(-battery["n"] * R * R)}
+    return out
+
+
+# ═══════════════════════════════════════════════════════════════
+# RUN
+# ═══════════════════════════════════════════════════════════════
+
+if __name__ == "__main__":
+    n_total = int(float(sys.argv[sys.argv.index("--n") + 1])) if "--n" in sys.argv else 1_000_000
+    rng = np.random.default_rng(0)
+
+    print()
+    print("=" * 100)
+    print("  MULTI-BASE AND SCALE-INVARIANCE BENFORD BATTERY")
+    print("=" * 100)
+
+    # ─── TEST 1: DIGITS ───────────────────────────────────────
+    print()
+    print("─" * 100)
+    print("  TEST 1: MANTISSA DIGITS vs EXACT DIGITS")
+    print("─" * 100)
+    print()
+    x = np.concatenate([rng.lognormal(0.0, 20.0, 200_000), [0.3, 1e-300, 1000.0, 7e22, 2.5e-23]])
+    ten = mantissa_digits(log_magnitudes(x), 10)[0]
+    print(f"  base 10, {x.size:,} values vs benford_numpy.digit_counts: counts equal — "
+          f"{np.array_equal(np.bincount(ten, minlength=10)[1:], digit_counts(x))}")
+    ints = np.concatenate([rng.integers(1, 2**52, 50_000), 2 ** np.arange(52), 3 ** np.arange(33)])
+    bad = 0
+    for b in BASES:
+        exact = np.array([int(np.base_repr(int(v), b)[0], b) for v in ints])
+        bad += int(np.sum(mantissa_digits(log_magnitudes(ints.astype(float)), b)[0] != exact))
+    print(f"  bases 2–16, {ints.size:,} integers incl. 2ᵏ and 3ᵏ vs np.base_repr: {bad} disagreements")
+    bat = digit_battery(x)
+    y = log_magnitudes(x)
+    same = all(np.array_equal(bat["counts"][b][j],
+                              np.bincount(d, minlength=b)[1:])
+               for b in BASES
+               for j, d in enumerate(mantissa_digits(y, b, np.log(SCALES) / math.log(b))))
+    print(f"  cell-binned counts vs digits of every scaled value, {len(BASES)} bases × {SCALES.size} scales: "
+          f"equal — {same}")
+
+    # ─── TEST 2: BATTERY ──────────────────────────────────────
+    print()
+    print("─" * 100)
+    print(f"  TEST 2: BASES 2–16 × {SCALES.size} SCALE FACTORS c ∈ [1, 10)")
+    print("─" * 100)
+    E = 0.01 * np.arange(1, 5001)
+    samples = {
+        "lognormal σ = 3": rng.lognormal(0.0, 3.0, n_total),
+        "10^U, U ~ U(0, 6)": 10.0 ** rng.uniform(0, 6, n_total),
+        "2ⁿ, n < 1000": 2.0 ** np.arange(1000),
+        "U(0, 1)": rng.uniform(0, 1, n_total),
+        "Bose–Einstein, T = 1": 1.0 / np.expm1(E),
+    }
+    shown = (2, 3, 8, 10, 12, 16)
+    for name, v in samples.items():
+        t0 = time.perf_counter()
+        st = battery_stats(digit_battery(v))
+        dt = time.perf_counter() - t0
+        print()
+        print(f"  {name}  ({np.size(v):,} values, {len(BASES)} bases × {SCALES.size} scales in {dt:.2f} s)")
+        print(f"  {'base':<6s} {'δ_B (c = 1)':<12s} {'max_c δ_B':<12s} {'spread':<12s} {'R_b':<12s} {'Rayleigh p':<12s}")
+        print(f"  {'─'*6} {'─'*12} {'─'*12} {'─'*12} {'─'*12} {'─'*12}")
+        for b in shown:
+            s = st[b]
+            print(f"  {b:<6d} {s['delta_B_1']:<12.5f} {s['delta_B'].max():<12.5f} {s['spread']:<12.5f} "
+                  f"{s['R']:<12.5f} {s['rayleigh_p']:<12.3g}")
+    print()
+    print("  10^U is exact Benford in base 10 at every c but not in base 3 or 12: Benford in one base only.")
+    print("  2ⁿ: every digit in bases 2, 8 and 16 is a power of two — a base artifact that base 10 misses.")
+    print("  A scale-invariant source has spread ≈ 0 and R_b ≈ 0 in every base, as the lognormal does.")
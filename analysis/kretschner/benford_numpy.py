@@ -0,0 +1,456 @@
+#!/usr/bin/env python3
+"""
+Vectorized Benford Analysis on NumPy Arrays and Chunked Streams
+===============================================================
+double_slit_test.py finds each leading digit with while loops dividing
+by 10, and compute_delta_B rebuilds lists and dicts on every call. Here
+the digits of a whole array come from one exponent
+
+    e = ⌊log₁₀|x|⌋,   d = ⌊|x| · 10⁻ᵉ⌋            (mantissa m = log₁₀|x| - e)
+
+and are histogrammed with np.bincount; zeros and non-finite values are
+skipped. Everything downstream works on the nine counts:
+
+  leading_digits(x)          first significant digit, int8 array
+  digit_counts(x)            counts of d = 1…9
+  prefix_counts(digits, p)   counts among the first p digits, so any
+                             window's counts are a difference of two rows
+  benford_stats(counts)      δ_B, ε(d), χ² (+ p-value, 8 dof), MAD, KS
+  benford_analysis(values)   the same over an array or an iterable of
+                             chunks, never holding more than one chunk
+  BenfordAccumulator         first, second and first-two digit counts and
+                             log-mantissa sums of an unbounded stream;
+                             merges exactly across threads and processes
+
+δ_B = Σ|obs(d) - P(d)| exactly as compute_delta_B defines it, so the
+double-slit and Kretschner numbers are reproduced.
+
+Author: Christopher Riner & Barron
+"""
+
+import math
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+
+import numpy as np
+
+# ═══════════════════════════════════════════════════════════════
+# CONSTANTS
+# ═══════════════════════════════════════════════════════════════
+DIGITS = np.arange(1, 10)
+BENFORD_P = np.log10(1.0 + 1.0 / DIGITS)            # P(d) = log₁₀(1 + 1/d)
+BENFORD_CDF = np.cumsum(BENFORD_P)
+CHUNK = 1 << 22                                      # values per chunk: 32 MB of float64
+EXACT_POW = 22                                       # 10ᵏ is exact in float64 for |k| ≤ 22
+POW10 = 10.0 ** np.arange(-EXACT_POW, EXACT_POW + 1, dtype=float)
+
+
+# ═══════════════════════════════════════════════════════════════
+# DIGIT EXTRACTION
+# ═══════════════════════════════════════════════════════════════
+
+def significand(x):
+    """
+    |x| · 10⁻ᵉ ∈ [1, 10) for the finite nonzero entries of x (flattened;
+    the rest dropped). Where |e| ≤ 22 it divides by the exact power 10ᵉ
+    (e > 0) or multiplies by the exact 10⁻ᵉ (e < 0) — 10⁻ᵉ itself is not
+    exact for e > 0, and 1e5 · 1e-5 = 0.9999999999999999 — so round
+    numbers keep their digit and 0.3 gives 3.0000000000000004 as the
+    legacy loop does, not the 2.9999999999999996 of 10^(log₁₀ 0.3 + 1).
+    """
+    return _scaled(x, 1)
+
+
+def _scaled(x, n_digits):
+    """|x| · 10^(n_digits - 1 - e) ∈ [10^(n_digits-1), 10^n_digits), exact-power scaling as in significand."""
+    a = np.abs(np.asarray(x, dtype=float).ravel())
+    a = a[np.isfinite(a) & (a > 0)]
+    lg = np.log10(a)
+    e = np.floor(lg) - (n_digits - 1)
+    p = POW10[EXACT_POW + np.minimum(np.abs(e), EXACT_POW).astype(np.intp)]
+    with np.errstate(over="ignore"):
+        sig = a * p                                          # overwritten where e > 0
+    np.divide(a, p, out=sig, where=e > 0)
+    far = np.abs(e) > EXACT_POW
+    if far.any():
+        sig[far] = 10.0 ** (lg[far] - e[far])
+    # log10 can land one ulp on the wrong side of an integer exponent
+    lo, hi = 10.0 ** (n_digits - 1), 10.0 ** n_digits
+    sig = np.where(sig >= hi, sig / 10.0, sig)
+    return np.where(sig < lo, sig * 10.0, sig)
+
+
+def log_mantissa(x):
+    """m = frac(log₁₀|x|) ∈ [0, 1) for the finite nonzero entries of x."""
+    a = np.abs(np.asarray(x, dtype=float).ravel())
+    lg = np.log10(a[np.isfinite(a) & (a > 0)])
+    return lg - np.floor(lg)
+
+
+def leading_digits(x):
+    """First significant digit (1…9) of every finite nonzero entry, int8."""
+    return np.clip(significand(x).astype(np.int8), 1, 9)
+
+
+def digit_counts(x):
+    """int64 counts of leading digits 1…9."""
+    return np.bincount(leading_digits(x), minlength=10)[1:].astype(np.int64)
+
+
+def digits_in_place(x):
+    """Leading digit of every entry of x (flattened), 0 for zeros and non-finite values."""
+    a = np.asarray(x, dtype=float).ravel()
+    out = np.zeros(a.size, dtype=np.int8)
+    valid = np.isfinite(a) & (a != 0)
+    out[valid] = leading_digits(a[valid])
+    return out
+
+
+def prefix_counts(digits, positions, chunk=CHUNK >> 2):
+    """
+    Counts of digits 1…9 among digits[:p] for every p in the sorted
+    `positions` → (len(positions), 9) int64. The counts of any slice
+    digits[i:j] are then prefix[j] - prefix[i], O(9) whatever its length.
+    One pass over the digits, `chunk` at a time (a (chunk, 9) int64
+    cumulative block, 72 MB at the default).
+    """
+    digits = np.asarray(digits, dtype=np.int8)
+    positions = np.asarray(positions, dtype=np.int64)
+    out = np.empty((positions.size, 9), dtype=np.int64)
+    carry = np.zeros(9, dtype=np.int64)
+    k = np.searchsorted(positions, 0, side="right")
+    out[:k] = 0
+    for lo in range(0, digits.size, chunk):
+        block = digits[lo:lo + chunk]
+        cum = np.cumsum(block[:, None] == DIGITS, axis=0, dtype=np.int64)
+        hi = np.searchsorted(positions, lo + block.size, side="right")
+        out[k:hi] = carry + cum[positions[k:hi] - lo - 1]
+        carry += cum[-1]
+        k = hi
+    return out
+
+
+# ═══════════════════════════════════════════════════════════════
+# STATISTICS FROM COUNTS
+# ═══════════════════════════════════════════════════════════════
+
+def chi2_sf_8(x):
+    """P(χ²₈ > x), closed form for 8 degrees of freedom: e^(-x/2) Σ_{k<4} (x/2)ᵏ/k!."""
+    h = 0.5 * np.asarray(x, dtype=float)
+    return np.exp(-h) * (1.0 + h + h**2 / 2.0 + h**3 / 6.0)
+
+
+def benford_stats(counts):
+    """
+    Conformance statistics of leading-digit counts (..., 9) — batched over
+    leading axes. Keys: n, freq, epsilon (obs - P per digit), delta_B,
+    chi2, p_chi2, mad, ks. NaN where n = 0.
+    """
+    counts = np.asarray(counts)
+    n = counts.sum(axis=-1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        freq = counts / n[..., None]
+        eps = freq - BENFORD_P
+        chi2 = n * np.sum(eps**2 / BENFORD_P, axis=-1)
+        return {
+            "n": n,
+            "freq": freq,
+            "epsilon": eps,
+            "delta_B": np.abs(eps).sum(axis=-1),
+            "chi2": chi2,
+            "p_chi2": chi2_sf_8(chi2),
+            "mad": np.abs(eps).mean(axis=-1),
+            "ks": np.abs(np.cumsum(freq, axis=-1) - BENFORD_CDF).max(axis=-1),
+        }
+
+
+def _chunks(values, chunk):
+    if isinstance(values, np.ndarray) or np.isscalar(values):
+        flat = np.asarray(values).ravel()
+        for lo in range(0, flat.size, chunk):
+            yield flat[lo:lo + chunk]
+    else:
+        for block in values:
+            yield from _chunks(np.asarray(block), chunk)
+
+
+def benford_analysis(values, chunk=CHUNK):
+    """
+    benford_stats of all values, given as one array or an iterable of
+    arrays (a generator, a memmap sliced in blocks, …), processed `chunk`
+    values at a time. The counts are included as "counts".
+    """
+    counts = np.zeros(9, dtype=np.int64)
+    for block in _chunks(values, chunk):
+        counts += digit_counts(block)
+    return {"counts": counts, **benford_stats(counts)}
+
+
+def compute_delta_B(values):
+    """Drop-in for double_slit_test.compute_delta_B: (δ_B, {d: ε(d)}), NaN below 10 digits."""
+    stats = benford_analysis(np.asarray(values, dtype=float))
+    if stats["n"] < 10:
+        return float("nan")
+    return float(stats["delta_B"]), {int(d): float(e) for d, e in zip(DIGITS, stats["epsilon"])}
+
+
+# ═══════════════════════════════════════════════════════════════
+# MERGEABLE ACCUMULATOR
+# ═══════════════════════════════════════════════════════════════
+FIRST_TWO = np.arange(10, 100)
+FIRST_TWO_P = np.log10(1.0 + 1.0 / FIRST_TWO)                  # P(d₁d₂)
+SECOND_P = FIRST_TWO_P.reshape(9, 10).sum(axis=0)               # P(d₂ = k), k = 0…9
+MANTISSA_SCALE = 1 << 40                                         # fixed-point log-mantissa sums
+EXACT_SUM = 1 << 22                                              # terms ≤ 2⁴⁰ per int64 sum
+
+
+def bridge_factor(s):
+    """ε_B = |1 - 2^(1-s)| = |η(s)/ζ(s)|, the boson–fermion bridge factor."""
+    return np.abs(1.0 - 2.0 ** (1.0 - np.asarray(s, dtype=float)))
+
+
+class BenfordAccumulator:
+    """
+    Digit statistics of an unbounded stream: counts of the first digit,
+    second digit and first two digits, and Σm, Σm² of the log-mantissa
+    m = log₁₀ of the significand. The mantissa sums are kept as integers
+    in units of 2⁻⁴⁰, so every field adds exactly and merging is
+    associative and commutative — the same result however a stream is
+    split across threads or processes and in whatever order the parts are
+    combined. Accumulators pickle, and to_dict/from_dict round-trip JSON.
+
+        acc = BenfordAccumulator()
+        for block in stream:
+            acc.update(block)
+        total = sum(parts, BenfordAccumulator())
+    """
+
+    def __init__(self):
+        self.first_two = np.zeros(90, dtype=np.int64)            # d₁d₂ = 10…99
+        self.log_sum = 0                                         # Σ m   · 2⁴⁰
+        self.log_sq_sum = 0                                      # Σ m²  · 2⁴⁰
+
+    def update(self, values, chunk=CHUNK):
+        """Add the finite nonzero entries of an array or an iterable of chunks."""
+        for block in _chunks(values, chunk):
+            two = _scaled(block, 2)                              # d₁d₂.… ∈ [10, 100)
+            idx = np.clip(np.floor(two), 10, 99).astype(np.int64) - 10
+            self.first_two += np.bincount(idx, minlength=90)
+            m = np.clip(np.log10(two) - 1.0, 0.0, np.nextafter(1.0, 0.0))
+            for lo in range(0, m.size, EXACT_SUM):               # int64 sums stay below 2⁶³
+                q = m[lo:lo + EXACT_SUM]
+                self.log_sum += int(np.sum(np.rint(q * MANTISSA_SCALE).astype(np.int64)))
+                self.log_sq_sum += int(np.sum(np.rint(q * q * MANTISSA_SCALE).astype(np.int64)))
+        return self
+
+    def merge(self, other):
+        """A new accumulator holding both streams."""
+        out = BenfordAccumulator()
+        out.first_two = self.first_two + other.first_two
+        out.log_sum = self.log_sum + other.log_sum
+        out.log_sq_sum = self.log_sq_sum + other.log_sq_sum
+        return out
+
+    def __add__(self, other):
+        return self.merge(other)
+
+    def __iadd__(self, other):
+        self.first_two += other.first_two
+        self.log_sum += other.log_sum
+        self.log_sq_sum += other.log_sq_sum
+        return self
+
+    def __eq__(self, other):
+        return (isinstance(other, BenfordAccumulator) and np.array_equal(self.first_two, other.first_two)
+                and self.log_sum == other.log_sum and self.log_sq_sum == other.log_sq_sum)
+
+    @property
+    def n(self):
+        return int(self.first_two.sum())
+
+    @property
+    def first(self):
+        return self.first_two.reshape(9, 10).sum(axis=1)
+
+    @property
+    def second(self):
+        return self.first_two.reshape(9, 10).sum(axis=0)
+
+    def stats(self):
+        """
+        benford_stats of the first digits, plus delta_B_second, delta_B_first_two
+        (Σ|obs - P| against the second-digit and two-digit Benford laws), and the
+        log-mantissa mean and variance (1/2 and 1/12 for an exact Benford set).
+        """
+        n = self.n
+        out = benford_stats(self.first)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            out["delta_B_second"] = float(np.abs(self.second / n - SECOND_P).sum())
+            out["delta_B_first_two"] = float(np.abs(self.first_two / n - FIRST_TWO_P).sum())
+            mean = self.log_sum / MANTISSA_SCALE / n if n else math.nan
+            out["mantissa_mean"] = mean
+            out["mantissa_var"] = self.log_sq_sum / MANTISSA_SCALE / n - mean**2 if n else math.nan
+        return out
+
+    def to_dict(self):
+        return {"first_two": self.first_two.tolist(), "log_sum": self.log_sum, "log_sq_sum": self.log_sq_sum}
+
+    @classmethod
+    def from_dict(cls, d):
+        out = cls()
+        out.first_two = np.asarray(d["first_two"], dtype=np.int64)
+        out.log_sum, out.log_sq_sum = int(d["log_sum"]), int(d["log_sq_sum"])
+        return out
+
+
+
+def _lognormal_part(i, n):
+    """One seeded part of the TEST 4 stream (module level so the pool can pickle it)."""
+    g = np.random.default_rng(100 + i)
+    acc = BenfordAccumulator()
+    for lo in range(0, n, CHUNK):
+        acc.update(g.lognormal(0.0, 5.0, min(CHUNK, n - lo)))
+    return acc
+
+# ═══════════════════════════════════════════════════════════════
+# RUN
+# ═══════════════════════════════════════════════════════════════
+
+if __name__ == "__main__":
+    n_total = int(float(sys.argv[sys.argv.index("--n") + 1])) if "--n" in sys.argv else 100_000_000
+
+    print()
+    print("=" * 100)
+    print("  VECTORIZED BENFORD ANALYSIS")
+    print("=" * 100)
+
+    # ─── TEST 1: AGAINST THE LOOP ─────────────────────────────
+    print()
+    print("─" * 100)
+    print("  TEST 1: leading_digits vs THE double_slit_test.py WHILE LOOP")
+    print("─" * 100)
+    print()
+
+    def leading_digit_loop(x):
+        x = abs(x)
+        while x >= 10:
+            x /= 10
+        while x < 1:
+            x *= 10
+        return int(x)
+
+    rng = np.random.default_rng(1)
+    edge = np.array([0.3, 3e-5, 1e-300, 9.999999999999999, 1000.0, 0.001, 7e22, 2.5e-23, 5e-324,
+                     1.7976931348623157e308, -0.02, 123456789.0])
+    sample = np.concatenate([edge, rng.lognormal(0.0, 30.0, 200_000) * rng.choice([-1, 1], 200_000)])
+    loop = np.array([leading_digit_loop(v) for v in sample])
+    vec = leading_digits(sample)
+    print(f"  {len(sample):,} values (lognormal σ = 30 plus edge cases): "
+          f"{int(np.sum(loop != vec))} disagreements")
+    for v, a, b in zip(edge, loop, vec[:len(edge)]):
+        print(f"    {float(v)!r:<26s} loop {a}  vectorized {b}")
+    print()
+    print("  1e-300: the loop's 300 multiplications by 10 drift to 9.99…; the exact significand is 1.")
+    round_numbers = (DIGITS[:, None] * POW10[EXACT_POW:][None, :]).ravel()      # d·10ᵏ, k = 0 … 22
+    loop = np.array([leading_digit_loop(v) for v in round_numbers])
+    print(f"  d·10ᵏ (d = 1…9, k = 0…22): {int(np.sum(loop != leading_digits(round_numbers)))} of "
+          f"{round_numbers.size} disagree with the loop")
+    ints = np.arange(1, 10_000_001, dtype=np.int64)
+    tens = 10 ** np.arange(8, dtype=np.int64)
+    exact = ints // tens[np.searchsorted(tens, ints, side="right") - 1]
+    print(f"  integers 1 … 10⁷: {int(np.sum(leading_digits(ints) != exact))} disagree with integer division")
+
+    # ─── TEST 2: STATISTICS ───────────────────────────────────
+    print()
+    print("─" * 100)
+    print("  TEST 2: δ_B, χ², MAD, KS — Benford, uniform and double-slit occupation samples")
+    print("─" * 100)
+    print()
+    E = 0.01 * np.arange(1, 5001)
+    samples = {
+        "10^U, U ~ U(0, 6)": 10.0 ** rng.uniform(0, 6, 1_000_000),
+        "U(0, 1)": rng.uniform(0, 1, 1_000_000),
+        "Bose–Einstein, T = 1": 1.0 / np.expm1(E),
+        "Fermi–Dirac, T = 1": 1.0 / (np.exp(E) + 1.0),
+        "2ⁿ, n < 1000": 2.0 ** np.arange(1000) * 1.0,
+    }
+    print(f"  {'Sample':<22s} {'n':<10s} {'δ_B':<12s} {'χ²':<14s} {'p(χ²)':<10s} {'MAD':<10s} {'KS':<10s}")
+    print(f"  {'─'*22} {'─'*10} {'─'*12} {'─'*14} {'─'*10} {'─'*10} {'─'*10}")
+    for name, v in samples.items():
+        st = benford_analysis(v)
+        print(f"  {name:<22s} {st['n']:<10d} {st['delta_B']:<12.6f} {st['chi2']:<14.6g} "
+              f"{st['p_chi2']:<10.3g} {st['mad']:<10.6f} {st['ks']:<10.6f}")
+    bose = 1.0 / np.expm1(E)
+    legacy = compute_delta_B(bose[(bose > 0) & (bose < 1e10)])
+    print()
+    print(f"  compute_delta_B drop-in, Bose–Einstein T = 1: δ_B = {legacy[0]:.6f}, "
+          f"ε(1) = {legacy[1][1]:+.6f}")
+
+    # ─── TEST 3: THROUGHPUT ───────────────────────────────────
+    print()
+    print("─" * 100)
+    print(f"  TEST 3: {n_total:,} VALUES STREAMED IN CHUNKS OF {CHUNK:,}")
+    print("─" * 100)
+    print()
+
+    def stream(n, seed=2):
+        g = np.random.default_rng(seed)
+        for lo in range(0, n, CHUNK):
+            yield g.lognormal(0.0, 5.0, min(CHUNK, n - lo))
+
+    t0 = time.perf_counter()
+    for block in stream(n_total):
+        pass
+    gen = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    st = benford_analysis(stream(n_total))
+    dt = time.perf_counter() - t0 - gen
+    print(f"  lognormal σ = 5: δ_B = {st['delta_B']:.6f}, p(χ²) = {st['p_chi2']:.3g}")
+    print(f"  analysis {dt:.2f} s ({n_total / dt / 1e6:.0f} M values/s; generating the stream took {gen:.2f} s)")
+    n_loop = 200_000
+    t0 = time.perf_counter()
+    [leading_digit_loop(v) for v in sample[:n_loop]]
+    loop_rate = n_loop / (time.perf_counter() - t0)
+    print(f"  the while loop: {loop_rate / 1e6:.2f} M values/s → {n_total / loop_rate:.0f} s for the same stream")
+
+    # ─── TEST 4: MERGEABLE ACCUMULATOR ────────────────────────
+    print()
+    print("─" * 100)
+    print("  TEST 4: BenfordAccumulator — 8 seeded streams on a process pool, merged in two orders")
+    print("─" * 100)
+    print()
+    n_part = max(1, n_total // 80)
+    t0 = time.perf_counter()
+    with ProcessPoolExecutor() as pool:
+        parts = list(pool.map(_lognormal_part, range(8), [n_part] * 8))
+    dt = time.perf_counter() - t0
+    forward = reduce(BenfordAccumulator.merge, parts)
+    shuffled = [parts[i] for i in (5, 2, 7, 0, 3, 6, 1, 4)]
+    tree = (shuffled[0] + shuffled[1]) + ((shuffled[2] + shuffled[3]) + (shuffled[4] + (shuffled[5]
+            + (shuffled[6] + shuffled[7]))))
+    serial = BenfordAccumulator()
+    for i in range(8):
+        serial.update(stream(n_part, seed=100 + i))
+    print(f"  {8 * n_part:,} values in {dt:.2f} s; left fold == shuffled tree == single process: "
+          f"{forward == tree == serial}")
+    print(f"  JSON round trip equal: {BenfordAccumulator.from_dict(forward.to_dict()) == forward}")
+    ints = np.arange(10, 1_000_000, dtype=np.int64)
+    tens = 10 ** np.arange(7, dtype=np.int64)
+    exact = np.bincount(ints // tens[np.searchsorted(tens, ints, side="right") - 2] - 10, minlength=90)
+    acc = BenfordAccumulator().update(ints, chunk=1 << 16)
+    print(f"  integers 10 … 10⁶ - 1: first-two counts == integer division: {np.array_equal(acc.first_two, exact)}; "
+          f"second digits of 10 … 99: {BenfordAccumulator().update(np.arange(10, 100)).second.tolist()}")
+    pooled = sum(digit_counts(np.concatenate(list(stream(n_part, seed=100 + i)))) for i in range(8))
+    print(f"  first digits == digit_counts on the pooled stream: {np.array_equal(forward.first, pooled)}")
+    st = forward.stats()
+    print()
+    print(f"  {'δ_B (1st)':<12s} {'δ_B (2nd)':<12s} {'δ_B (1st two)':<14s} {'⟨m⟩':<12s} {'var m':<12s} "
+          f"{'p(χ²)':<8s} {'δ_B < ε_B(s = 2)':<16s}")
+    print(f"  {'─'*12} {'─'*12} {'─'*14} {'─'*12} {'─'*12} {'─'*8} {'─'*16}")
+    print(f"  {st['delta_B']:<12.6f} {st['delta_B_second']:<12.6f} {st['delta_B_first_two']:<14.6f} "
+          f"{st['mantissa_mean']:<12.8f} {st['mantissa_var']:<12.8f} {st['p_chi2']:<8.3f} "
+          f"{str(bool(st['delta_B'] < bridge_factor(2.0))):<16s}")
+    print(f"  {'Benford:':<12s} {'0':<12s} {'0':<12s} {'0':<14s} {0.5:<12.8f} {1 / 12:<12.8f}")
+    print()
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Sliding-Window Benford Profiles Along the Radius
+================================================
+nine_models_kretschner.py states that all nine models keep Benford
+conformance "all the way to r = 0", but no script measures δ_B as a
+function of radius. Here a window of w consecutive samples slides down a
+dense log-spaced radial grid of K, g_rr = 1/f or ζ(s(r)), and δ_B of the
+window is recorded at every step:
+
+    d_i               leading digit of sample i (0 where K, g_rr or ζ
+                      is zero or non-finite: not counted)
+    C[i]              digit counts of d_0 … d_(i-1)        (prefix_counts)
+    counts(i, i+w)    C[i+w] - C[i]
+
+— the +1/-1 update of a sliding histogram, taken at every step of the
+window at once: O(9) per window position whatever w, one pass over the
+digits. A profile of 10⁶+ samples per model costs a fraction of a second
+beyond evaluating the field itself.
+
+The window is given as a width in decades of r. On a log grid a power law
+K ∝ r⁻ᵏ fills k decades of K per decade of r, enough to be Benford; where
+a field levels off (a de Sitter core, g_rr → 1 far out) its digits pile
+up and δ_B rises. Windows are flagged against the 95% quantile of δ_B
+for an exact Benford source of the same size (benford_significance.py).
+
+Usage:
+    python3 benford_profile.py                 # 1.4·10⁶ radii per model
+    python3 benford_profile.py --n 10000000    # denser grid
+
+Author: Christopher Riner & Barron
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+from benford_numpy import benford_stats, digit_counts, digits_in_place, prefix_counts
+from benford_significance import null_quantiles
+from curvature_invariants import invariants_from_jets
+from model_registry import MODEL_REGISTRY, OUTPUT_DIR, model_jets
+from spacetimes import s_cubic
+from zeta_numpy import zeta_np
+
+R_MIN, R_MAX = 1e-6, 10.0          # r/r_s; below the r_P = 10⁻⁴ cores
+N_RADII = 1_400_000                # 2·10⁵ per decade
+WINDOW_DECADES = 1.0
+N_WINDOWS = 600                    # window positions reported per profile
+
+
+# ═══════════════════════════════════════════════════════════════
+# SLIDING WINDOW
+# ═══════════════════════════════════════════════════════════════
+
+def sliding_counts(values, window, step=1):
+    """
+    Digit counts (n_windows, 9) of values[i:i+window] for
+    i = 0, step, 2·step, … ; returns (starts, counts).
+    """
+    digits = digits_in_place(values)
+    if window > digits.size:
+        raise ValueError(f"window {window} is longer than the {digits.size} samples")
+    starts = np.arange(0, digits.size - window + 1, step)
+    cuts = np.union1d(starts, starts + window)
+    prefix = prefix_counts(digits, cuts)
+    return starts, prefix[np.searchsorted(cuts, starts + window)] - prefix[np.searchsorted(cuts, starts)]
+
+
+def sliding_delta_B(values, window, step=1):
+    """(starts, δ_B, n) of every window position; δ_B is NaN for empty windows."""
+    starts, counts = sliding_counts(values, window, step)
+    stats = benford_stats(counts)
+    return starts, stats["delta_B"], stats["n"]
+
+
+# ═══════════════════════════════════════════════════════════════
+# RADIAL PROFILES
+# ═══════════════════════════════════════════════════════════════
+
+def radial_grid(n=N_RADII, r_min=R_MIN, r_max=R_MAX):
+    """n log-spaced radii from r_max inward to r_min."""
+    return np.geomspace(r_max, r_min, n)
+
+
+def radial_field(model, field, r):
+    """K, g_rr = 1/f or ζ(1 + (r/r_s)³) of a registered model on r."""
+    if field == "zeta":
+        return zeta_np(s_cubic(r, MODEL_REGISTRY[model].params.get("r_s", 1.0))[0])
+    f, fp, fpp = model_jets(model, r)
+    if field == "K":
+        return invariants_from_jets(r, f, fp, fpp)["K"]
+    if field == "g_rr":
+        with np.errstate(divide="ignore"):
+            return 1.0 / f
+    raise ValueError(f"unknown field {field!r}: expected K, g_rr or zeta")
+
+
+def radial_profile(model, field="K", r=None, window_decades=WINDOW_DECADES, n_windows=N_WINDOWS):
+    """
+    δ_B(r) of one field of one model. The window spans window_decades of
+    r; each position is reported at the geometric centre of its window.
+    Returns {r, delta_B, n, window}.
+    """
+    r = radial_grid() if r is None else np.asarray(r, dtype=float)
+    per_decade = (r.size - 1) / abs(np.log10(r[-1] / r[0]))
+    window = int(round(window_decades * per_decade))
+    step = max(1, (r.size - window) // (n_windows - 1))
+    starts, dB, n = sliding_delta_B(radial_field(model, field, r), window, step)
+    return {"r": np.sqrt(r[starts] * r[starts + window - 1]), "delta_B": dB, "n": n, "window": window}
+
+
+# ═══════════════════════════════════════════════════════════════
+# RUN
+# ═══════════════════════════════════════════════════════════════
+
+if __name__ == "__main__":
+    n_radii = int(float(sys.argv[sys.argv.index("--n") + 1])) if "--n" in sys.argv else N_RADII
+    r = radial_grid(n_radii)
+
+    print()
+    print("=" * 120)
+    print("  δ_B(r) — SLIDING-WINDOW BENFORD PROFILES THROUGH THE HORIZON TO r = 10⁻⁶ r_s")
+    print("=" * 120)
+
+    # ─── TEST 1: SLIDING COUNTS vs DIRECT COUNTS ──────────────
+    print()
+    print("─" * 120)
+    print("  TEST 1: PREFIX-DIFFERENCE WINDOW COUNTS vs RECOUNTING EVERY WINDOW")
+    print("─" * 120)
+    print()
+    K = radial_field("Standard GR", "K", r[:200_000])
+    starts, counts = sliding_counts(K, 50_000, 997)
+    direct = np.array([digit_counts(K[i:i + 50_000]) for i in starts])
+    print(f"  {len(starts)} windows of 50 000 samples: identical counts — "
+          f"{'yes' if np.array_equal(counts, direct) else 'NO'}")
+    t0 = time.perf_counter()
+    sliding_counts(radial_field("Standard GR", "K", r), 200_000, 1)
+    print(f"  every one of the {r.size - 200_000 + 1:,} window positions on {r.size:,} radii "
+          f"(step 1): {time.perf_counter() - t0:.2f} s including K")
+
+    # ─── TEST 2: PROFILES ─────────────────────────────────────
+    print()
+    print("─" * 120)
+    print(f"  TEST 2: δ_B(r) PER MODEL — {r.size:,} radii, window {WINDOW_DECADES:g} decade of r, "
+          f"{N_WINDOWS} positions")
+    print("─" * 120)
+    probes = [3.0, 1.0, 0.3, 0.1, 3e-2, 1e-2, 3e-3, 1e-3, 1e-4, 1e-5]
+    profiles = {}
+    t0 = time.perf_counter()
+    for field in ("K", "g_rr"):
+        for name in MODEL_REGISTRY:
+            profiles[(name, field)] = radial_profile(name, field, r)
+    profiles[("ζ(1 + r³)", "zeta")] = radial_profile("Standard GR", "zeta", r)
+    dt = time.perf_counter() - t0
+    window = next(iter(profiles.values()))["window"]
+    q95 = float(null_quantiles(window, q=(0.95,))[0, 0])
+
+    for field in ("K", "g_rr", "zeta"):
+        print()
+        print(f"  {field}: δ_B of the window centred on r/r_s  (null 95% at {window:,} samples: {q95:.5f};"
+              f" * = above it)")
+        print()
+        print(f"  {'Model':<20s} " + " ".join(f"{p:<9g}" for p in probes) + f" {'max δ_B':<9s} {'% ok':<6s} {'first * at':<10s}")
+        print(f"  {'─'*20} " + " ".join("─" * 9 for _ in probes) + f" {'─'*9} {'─'*6} {'─'*10}")
+        for (name, fld), prof in profiles.items():
+            if fld != field:
+                continue
+            idx = [int(np.argmin(np.abs(np.log(prof["r"] / p)))) for p in probes]
+            cells = [f"{prof['delta_B'][i]:.4f}{'*' if prof['delta_B'][i] > q95 else ' '}"
+                     if np.isfinite(prof["delta_B"][i]) else "—" for i in idx]
+            bad = ~(prof["delta_B"] <= q95)
+            first = f"{prof['r'][np.argmax(bad)]:.3g}" if bad.any() else "—"
+            print(f"  {name:<20s} " + " ".join(f"{c:<9s}" for c in cells)
+                  + f" {np.nanmax(prof['delta_B']):<9.4f} {100 * np.mean(~bad):<6.1f} {first:<10s}")
+    print()
+    print(f"  {len(profiles)} profiles × {r.size:,} radii in {dt:.1f} s")
+    print("  % ok: window positions at or below the null 95% quantile; first * at: the outermost window centre")
+    print("  above it, walking inward — the \"to r = 0\" claim needs 100% and no *. A smooth field on a log")
+    print("  grid is far more even than random draws (pure r⁻⁶ gives δ_B ≈ 0), so the null quantile is lenient.")
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    path = os.path.join(OUTPUT_DIR, "benford_profile.npz")
+    np.savez_compressed(path, null_q95=q95, window=window, **{
+        f"{fld}/{name}/{key}": prof[key] for (name, fld), prof in profiles.items() for key in ("r", "delta_B")})
+    print(f"  → {path}")
+    print()
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Bootstrap and Permutation Significance for δ_B
+==============================================
+double_slit_test.py reads raw δ_B against fixed thresholds (0.01 quantum,
+0.03 mixed, 0.06 massive), but δ_B of a finite sample is biased upward by
+counting noise: an exact Benford source of N values gives on average
+δ_B ≈ √(2/π) Σ√(P(d)(1 - P(d))) / √N ≈ 2.07/√N, 0.029 at the N = 5000 of
+that script. Every test here works on the nine
+digit counts, never the values, so a resample costs O(9):
+
+  significance(counts)     per test: δ_B, bootstrap CI and standard error
+                           (multinomial resamples of the observed
+                           frequencies), the bias-corrected δ̂ - bias
+                           reported separately (the resampled δ_B sits
+                           above δ̂ by the same noise bias), the
+                           p-value against exact-Benford multinomial
+                           samples of the same N, and the 95% null
+                           quantile — the size-aware threshold
+  permutation_test(a, b)   is δ_B(a) - δ_B(b) more than a random split of
+                           the pooled counts gives? (multivariate
+                           hypergeometric draws)
+  null_quantiles(N)        the δ_B a perfect Benford source shows at N
+
+Resamples are drawn in blocks, each from its own child of one
+SeedSequence, and blocks are spread over a process pool: the numbers are
+reproducible for a given seed whatever the number of workers. Every
+function takes pool= to reuse one executor across calls; otherwise each
+call opens (and significance shares) its own.
+
+Usage:
+    python3 benford_significance.py
+
+Author: Christopher Riner & Barron
+"""
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+
+import numpy as np
+
+from benford_numpy import BENFORD_P, digit_counts
+
+BLOCK = 2000                    # resamples per task
+N_RESAMPLES = 10_000
+
+
+# ═══════════════════════════════════════════════════════════════
+# RESAMPLING
+# ═══════════════════════════════════════════════════════════════
+
+def delta_B_of_counts(counts):
+    """δ_B = Σ|obs(d) - P(d)| for count arrays (..., 9)."""
+    counts = np.asarray(counts, dtype=float)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.abs(counts / counts.sum(axis=-1, keepdims=True) - BENFORD_P).sum(axis=-1)
+
+
+def _draw_block(kind, counts, size, seed):
+    """δ_B of `size` resamples for every row of counts → (size, k)."""
+    rng = np.random.default_rng(seed)
+    n = counts.sum(axis=-1)
+    if kind == "bootstrap":
+        return delta_B_of_counts(rng.multinomial(n, counts / n[:, None], size=(size, len(n))))
+    if kind == "null":
+        return delta_B_of_counts(rng.multinomial(n, np.broadcast_to(BENFORD_P, counts.shape),
+                                                 size=(size, len(n))))
+    # permutation: rows 0 and 1 are the two samples; split the pool hypergeometrically
+    a = rng.multivariate_hypergeometric(counts.sum(axis=0), int(n[0]), size=size)
+    return (delta_B_of_counts(a) - delta_B_of_counts(counts.sum(axis=0) - a))[:, None]
+
+
+def _pool(workers=None, pool=None):
+    """Context yielding the executor to use: pool as given, None for workers=1, else a new one."""
+    if pool is not None or workers == 1:
+        return nullcontext(pool)
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+def resample(kind, counts, n_samples=N_RESAMPLES, seed=0, workers=None, pool=None):
+    """
+    (n_samples, k) δ_B resamples of kind "bootstrap", "null" or
+    "permutation" for counts (k, 9), in BLOCK-sized seeded tasks.
+    """
+    counts = np.atleast_2d(np.asarray(counts, dtype=np.int64))
+    sizes = [min(BLOCK, n_samples - lo) for lo in range(0, n_samples, BLOCK)]
+    seeds = np.random.SeedSequence([seed, {"bootstrap": 0, "null": 1, "permutation": 2}[kind]]).spawn(len(sizes))
+    if len(sizes) == 1:
+        return _draw_block(kind, counts, sizes[0], seeds[0])
+    with _pool(workers, pool) as ex:
+        if ex is None:
+            blocks = [_draw_block(kind, counts, sz, sd) for sz, sd in zip(sizes, seeds)]
+        else:
+            blocks = list(ex.map(_draw_block, [kind] * len(sizes), [counts] * len(sizes), sizes, seeds))
+    return np.concatenate(blocks)
+
+
+# ═══════════════════════════════════════════════════════════════
+# TESTS
+# ═══════════════════════════════════════════════════════════════
+
+def significance(counts, n_boot=N_RESAMPLES, n_null=N_RESAMPLES, ci=0.95, seed=0, workers=None,
+                 pool=None):
+    """
+    For counts (9,) or (k, 9): dict of (k,) arrays — n, delta_B, se, bias
+    (mean resampled δ_B - δ_B), delta_B_corrected = max(δ_B - bias, 0),
+    ci_low, ci_high (bootstrap percentile interval shifted down by the
+    bias and clipped at 0: it always contains δ_B and has upper end
+    above 0, where the basic interval 2δ̂ - q collapses to [0, 0] once
+    the bias exceeds δ̂), p_value = P(δ_B,null ≥ δ_B) with the +1
+    correction, null_mean and null_q95 at the same N.
+    """
+    counts = np.atleast_2d(np.asarray(counts, dtype=np.int64))
+    obs = delta_B_of_counts(counts)
+    with _pool(workers, pool) as ex:
+        boot = resample("bootstrap", counts, n_boot, seed, workers, ex)
+        null = resample("null", counts, n_null, seed, workers, ex)
+    lo, hi = np.quantile(boot, [(1 - ci) / 2, (1 + ci) / 2], axis=0)
+    bias = boot.mean(axis=0) - obs
+    return {
+        "n": counts.sum(axis=-1),
+        "delta_B": obs,
+        "se": boot.std(axis=0, ddof=1),
+        "bias": bias,
+        "delta_B_corrected": np.maximum(obs - bias, 0.0),
+        "ci_low": np.maximum(lo - bias, 0.0), "ci_high": hi - bias,
+        "p_value": (1 + np.sum(null >= obs, axis=0)) / (1 + n_null),
+        "null_mean": null.mean(axis=0),
+        "null_q95": np.quantile(null, 0.95, axis=0),
+    }
+
+
+def permutation_test(counts_a, counts_b, n_perm=N_RESAMPLES, seed=0, workers=None, pool=None):
+    """
+    (δ_B(a) - δ_B(b), two-sided p-value) under H₀: both samples share one
+    digit distribution. Each permutation re-splits the pooled counts into
+    groups of the original sizes.
+    """
+    counts = np.array([counts_a, counts_b], dtype=np.int64)
+    diff = float(np.diff(delta_B_of_counts(counts)[::-1])[0])
+    perm = resample("permutation", counts, n_perm, seed, workers, pool)[:, 0]
+    return diff, (1 + np.sum(np.abs(perm) >= abs(diff))) / (1 + n_perm)
+
+
+def null_quantiles(n, q=(0.5, 0.95, 0.99), n_null=N_RESAMPLES, seed=0, workers=None, pool=None):
+    """Quantiles (len(q), len(n)) of δ_B for exact-Benford samples of sizes n."""
+    n = np.atleast_1d(n)
+    counts = np.rint(np.outer(n, BENFORD_P)).astype(np.int64)
+    counts[:, 0] += n - counts.sum(axis=1)                      # exact totals; only N matters
+    return np.quantile(resample("null", counts, n_null, seed, workers, pool), q, axis=0)
+
+
+# ═══════════════════════════════════════════════════════════════
+# RUN
+# ═══════════════════════════════════════════════════════════════
+
+if __name__ == "__main__":
+    print()
+    print("=" * 100)
+    print("  δ_B SIGNIFICANCE — BOOTSTRAP, EXACT-MULTINOMIAL NULL, PERMUTATION")
+    print("=" * 100)
+
+    # ─── TEST 1: SIZE-AWARE THRESHOLDS ────────────────────────
+    print()
+    print("─" * 100)
+    print("  TEST 1: δ_B OF AN EXACT BENFORD SOURCE vs SAMPLE SIZE (10⁴ multinomial samples each)")
+    print("─" * 100)
+    print()
+    sizes = np.array([50, 100, 300, 1000, 3000, 5000, 10_000, 100_000, 1_000_000])
+    q = null_quantiles(sizes)
+    print(f"  {'N':<10s} {'median':<10s} {'95%':<10s} {'99%':<10s} {'2.07/√N':<10s} {'reads as (0.01/0.03/0.06)':<26s}")
+    print(f"  {'─'*10} {'─'*10} {'─'*10} {'─'*10} {'─'*10} {'─'*26}")
+    for i, n in enumerate(sizes):
+        med = q[0, i]
+        label = ("quantum/wavelike" if med < 0.01 else "mixed" if med < 0.03
+                 else "mostly massive" if med < 0.06 else "massive/particlelike")
+        print(f"  {n:<10d} {med:<10.5f} {q[1, i]:<10.5f} {q[2, i]:<10.5f} {2.07 / np.sqrt(n):<10.5f} {label:<26s}")
+    print()
+    print("  A perfectly Benford source reads as \"mixed\" or worse below N ≈ 4·10⁴ values: at the script's")
+    print("  N = 5000 only δ_B above the null 95% quantile (≈ 0.044) is evidence of non-Benford digits.")
+
+    # ─── TEST 2: DOUBLE-SLIT TEST 1 WITH UNCERTAINTY ──────────
+    print()
+    print("─" * 100)
+    print("  TEST 2: double_slit_test.py TEST 1 — BOSON vs FERMION δ_B WITH 95% CI AND p-VALUES")
+    print("─" * 100)
+    print()
+    E = 0.01 * np.arange(1, 5001)
+    temperatures = np.array([0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 50.0, 100.0])
+    rows = []
+    for T in temperatures:
+        with np.errstate(over="ignore"):
+            b = 1.0 / np.expm1(E / T)
+            f = 1.0 / (np.exp(E / T) + 1.0)
+        rows += [digit_counts(b[(b > 0) & (b < 1e10)]), digit_counts(f[(f > 0) & (f < 1e10)])]
+    with ProcessPoolExecutor() as pool:
+        t0 = time.perf_counter()
+        sig = significance(np.array(rows), pool=pool)
+        dt = time.perf_counter() - t0
+        perms = [permutation_test(rows[2 * i + 1], rows[2 * i], seed=i, pool=pool)[1]
+                 for i in range(temperatures.size)]
+    print(f"  {'T':<7s} {'stat':<8s} {'N':<6s} {'δ_B':<10s} {'δ_B - bias':<11s} {'95% CI':<20s} "
+          f"{'p (vs Benford)':<15s} {'null 95%':<10s} {'F vs B: p':<10s}")
+    print(f"  {'─'*7} {'─'*8} {'─'*6} {'─'*10} {'─'*11} {'─'*20} {'─'*15} {'─'*10} {'─'*10}")
+    for i, T in enumerate(temperatures):
+        for j, name in enumerate(("boson", "fermion")):
+            k = 2 * i + j
+            ci = f"[{sig['ci_low'][k]:.5f}, {sig['ci_high'][k]:.5f}]"
+            print(f"  {T if j == 0 else '':<7} {name:<8s} {sig['n'][k]:<6d} {sig['delta_B'][k]:<10.5f} "
+                  f"{sig['delta_B_corrected'][k]:<11.5f} {ci:<20s} "
+                  f"{sig['p_value'][k]:<15.4f} {sig['null_q95'][k]:<10.5f} "
+                  f"{f'{perms[i]:.4f}' if j == 1 else '':<10s}")
+    print()
+    print(f"  16 tests × (10⁴ bootstrap + 10⁴ null) resamples: significance() took {dt:.2f} s;"
+          f" F vs B is a 10⁴-permutation test (one pool for all)")
+    print("  The CI is for the population δ_B: counting noise adds ≈ 0.03 at N = 5000, so the")
+    print("  low-T boson and fermion values are both consistent with exact Benford.")
+
+    # ─── TEST 3: CALIBRATION ──────────────────────────────────
+    print()
+    print("─" * 100)
+    print("  TEST 3: CALIBRATION — p-values of 2000 exact-Benford samples (N = 1000) should be uniform")
+    print("─" * 100)
+    print()
+    rng = np.random.default_rng(7)
+    fake = rng.multinomial(1000, BENFORD_P, size=2000)
+    p = significance(fake, n_boot=200, n_null=2000, seed=1)["p_value"]
+    for a in (0.01, 0.05, 0.1, 0.5):
+        print(f"  P(p < {a:<4g}) = {np.mean(p < a):.3f}")
+    print()
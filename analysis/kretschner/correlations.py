@@ -0,0 +1,444 @@
+#!/usr/bin/env python3
+"""
+Vectorized Correlations over Sweep Outputs
+==========================================
+double_slit_test.py correlates δ_B with D, V and α through a pearson()
+loop over Python lists, fine for its 15 points. The sweeps now produce
+10⁶ (α, T) rows, so every statistic here works on columnar arrays:
+
+  pearson(x, y)              along the last axis, any number of series
+  rankdata(x)                average ranks (ties share the mean rank)
+  spearman(x, y)             Pearson of the ranks
+  kendall_tau(x, y)          τ_b in O(n log² n): sort by (x, y), count the
+                             inversions of y by vectorized merge levels,
+                             correct for ties (Knight's method)
+  corr_matrix(columns)       k × k Pearson or Spearman matrix
+  partial_corr(R, i, j, c)   r_ij·c = -P_ij / √(P_ii P_jj), P = R⁻¹ on
+                             the rows/columns {i, j, c}
+  bootstrap(stat, x, y)      percentile CI from resampled index blocks,
+                             each block seeded from one SeedSequence
+  MomentAccumulator          means and co-moments of k columns from a
+                             stream of row blocks (memmaps, files, process
+                             pools), merged pairwise as in Chan et al.; with
+                             n_boot > 0 it carries Poisson(1)-weighted
+                             replicates alongside, so Pearson and partial
+                             correlations get bootstrap CIs in one pass
+                             without the data ever being in memory
+
+Rows with a non-finite entry (the NaN δ_B of sweeps with fewer than 50
+values) are dropped from columns; series stacked along the last axis
+that hold one give NaN. A constant column gives NaN where the legacy
+loop returned 0.
+
+Usage:
+    python3 correlations.py
+    python3 correlations.py --n-boot 1000
+
+Author: Christopher Riner & Barron
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from benford_numpy import CHUNK
+
+N_BOOT = 1000
+LEVEL = 0.95
+
+
+# ═══════════════════════════════════════════════════════════════
+# IN-MEMORY CORRELATIONS
+# ═══════════════════════════════════════════════════════════════
+
+def finite_rows(*columns):
+    """The columns restricted to rows where every one of them is finite."""
+    cols = [np.asarray(c, dtype=float).ravel() for c in columns]
+    keep = np.logical_and.reduce([np.isfinite(c) for c in cols])
+    return [c[keep] for c in cols]
+
+
+def _columns(x, y):
+    """1-D x, y restricted to their finite rows; stacked series are returned as they are."""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if x.ndim == 1 and y.ndim == 1:
+        x, y = finite_rows(x, y)
+    return x, y
+
+
+def pearson(x, y):
+    """Pearson r along the last axis; NaN for a constant series."""
+    x, y = _columns(x, y)
+    xm = x - x.mean(axis=-1, keepdims=True)
+    ym = y - y.mean(axis=-1, keepdims=True)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return (xm * ym).sum(axis=-1) / np.sqrt((xm * xm).sum(axis=-1) * (ym * ym).sum(axis=-1))
+
+
+def rankdata(x):
+    """1-based ranks along the last axis, ties given their average rank."""
+    x = np.asarray(x, dtype=float)
+    flat = x.reshape(-1, x.shape[-1])
+    order = np.argsort(flat, axis=-1, kind="stable")
+    xs = np.take_along_axis(flat, order, axis=-1)
+    new = np.ones(xs.shape, dtype=bool)
+    new[:, 1:] = xs[:, 1:] != xs[:, :-1]
+    group = np.cumsum(new.ravel()) - 1
+    pos = np.broadcast_to(np.arange(1, xs.shape[1] + 1, dtype=float), xs.shape).ravel()
+    mean_rank = (np.bincount(group, weights=pos) / np.bincount(group))[group]
+    ranks = np.empty_like(flat)
+    np.put_along_axis(ranks, order, mean_rank.reshape(xs.shape), axis=-1)
+    return ranks.reshape(x.shape)
+
+
+def spearman(x, y):
+    """Spearman ρ along the last axis; NaN for a stacked series holding a non-finite value."""
+    x, y = _columns(x, y)
+    rho = pearson(rankdata(x), rankdata(y))
+    finite = np.isfinite(x).all(axis=-1) & np.isfinite(y).all(axis=-1)
+    return np.where(finite, rho, np.nan)[()]
+
+
+def _inversions(r):
+    """#{i < j : r[i] > r[j]} for integer ranks 0 … m-1, by bottom-up merge levels."""
+    n = r.size
+    m = int(r.max()) + 1 if n else 1
+    idx = np.arange(n)
+    arr = r.astype(np.int64)
+    total = 0
+    width = 1
+    while width < n:
+        pair = idx // (2 * width)
+        left = (idx // width) % 2 == 0
+        keys = pair[left] * m + arr[left]                       # each left run sorted, runs in order
+        pr, vr = pair[~left], arr[~left]
+        total += int(np.sum(np.searchsorted(keys, (pr + 1) * m) - np.searchsorted(keys, pr * m + vr, side="right")))
+        arr = np.sort(pair * m + arr) - pair * m                # merge: sorted within runs of 2·width
+        width *= 2
+    return total
+
+
+def _tied_pairs(*sorted_columns):
+    """Σ t(t-1)/2 over runs of equal consecutive rows."""
+    n = sorted_columns[0].size
+    new = np.ones(n, dtype=bool)
+    new[1:] = np.logical_or.reduce([c[1:] != c[:-1] for c in sorted_columns])
+    t = np.diff(np.append(np.flatnonzero(new), n))
+    return int(np.sum(t * (t - 1) // 2))
+
+
+def kendall_tau(x, y):
+    """Kendall τ_b of two columns."""
+    x, y = finite_rows(x, y)
+    n = x.size
+    order = np.lexsort((y, x))
+    xs, ys = x[order], y[order]
+    n0 = n * (n - 1) // 2
+    n1 = _tied_pairs(xs)
+    n2 = _tied_pairs(np.sort(ys))
+    n3 = _tied_pairs(xs, ys)
+    discordant = _inversions(np.unique(ys, return_inverse=True)[1])
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return (n0 - n1 - n2 + n3 - 2 * discordant) / np.sqrt(float(n0 - n1) * float(n0 - n2))
+
+
+def corr_matrix(columns, method="pearson"):
+    """k × k Pearson or Spearman matrix of k columns (rows with a non-finite entry dropped)."""
+    A = np.array(finite_rows(*columns))
+    if method == "spearman":
+        A = rankdata(A)
+    A -= A.mean(axis=1, keepdims=True)
+    C = A @ A.T
+    d = np.sqrt(np.diag(C))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return C / np.outer(d, d)
+
+
+def partial_corr(R, i, j, controls=()):
+    """Correlation of columns i and j with the controls held fixed, for R (..., k, k)."""
+    sel = [i, j, *controls]
+    P = np.linalg.inv(np.asarray(R)[..., sel, :][..., :, sel])
+    return -P[..., 0, 1] / np.sqrt(P[..., 0, 0] * P[..., 1, 1])
+
+
+# ═══════════════════════════════════════════════════════════════
+# BOOTSTRAP
+# ═══════════════════════════════════════════════════════════════
+
+def bootstrap(stat, x, y, n_boot=N_BOOT, level=LEVEL, seed=0, chunk=CHUNK):
+    """
+    stat(x, y) with a percentile CI: resamples are index arrays drawn in
+    blocks of ≤ chunk values, each from its own SeedSequence child, and
+    stat must work along the last axis. Returns {estimate, ci_low,
+    ci_high, se, replicates}.
+    """
+    x, y = finite_rows(x, y)
+    n = x.size
+    per_block = max(1, chunk // max(n, 1))
+    sizes = [min(per_block, n_boot - lo) for lo in range(0, n_boot, per_block)]
+    reps = []
+    for size, ss in zip(sizes, np.random.SeedSequence(seed).spawn(len(sizes))):
+        idx = np.random.default_rng(ss).integers(0, n, (size, n))
+        reps.append(stat(x[idx], y[idx]))
+    reps = np.concatenate(reps)
+    lo, hi = np.nanquantile(reps, [(1 - level) / 2, (1 + level) / 2])
+    return {"estimate": float(stat(x, y)), "ci_low": lo, "ci_high": hi,
+            "se": np.nanstd(reps, ddof=1), "replicates": reps}
+
+
+# ═══════════════════════════════════════════════════════════════
+# STREAMING MOMENTS
+# ═══════════════════════════════════════════════════════════════
+
+def row_blocks(*columns, rows=None):
+    """(rows, k) blocks of k equal-length columns — arrays or np.memmap — read one block at a time."""
+    n = len(columns[0])
+    rows = rows or max(1, CHUNK // len(columns))
+    for lo in range(0, n, rows):
+        yield np.column_stack([np.asarray(c[lo:lo + rows], dtype=float) for c in columns])
+
+
+class MomentAccumulator:
+    """
+    Weight, means and co-moment matrix of k columns over a stream of row
+    blocks. Replicate 0 is the data; replicates 1 … n_boot weight every
+    row by an independent Poisson(1) draw (the Poisson bootstrap, which
+    needs no resampling of rows already seen). Each block is centred on
+    its own mean before the products are summed, and blocks merge as
+
+        M = M_a + M_b + δδᵀ w_a w_b / (w_a + w_b),    δ = μ_b - μ_a
+
+    so parts built on separate chunks or processes add with `+` or
+    sum(parts). Use a different seed for each part (an int or a
+    SeedSequence); a merged accumulator draws from a child spawned off
+    the left part's SeedSequence, so its replicates never reuse the
+    parts' streams.
+
+        acc = MomentAccumulator(3, n_boot=200)
+        for block in row_blocks(dB, D, alpha):
+            acc.update(block)
+        acc.partial(0, 1, [2])           # (n_boot + 1,)
+    """
+
+    def __init__(self, k, n_boot=0, seed=0):
+        self.k = k
+        self.n_boot = n_boot
+        self.weight = np.zeros(n_boot + 1)
+        self.mean = np.zeros((n_boot + 1, k))
+        self.comoment = np.zeros((n_boot + 1, k, k))
+        self._seed = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+        self._rng = np.random.default_rng(self._seed)
+
+    def update(self, block):
+        """Add a (rows, k) block, or an iterable of them; rows with a non-finite entry are dropped."""
+        if not isinstance(block, np.ndarray):
+            for b in block:
+                self.update(b)
+            return self
+        block = np.asarray(block, dtype=float).reshape(-1, self.k)
+        block = block[np.isfinite(block).all(axis=1)]
+        rows_per = max(1, CHUNK // (self.n_boot + 1))
+        for lo in range(0, len(block), rows_per):
+            self._add(block[lo:lo + rows_per])
+        return self
+
+    def _add(self, A):
+        n = len(A)
+        if n == 0:
+            return
+        centre = A.mean(axis=0)
+        A = A - centre
+        W = np.empty((self.n_boot + 1, n))
+        W[0] = 1.0
+        W[1:] = self._rng.poisson(1.0, (self.n_boot, n))
+        w = W.sum(axis=1)
+        products = (A[:, :, None] * A[:, None, :]).reshape(n, -1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mu = (W @ A) / w[:, None]
+        mu = np.nan_to_num(mu)
+        M = (W @ products).reshape(-1, self.k, self.k) - w[:, None, None] * mu[:, :, None] * mu[:, None, :]
+        self._merge_in(w, mu + centre, M)
+
+    def _merge_in(self, w, mu, M):
+        total = self.weight + w
+        with np.errstate(invalid="ignore", divide="ignore"):
+            frac = np.where(total > 0, w / total, 0.0)
+        delta = mu - self.mean
+        self.comoment += M + (self.weight * frac)[:, None, None] * delta[:, :, None] * delta[:, None, :]
+        self.mean += frac[:, None] * delta
+        self.weight = total
+
+    def merge(self, other):
+        """A new accumulator holding both streams."""
+        out = MomentAccumulator(self.k, self.n_boot, seed=self._seed.spawn(1)[0])
+        out.weight, out.mean, out.comoment = self.weight.copy(), self.mean.copy(), self.comoment.copy()
+        out._merge_in(other.weight, other.mean, other.comoment)
+        return out
+
+    def __add__(self, other):
+        return self.merge(other)
+
+    def __radd__(self, other):
+        """0 + acc is acc, so sum(parts) works."""
+        if isinstance(other, int) and other == 0:
+            return self
+        return NotImplemented
+
+    @property
+    def n(self):
+        return int(self.weight[0])
+
+    def covariance(self):
+        """(n_boot + 1, k, k) sample covariances."""
+        return self.comoment / (self.weight - 1.0)[:, None, None]
+
+    def corr(self):
+        """(n_boot + 1, k, k) Pearson matrices; [0] is the data."""
+        d = np.sqrt(np.diagonal(self.comoment, axis1=1, axis2=2))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self.comoment / (d[:, :, None] * d[:, None, :])
+
+    def partial(self, i, j, controls=()):
+        """(n_boot + 1,) partial correlations r_ij·controls."""
+        return partial_corr(self.corr(), i, j, controls)
+
+    @staticmethod
+    def interval(replicated, level=LEVEL):
+        """(estimate, low, high) from a (n_boot + 1,) array: percentile CI of entries 1 …"""
+        lo, hi = np.nanquantile(replicated[1:], [(1 - level) / 2, (1 + level) / 2])
+        return float(replicated[0]), lo, hi
+
+
+# ═══════════════════════════════════════════════════════════════
+# RUN
+# ═══════════════════════════════════════════════════════════════
+
+if __name__ == "__main__":
+    from coupling_sweep import alpha_sweep, alpha_T_surface
+
+    n_boot = int(sys.argv[sys.argv.index("--n-boot") + 1]) if "--n-boot" in sys.argv else 200
+
+    print()
+    print("=" * 100)
+    print("  VECTORIZED CORRELATIONS OVER SWEEP OUTPUTS")
+    print("=" * 100)
+
+    def legacy_pearson(x, y):
+        """double_slit_test.py, verbatim."""
+        n = len(x)
+        mx = sum(x) / n
+        my = sum(y) / n
+        sx = (sum((xi - mx)**2 for xi in x) / n) ** 0.5
+        sy = (sum((yi - my)**2 for yi in y) / n) ** 0.5
+        if sx < 1e-10 or sy < 1e-10:
+            return 0.0
+        return sum((x[i] - mx) * (y[i] - my) for i in range(n)) / (n * sx * sy)
+
+    # ─── TEST 1: THE 15 LEGACY POINTS ─────────────────────────
+    print()
+    print("─" * 100)
+    print("  TEST 1: double_slit_test.py TEST 2 correlations, legacy loop vs vectorized")
+    print("─" * 100)
+    print()
+    legacy_alphas = [0.0, 0.01, 0.02, 0.05, 0.1, 0.15, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0]
+    sw = alpha_sweep(legacy_alphas)
+    cols = {"D": sw["D"], "V": sw["V"], "α": sw["alpha"]}
+    print(f"  {'pair':<10s} {'legacy r':<11s} {'pearson':<11s} {'accumulator':<13s} {'spearman':<10s} {'kendall τ_b':<12s}")
+    print(f"  {'─'*10} {'─'*11} {'─'*11} {'─'*13} {'─'*10} {'─'*12}")
+    for name, c in cols.items():
+        acc = MomentAccumulator(2).update(np.column_stack([sw["delta_B"], c]))
+        print(f"  {'δ_B, ' + name:<10s} {legacy_pearson(list(sw['delta_B']), list(c)):<+11.6f} "
+              f"{pearson(sw['delta_B'], c):<+11.6f} {acc.corr()[0, 0, 1]:<+13.6f} "
+              f"{spearman(sw['delta_B'], c):<+10.4f} {kendall_tau(sw['delta_B'], c):<+12.4f}")
+    rng = np.random.default_rng(0)
+    a, b = rng.integers(0, 30, 2000), rng.integers(0, 30, 2000) + rng.integers(0, 2, 2000)
+    sx, sy = np.sign(a[:, None] - a[None, :]), np.sign(b[:, None] - b[None, :])
+    brute = (sx * sy).sum() / np.sqrt((sx != 0).sum() * (sy != 0).sum())
+    print()
+    print(f"  τ_b on 2000 heavily tied integers: merge levels {kendall_tau(a, b):.12f}, all n² pairs {brute:.12f}")
+
+    # ─── TEST 2: 10⁶ SWEEP ROWS ───────────────────────────────
+    print()
+    print("─" * 100)
+    print("  TEST 2: δ_B OVER 5000 α × 200 T (10⁶ rows) — FULL, RANK AND PARTIAL CORRELATIONS")
+    print("─" * 100)
+    print()
+    alpha = np.linspace(0.0, 1.0, 5000)
+    temperatures = np.geomspace(0.1, 100.0, 200)
+    surface = alpha_T_surface(alpha, temperatures)
+    A, Tg = np.meshgrid(alpha, temperatures)
+    dB, al, T = surface.ravel(), A.ravel(), np.log10(Tg.ravel())
+    D = np.minimum(1.0, 2.0 * al)
+    names = ["δ_B", "D", "α", "log T"]
+    timings = {}
+    t0 = time.perf_counter()
+    R = corr_matrix([dB, D, al, T])
+    timings["pearson matrix"] = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    S = corr_matrix([dB, D, al, T], method="spearman")
+    timings["spearman matrix"] = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    taus = [kendall_tau(dB, c) for c in (D, al, T)]
+    timings["3 × kendall τ_b"] = time.perf_counter() - t0
+    print(f"  {'with δ_B':<10s} {'pearson':<10s} {'spearman':<10s} {'kendall τ_b':<12s}")
+    print(f"  {'─'*10} {'─'*10} {'─'*10} {'─'*12}")
+    for j in range(1, 4):
+        print(f"  {names[j]:<10s} {R[0, j]:<+10.4f} {S[0, j]:<+10.4f} {taus[j - 1]:<+12.4f}")
+    print()
+    print(f"  {'partial':<28s} {'pearson':<10s} {'spearman':<10s}")
+    print(f"  {'─'*28} {'─'*10} {'─'*10}")
+    for label, i, j, c in [("r(δ_B, D | α)", 0, 1, [2]), ("r(δ_B, D | log T)", 0, 1, [3]),
+                           ("r(δ_B, D | α, log T)", 0, 1, [2, 3]), ("r(δ_B, log T | α)", 0, 3, [2])]:
+        print(f"  {label:<28s} {partial_corr(R, i, j, c):<+10.4f} {partial_corr(S, i, j, c):<+10.4f}")
+    print()
+    print("  " + ",  ".join(f"{k} {v:.2f} s" for k, v in timings.items()))
+    print(f"  ({np.isfinite(dB).sum():,} finite rows; D = min(1, 2α) is a function of α, so what is left of")
+    print("  r(δ_B, D | α) comes from the kink at α = ½, which a linear control on α cannot absorb)")
+
+    # ─── TEST 3: OUT OF CORE WITH BOOTSTRAP ───────────────────
+    print()
+    print("─" * 100)
+    print(f"  TEST 3: STREAMED FROM A MEMMAP IN 4 PARTS — {n_boot} POISSON-BOOTSTRAP REPLICATES")
+    print("─" * 100)
+    print()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "sweep.f64")
+        disk = np.memmap(path, dtype=float, mode="w+", shape=(dB.size, 4))
+        disk[:] = np.column_stack([dB, D, al, T])
+        disk.flush()
+        del disk
+        disk = np.memmap(path, dtype=float, mode="r").reshape(-1, 4)
+        t0 = time.perf_counter()
+        parts = []
+        for p, ss in enumerate(np.random.SeedSequence(0).spawn(4)):
+            part = disk[p * dB.size // 4:(p + 1) * dB.size // 4]
+            parts.append(MomentAccumulator(4, n_boot, seed=ss).update(row_blocks(*part.T, rows=1 << 16)))
+        acc = sum(parts)
+        dt = time.perf_counter() - t0
+        del disk, part
+    print(f"  {acc.n:,} rows × {n_boot + 1} replicates in {dt:.2f} s; streamed matrix vs in-memory: "
+          f"max |ΔR| = {np.nanmax(np.abs(acc.corr()[0] - R)):.1e}")
+    print()
+    print(f"  {'statistic':<28s} {'estimate':<10s} {'95% CI':<22s}")
+    print(f"  {'─'*28} {'─'*10} {'─'*22}")
+    Rb = acc.corr()
+    for label, vals in [("r(δ_B, D)", Rb[:, 0, 1]), ("r(δ_B, log T)", Rb[:, 0, 3]),
+                        ("r(δ_B, D | α)", acc.partial(0, 1, [2])),
+                        ("r(δ_B, D | α, log T)", acc.partial(0, 1, [2, 3]))]:
+        est, lo, hi = MomentAccumulator.interval(vals)
+        print(f"  {label:<28s} {est:<+10.4f} [{lo:+.4f}, {hi:+.4f}]")
+    sub = rng.choice(dB.size, 20_000, replace=False)
+    ok = np.isfinite(dB[sub])
+    t0 = time.perf_counter()
+    bs = bootstrap(spearman, dB[sub][ok], D[sub][ok], n_boot=n_boot)
+    dt = time.perf_counter() - t0
+    print(f"  {'ρ(δ_B, D), 2·10⁴-row sample':<28s} {bs['estimate']:<+10.4f} "
+          f"[{bs['ci_low']:+.4f}, {bs['ci_high']:+.4f}]   (index resampling, {dt:.2f} s)")
+    print()
+    print("  At 10⁶ rows the intervals are narrow: the correlations are properties of the grid, and the")
+    print("  bootstrap matters for 15-point and subsampled readings, not for the full sweep.")
+    print()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Full Curvature Invariant Suite: K, R, R_μνR^μν, C² and *RR in One Pass
+======================================================================
+K alone cannot tell a vacuum solution from an effective-matter core.
+For ds² = -f(r)dt² + dr²/f(r) + r²dΩ² every quadratic invariant is an
+algebraic function of the same jets (f, f', f''), so the whole suite
+comes from one evaluation of the jets:
+
+    K    = f''² + 4f'²/r² + 4(1-f)²/r⁴
+    R    = -f'' - 4f'/r + 2(1-f)/r²
+    Ric² = 2a² + 2b²,   a = f''/2 + f'/r,   b = (1 - f - r f')/r²
+    C²   = K - 2 Ric² + R²/3  =  (r²f'' - 2r f' + 2f - 2)² / (3r⁴)
+    *RR  = 0   (Chern–Pontryagin: static + spherically symmetric metrics
+                are parity-even, so the density vanishes identically)
+
+Vacuum (Schwarzschild): R = Ric² = 0 and C² = K.
+Effective matter core (de Sitter-like): R ≠ 0, Ric² ≠ 0 and C² → 0.
+
+Jets come from the model registry (exact symbolic derivatives, vectorized)
+and are evaluated on a models × radii grid; every invariant is a column of
+the output table.
+
+Author: Christopher Riner & Barron
+"""
+
+import os
+import sys
+
+import numpy as np
+
+from model_registry import MODEL_REGISTRY, model_jets
+
+OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "output")
+
+INVARIANT_COLUMNS = ["K", "R", "Ric2", "Weyl2", "CP"]
+
+
+# ═══════════════════════════════════════════════════════════════
+# INVARIANTS FROM JETS
+# ═══════════════════════════════════════════════════════════════
+
+def invariants_from_jets(r, f, fp, fpp):
+    """
+    All curvature invariants from the jets (f, f', f'').
+    Arguments broadcast together; returns {name: ndarray}.
+    """
+    r = np.asarray(r, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        inv_r = 1.0 / r
+        one_minus_f = 1.0 - f
+
+        a = 0.5 * fpp + fp * inv_r                        # -R^t_t = -R^r_r
+        b = (one_minus_f - r * fp) * inv_r**2             # R^θ_θ = R^φ_φ
+
+        K = fpp**2 + 4.0 * fp**2 * inv_r**2 + 4.0 * one_minus_f**2 * inv_r**4
+        R = -fpp - 4.0 * fp * inv_r + 2.0 * one_minus_f * inv_r**2
+        Ric2 = 2.0 * a**2 + 2.0 * b**2
+        # Closed form instead of K - 2Ric² + R²/3: no cancellation in vacuum
+        Weyl2 = (r**2 * fpp - 2.0 * r * fp - 2.0 * one_minus_f)**2 * inv_r**4 / 3.0
+        CP = np.zeros(np.broadcast(r, f, fp, fpp).shape)
+
+    return {"K": K, "R": R, "Ric2": Ric2, "Weyl2": Weyl2, "CP": CP}
+
+
+# ═══════════════════════════════════════════════════════════════
+# MODELS × RADII TABLE
+# ═══════════════════════════════════════════════════════════════
+
+def invariant_table(radii, models=None):
+    """
+    Evaluate jets and invariants for every registered model on every radius.
+    Returns (names, columns) where each column is an (n_models, n_r) array:
+    f, fp, fpp, K, R, Ric2, Weyl2, CP.
+    """
+    radii = np.asarray(radii, dtype=float)
+    names = list(models or MODEL_REGISTRY)
+    jets = np.empty((3, len(names), radii.size))
+    for i, name in enumerate(names):
+        jets[:, i] = model_jets(name, radii)
+
+    columns = {"f": jets[0], "fp": jets[1], "fpp": jets[2]}
+    columns.update(invariants_from_jets(radii[None, :], jets[0], jets[1], jets[2]))
+    return names, columns
+
+
+def write_table(path, names, radii, columns):
+    """One CSV row per (model, r); one column per jet / invariant."""
+    keys = ["f", "fp", "fpp"] + INVARIANT_COLUMNS
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as fh:
+        fh.write("model,r," + ",".join(keys) + "\n")
+        for i, name in enumerate(names):
+            for j, r in enumerate(radii):
+                vals = ",".join(f"{columns[k][i, j]:.17g}" for k in keys)
+                fh.write(f"{name},{r:.17g},{vals}\n")
+
+
+# ═══════════════════════════════════════════════════════════════
+# RUN
+# ═══════════════════════════════════════════════════════════════
+
+if __name__ == "__main__":
+    out_path = os.path.join(OUTPUT_DIR, "curvature_invariants.csv")
+    if "--out" in sys.argv:
+        out_path = sys.argv[sys.argv.index("--out") + 1]
+
+    RADII = np.geomspace(1e-4, 10.0, 4001)
+    KEY_RADII = [2.0, 1.01, 0.5, 0.1, 0.01, 1e-3, 1e-4]
+
+    names, cols = invariant_table(RADII)
+    write_table(out_path, names, RADII, cols)
+
+    print()
+    print("=" * 120)
+    print("  FULL CURVATURE INVARIANT SUITE")
+    print("  K, Ricci scalar, Ricci², Weyl², Chern–Pontryagin — one pass over the jets")
+    print("=" * 120)
+    print()
+    print(f"  {len(names)} models × {RADII.size} radii → {out_path}")
+
+    # ─── TEST 1: IDENTITIES ─────────────────────────────────────
+    print()
+    print("─" * 120)
+    print("  TEST 1: IDENTITIES")
+    print("─" * 120)
+    print()
+    gr = names.index("Standard GR")
+    vac = np.max(np.abs(cols["R"][gr]) / cols["K"][gr]) + np.max(cols["Ric2"][gr] / cols["K"][gr])
+    print(f"  Schwarzschild: max(|R|/K) + max(Ric²/K) = {vac:.2e}   (vacuum → 0)")
+    print(f"  Schwarzschild: max|C²/K - 1|            = {np.max(np.abs(cols['Weyl2'][gr] / cols['K'][gr] - 1)):.2e}   (vacuum → C² = K)")
+    with np.errstate(invalid="ignore"):
+        lhs = cols["Weyl2"]
+        rhs = cols["K"] - 2 * cols["Ric2"] + cols["R"]**2 / 3
+        rel = np.nanmax(np.abs(lhs - rhs) / np.maximum(cols["K"], 1e-300))
+    print(f"  All models:    max|C² - (K - 2Ric² + R²/3)| / K = {rel:.2e}")
+
+    # ─── TEST 2: KEY RADII ──────────────────────────────────────
+    for name in names:
+        i = names.index(name)
+        print()
+        print("─" * 120)
+        print(f"  {name.upper()}")
+        print("─" * 120)
+        print(f"  {'r/r_s':<10s} {'K':<14s} {'R':<14s} {'Ric²':<14s} {'C²':<14s} {'*RR':<8s} {'C²/K':<10s}")
+        print(f"  {'─'*10} {'─'*14} {'─'*14} {'─'*14} {'─'*14} {'─'*8} {'─'*10}")
+        for r_key in KEY_RADII:
+            j = int(np.argmin(np.abs(np.log(RADII / r_key))))
+            K, R, Ric2, W, CP = (cols[k][i, j] for k in INVARIANT_COLUMNS)
+            ratio = W / K if K > 0 else float("nan")
+            print(f"  {RADII[j]:<10.2e} {K:<14.4e} {R:<14.4e} {Ric2:<14.4e} {W:<14.4e} {CP:<8.1f} {ratio:<10.4f}")
+
+    # ─── VERDICT ────────────────────────────────────────────────
+    print()
+    print("=" * 120)
+    print("  VERDICT: VACUUM OR EFFECTIVE MATTER AT r = 1e-4 r_s?")
+    print("=" * 120)
+    print()
+    print(f"  {'Model':<22s} {'Ric²/K':<12s} {'C²/K':<12s} {'core'}")
+    print(f"  {'─'*22} {'─'*12} {'─'*12} {'─'*30}")
+    for i, name in enumerate(names):
+        K = cols["K"][i, 0]
+        ric = cols["Ric2"][i, 0] / K
+        weyl = cols["Weyl2"][i, 0] / K
+        if ric < 1e-6:
+            core = "vacuum (Weyl-dominated)"
+        elif weyl < 0.01:
+            core = "effective matter (conformally flat, de Sitter-like)"
+        else:
+            core = "effective matter + tidal"
+        print(f"  {name:<22s} {ric:<12.4e} {weyl:<12.4e} {core}")
+    print()
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Event-Level Monte Carlo Double Slit with Which-Path Coupling
+============================================================
+double_slit_test.py sets distinguishability and visibility by fiat
+(D = min(1, 2α), V = √(1 - D²)) and never draws a detection event. Here
+photons are detected one at a time. Each slit leaves a two-state
+which-path detector in
+
+    |d₁⟩ = cos θ|0⟩ + sin θ|1⟩,   |d₂⟩ = cos θ|0⟩ - sin θ|1⟩,   θ = c·π/4
+
+so the coupling c ∈ [0, 1] runs from no marking (⟨d₁|d₂⟩ = 1) to full
+which-path information (⟨d₁|d₂⟩ = 0). In the Fraunhofer limit, with
+envelope A(x) = sinc(πax/λL) and phase φ(x) = 2πdx/λL, the detector read
+in basis {|k⟩} and a hit at x have probability density
+
+    P(x, k) ∝ A(x)² |⟨k|d₁⟩ e^(iφ/2) + ⟨k|d₂⟩ e^(-iφ/2)|²
+
+Read in the which-path basis |±⟩ = (|0⟩ ± |1⟩)/√2 the screen shows
+V = ⟨d₁|d₂⟩ = cos 2θ with D = sin 2θ (D² + V² = 1); read in {|0⟩, |1⟩}
+(the eraser) each outcome shows full fringes or anti-fringes.
+
+Events are drawn from an alias table over (outcome, screen cell), in seeded
+chunks (SeedSequence.spawn, so the result is the same for any number of
+workers) spread over a process pool. Only the per-pixel hit counts and a
+BenfordAccumulator of the hit positions |x| leave each chunk, so 10⁸
+events need no more memory than 10⁶. Visibility is fitted to the hit
+histogram by reweighted linear least squares on the pixel averages of
+A²·(1, cos φ, sin φ).
+
+Usage:
+    python3 double_slit_mc.py                      # 10⁷ events per coupling
+    python3 double_slit_mc.py --events 100000000
+
+Author: Christopher Riner & Barron
+"""
+
+import math
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from benford_numpy import BenfordAccumulator, benford_stats, digit_counts
+
+Setup = namedtuple("Setup", ["wavelength", "separation", "width", "distance", "half_width", "pixels"])
+
+# 500 nm light, slits 10 µm wide 50 µm apart, screen 1 m away covering
+# the central envelope lobe and the first two side lobes.
+SETUP = Setup(wavelength=500e-9, separation=50e-6, width=10e-6, distance=1.0,
+              half_width=0.15, pixels=3000)
+GRID = 1 << 16                 # CDF cells across the screen
+CHUNK = 1 << 20                # events per task
+BASES = ("which-path", "eraser")
+
+
+# ═══════════════════════════════════════════════════════════════
+# AMPLITUDES
+# ═══════════════════════════════════════════════════════════════
+
+def detector_overlaps(coupling, basis="which-path"):
+    """(⟨k|d₁⟩, ⟨k|d₂⟩) for the two outcomes k of the detector readout, shape (2, 2)."""
+    th = coupling * math.pi / 4
+    c, s = math.cos(th), math.sin(th)
+    if basis == "eraser":
+        return np.array([[c, c], [s, -s]])
+    r = 1.0 / math.sqrt(2.0)
+    return np.array([[r * (c + s), r * (c - s)], [r * (c - s), r * (c + s)]])
+
+
+def envelope_phase(x, setup=SETUP):
+    """A(x)² and φ(x) on the screen."""
+    k = math.pi / (setup.wavelength * setup.distance)
+    return np.sinc(setup.width * x / (setup.wavelength * setup.distance))**2, 2.0 * k * setup.separation * x
+
+
+def joint_density(x, coupling, basis="which-path", setup=SETUP):
+    """P(x, k) up to normalisation, shape (2, len(x))."""
+    env, phi = envelope_phase(x, setup)
+    a = detector_overlaps(coupling, basis)
+    cross = 2.0 * a[:, 0] * a[:, 1]
+    return env * ((a**2).sum(axis=1)[:, None] + cross[:, None] * np.cos(phi))
+
+
+def visibility(coupling, basis="which-path"):
+    """Exact fringe visibility of each outcome (signed: -1 is anti-fringes) and of their sum."""
+    a = detector_overlaps(coupling, basis)
+    per = 2.0 * a[:, 0] * a[:, 1] / (a**2).sum(axis=1)
+    return per, float(np.sum(2.0 * a[:, 0] * a[:, 1]) / np.sum(a**2))
+
+
+def distinguishability(coupling):
+    """Englert's D for the pure detector states: √(1 - |⟨d₁|d₂⟩|²) = sin 2θ."""
+    return math.sin(coupling * math.pi / 2)
+
+
+# ═══════════════════════════════════════════════════════════════
+# SAMPLING
+# ═══════════════════════════════════════════════════════════════
+
+def alias_table(p):
+    """
+    Walker/Vose alias table of the discrete distribution p: draw a column
+    k uniformly, keep it with probability prob[k], else take alias[k] —
+    O(1) per sample instead of a binary search through the CDF.
+    """
+    q = np.asarray(p, dtype=float) * (len(p) / np.sum(p))
+    prob = np.ones(len(q))
+    alias = np.arange(len(q))
+    small = [i for i in range(len(q)) if q[i] < 1.0]
+    large = [i for i in range(len(q)) if q[i] >= 1.0]
+    while small and large:
+        lo, hi = small.pop(), large[-1]
+        prob[lo], alias[lo] = q[lo], hi
+        q[hi] -= 1.0 - q[lo]
+        if q[hi] < 1.0:
+            small.append(large.pop())
+    return prob, alias
+
+
+def sampling_table(coupling, basis="which-path", setup=SETUP):
+    """Alias table over (outcome, cell): the density is piecewise constant at the cell midpoints."""
+    edges = np.linspace(-setup.half_width, setup.half_width, GRID + 1)
+    return alias_table(joint_density(0.5 * (edges[1:] + edges[:-1]), coupling, basis, setup).ravel())
+
+
+def _simulate_chunk(table, setup, n, seed):
+    """Pixel counts (2, pixels) and a BenfordAccumulator of |x| for n seeded events."""
+    prob, alias = table
+    rng = np.random.default_rng(seed)
+    k = rng.integers(0, prob.size, n)
+    cell = np.where(rng.random(n) < prob[k], k, alias[k])
+    outcome, i = np.divmod(cell, GRID)
+    x = setup.half_width * (2.0 * (i + rng.random(n)) / GRID - 1.0)
+    pix = np.clip(((x + setup.half_width) / (2 * setup.half_width) * setup.pixels).astype(np.int64),
+                  0, setup.pixels - 1)
+    hist = np.bincount(outcome * setup.pixels + pix, minlength=2 * setup.pixels).reshape(2, setup.pixels)
+    return hist, BenfordAccumulator().update(np.abs(x))
+
+
+def simulate(coupling, n_events, basis="which-path", setup=SETUP, seed=0, workers=None, chunk=CHUNK):
+    """
+    n_events detections at one coupling. Returns {counts (2, pixels) per
+    detector outcome, centers (pixel x), benford (BenfordAccumulator of
+    |x|)} — identical for a given seed whatever the number of workers.
+    """
+    sizes = [min(chunk, n_events - lo) for lo in range(0, n_events, chunk)]
+    seeds = np.random.SeedSequence([seed, int(round(coupling * 1e6)), BASES.index(basis)]).spawn(len(sizes))
+    table = sampling_table(coupling, basis, setup)
+    args = ([table] * len(sizes), [setup] * len(sizes), sizes, seeds)
+    if workers == 1 or len(sizes) == 1:
+        parts = list(map(_simulate_chunk, *args))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_simulate_chunk, *args))
+    edges = np.linspace(-setup.half_width, setup.half_width, setup.pixels + 1)
+    return {
+        "counts": sum(h for h, _ in parts),
+        "centers": 0.5 * (edges[1:] + edges[:-1]),
+        "benford": sum((acc for _, acc in parts), BenfordAccumulator()),
+    }
+
+
+# ═══════════════════════════════════════════════════════════════
+# VISIBILITY FIT
+# ═══════════════════════════════════════════════════════════════
+
+def _pixel_basis(centers, setup, sub=16):
+    """A²·(1, cos φ, sin φ) averaged over each pixel, (pixels, 3)."""
+    h = centers[1] - centers[0]
+    x = centers[:, None] + h * ((np.arange(sub) + 0.5) / sub - 0.5)
+    env, phi = envelope_phase(x, setup)
+    return np.stack([env, env * np.cos(phi), env * np.sin(phi)], axis=-1).mean(axis=1)
+
+
+def fit_visibility(counts, centers, setup=SETUP, iterations=3):
+    """
+    Fit counts ≈ b₀·⟨A²⟩ + b₁·⟨A² cos φ⟩ + b₂·⟨A² sin φ⟩ (pixel-averaged)
+    by iteratively reweighted least squares with Poisson weights from the
+    fitted counts (weights from the data would bias V upward). V =
+    √(b₁² + b₂²)/b₀ signed by b₁ (anti-fringes negative), with its
+    standard error from the fit covariance.
+    """
+    X = _pixel_basis(centers, setup)
+    counts = np.asarray(counts, dtype=float)
+    var = np.maximum(counts, 1.0)
+    for _ in range(iterations):
+        w = 1.0 / np.sqrt(var)
+        beta, *_ = np.linalg.lstsq(X * w[:, None], counts * w, rcond=None)
+        var = np.maximum(X @ beta, 1e-3)
+    cov = np.linalg.inv((X / var[:, None]).T @ X)
+    b0, b1, b2 = beta
+    amp = math.hypot(b1, b2)
+    V = math.copysign(amp / b0, b1)
+    grad = np.array([-amp / b0**2, b1 / (amp * b0), b2 / (amp * b0)]) if amp > 0 else np.array([0, 1 / b0, 0])
+    return V, float(math.sqrt(grad @ cov @ grad))
+
+
+# ═══════════════════════════════════════════════════════════════
+# RUN
+# ═══════════════════════════════════════════════════════════════
+
+if __name__ == "__main__":
+    n_events = int(sys.argv[sys.argv.index("--events") + 1]) if "--events" in sys.argv else 10_000_000
+
+    print()
+    print("=" * 100)
+    print("  EVENT-LEVEL MONTE CARLO DOUBLE SLIT — WHICH-PATH COUPLING")
+    print("=" * 100)
+    s = SETUP
+    print()
+    print(f"  λ = {s.wavelength * 1e9:.0f} nm, slits {s.width * 1e6:.0f} µm wide, {s.separation * 1e6:.0f} µm apart, "
+          f"screen {s.distance:g} m, ±{s.half_width * 100:.0f} cm in {s.pixels} pixels "
+          f"(fringe spacing {s.wavelength * s.distance / s.separation * 1000:.0f} mm)")
+
+    # ─── TEST 1: SAMPLER ──────────────────────────────────────
+    print()
+    print("─" * 100)
+    print("  TEST 1: HIT HISTOGRAM vs THE EXACT PATTERN (10⁶ events, c = 0.5)")
+    print("─" * 100)
+    print()
+    sim = simulate(0.5, 1_000_000, workers=1)
+    edges = np.linspace(-s.half_width, s.half_width, s.pixels + 1)
+    fine = np.linspace(-s.half_width, s.half_width, s.pixels * 64 + 1)
+    dens = joint_density(0.5 * (fine[1:] + fine[:-1]), 0.5).reshape(2, s.pixels, 64).sum(axis=2)
+    expected = dens / dens.sum() * 1_000_000
+    ok = expected > 5
+    chi2 = float(np.sum((sim["counts"][ok] - expected[ok])**2 / expected[ok]))
+    dof = int(ok.sum()) - 1
+    print(f"  χ² = {chi2:.0f} over {dof} pixel bins with ≥ 5 expected hits  (χ²/dof = {chi2 / dof:.3f})")
+    serial = simulate(0.5, 3 * CHUNK // 2, seed=5, workers=1)
+    pooled = simulate(0.5, 3 * CHUNK // 2, seed=5, workers=2)
+    print(f"  same seed, 1 worker vs process pool: identical counts and digits — "
+          f"{np.array_equal(serial['counts'], pooled['counts']) and serial['benford'] == pooled['benford']}")
+
+    # ─── TEST 2: COUPLING SWEEP ───────────────────────────────
+    print()
+    print("─" * 100)
+    print(f"  TEST 2: {n_events:,} EVENTS PER COUPLING — fitted V, D, and Benford on the hits")
+    print("─" * 100)
+    print()
+    print(f"  {'c':<6s} {'D':<7s} {'V exact':<9s} {'V fitted':<18s} {'D²+V²':<8s} "
+          f"{'δ_B |x|':<10s} {'δ_B pixel counts':<17s} {'time (s)':<9s}")
+    print(f"  {'─'*6} {'─'*7} {'─'*9} {'─'*18} {'─'*8} {'─'*10} {'─'*17} {'─'*9}")
+    rows = []
+    for c in (0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0):
+        t0 = time.perf_counter()
+        sim = simulate(c, n_events)
+        dt = time.perf_counter() - t0
+        total = sim["counts"].sum(axis=0)
+        V, dV = fit_visibility(total, sim["centers"])
+        D = distinguishability(c)
+        dB_x = sim["benford"].stats()["delta_B"]
+        dB_pix = float(benford_stats(digit_counts(total))["delta_B"])
+        rows.append((c, D, V, dB_x, dB_pix))
+        fit = f"{V:.5f} ± {dV:.5f}"
+        print(f"  {c:<6.2f} {D:<7.4f} {visibility(c)[1]:<9.5f} {fit:<18s} {D**2 + V**2:<8.5f} "
+              f"{dB_x:<10.5f} {dB_pix:<17.5f} {dt:<9.2f}")
+    rows = np.array(rows)
+    print()
+    print(f"  r(δ_B pixel counts, D) = {np.corrcoef(rows[:, 4], rows[:, 1])[0, 1]:+.3f},  "
+          f"r(δ_B |x|, D) = {np.corrcoef(rows[:, 3], rows[:, 1])[0, 1]:+.3f}")
+    print("  The sign depends on what is digitized: fringes spread the pixel counts over more decades")
+    print("  (dark pixels), so their δ_B falls with visibility, while the hit positions |x| become")
+    print("  smoother and more Benford-like as the fringes wash out.")
+
+    # ─── TEST 3: QUANTUM ERASER ───────────────────────────────
+    print()
+    print("─" * 100)
+    print(f"  TEST 3: FULL COUPLING (c = 1) READ IN THE ERASER BASIS — {n_events:,} events")
+    print("─" * 100)
+    print()
+    sim = simulate(1.0, n_events, basis="eraser")
+    print(f"  {'outcome':<10s} {'hits':<12s} {'V exact':<9s} {'V fitted':<18s}")
+    print(f"  {'─'*10} {'─'*12} {'─'*9} {'─'*18}")
+    exact, total_V = visibility(1.0, "eraser")
+    for k in range(2):
+        V, dV = fit_visibility(sim["counts"][k], sim["centers"])
+        fit = f"{V:+.5f} ± {dV:.5f}"
+        print(f"  |{k}⟩{'':<7s} {int(sim['counts'][k].sum()):<12d} {exact[k]:<+9.4f} {fit:<18s}")
+    V, dV = fit_visibility(sim["counts"].sum(axis=0), sim["centers"])
+    print(f"  {'both':<10s} {int(sim['counts'].sum()):<12d} {total_V:<+9.4f} {f'{V:+.5f} ± {dV:.5f}':<18s}")
+    print()
+    print("  Sorting the same hits by the eraser outcome recovers fringes and anti-fringes: the")
+    print("  which-path mark costs visibility only while it can still be read.")
+    print()
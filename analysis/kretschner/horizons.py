@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Batch Horizon Finder + Hawking Thermodynamics for the QG Models
+===============================================================
+For every model f(r) and every point of a (mass × model-parameter) grid:
+
+    horizons:       f(r_h) = 0   (outer = largest root, inner = smallest)
+    temperature:    T_H = f'(r_h) / 4π
+    entropy:        S = A/4 = π r_h²        (area law)
+    heat capacity:  C = dM/dT_H,  M = r_s/2 (geometric units, G = c = ħ = k = 1)
+
+Schwarzschild check: r_h = r_s, T_H = 1/(4π r_s), C = -2π r_s².
+
+Method (fully vectorized per chunk of parameter points):
+  1. Sample f on a log grid r = r_s·u, u ∈ [1e-12, 10] → sign changes bracket roots
+  2. Geometric bisection on all brackets at once (60 steps → machine precision)
+  3. Reject "roots" where |f| stays large — jump discontinuities (Causal Sets floor)
+  4. C from re-solving at r_s(1 ± ε) with Newton steps seeded by r_h
+
+Models and their parameters come from model_registry.py; chunks fan out
+over its process-pool sweep runner and each finished chunk is streamed to
+output/horizons_<model>/part_NNNNN.npz (one array per column).
+
+Usage:
+    python3 horizons.py                     # ~10⁴ points per model
+    python3 horizons.py --points 1000000    # 10⁶ points per model
+    python3 horizons.py --workers 8
+
+Author: Christopher Riner & Barron
+"""
+
+import math
+import os
+import sys
+import time
+
+import numpy as np
+
+from model_registry import (MODEL_REGISTRY, cartesian_samples, load_sweep, model_f,
+                            model_fp, run_sweep, slug)
+
+OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "output")
+
+U_GRID = np.geomspace(1e-12, 10.0, 512)   # r / r_s sample points for bracketing
+BISECT_STEPS = 60
+HEAT_EPS = 1e-6                             # relative mass step for C = dM/dT
+
+RESULT_COLUMNS = ["n_horizons", "r_outer", "r_inner", "T_outer", "T_inner",
+                  "S_outer", "C_outer"]
+
+
+# ═══════════════════════════════════════════════════════════════
+# ROOT FINDING
+# ═══════════════════════════════════════════════════════════════
+
+def find_horizons(model, params, u_grid=U_GRID):
+    """
+    All simple roots of f(r) = 0 for a batch of parameter points.
+    params: {name: (n,) array}. Returns (r_outer, r_inner, n_roots),
+    NaN where a model point has no horizon.
+    """
+    r_s = np.asarray(params["r_s"], dtype=float)
+    n = r_s.size
+    col = {k: np.asarray(v, dtype=float)[:, None] for k, v in params.items()}
+
+    r = r_s[:, None] * u_grid[None, :]
+    fv = model_f(model, r, col)
+    sign = np.sign(fv)
+    cross = (sign[:, :-1] * sign[:, 1:] < 0) & np.isfinite(fv[:, :-1]) & np.isfinite(fv[:, 1:])
+
+    row, j = np.nonzero(cross)
+    lo = r[row, j]
+    hi = r[row, j + 1]
+    f_lo = fv[row, j]
+    sub = {k: np.asarray(v, dtype=float)[row] for k, v in params.items()}
+
+    for _ in range(BISECT_STEPS):
+        mid = np.sqrt(lo * hi)
+        f_mid = model_f(model, mid, sub)
+        left = np.sign(f_mid) == np.sign(f_lo)
+        lo = np.where(left, mid, lo)
+        f_lo = np.where(left, f_mid, f_lo)
+        hi = np.where(left, hi, mid)
+    root = np.sqrt(lo * hi)
+
+    # A sign change across a jump leaves |f| = O(1) at the "root"
+    scale = np.abs(model_fp(model, root, sub)) * root
+    genuine = np.abs(model_f(model, root, sub)) <= 1e-6 * np.maximum(scale, 1.0)
+    row, root = row[genuine], root[genuine]
+
+    r_outer = np.full(n, np.nan)
+    r_inner = np.full(n, np.nan)
+    n_roots = np.bincount(row, minlength=n)
+    np.fmax.at(r_outer, row, root)
+    np.fmin.at(r_inner, row, root)
+    r_inner[n_roots < 2] = np.nan
+    return r_outer, r_inner, n_roots
+
+
+def _newton(model, r0, params, steps=8):
+    r = r0.copy()
+    for _ in range(steps):
+        r = r - model_f(model, r, params) / model_fp(model, r, params)
+    return r
+
+
+# ═══════════════════════════════════════════════════════════════
+# THERMODYNAMICS
+# ═══════════════════════════════════════════════════════════════
+
+def hawking_thermo(model, params, r_h):
+    """(T_H, S, C) at horizon radii r_h (NaN propagates)."""
+    T = model_fp(model, r_h, params) / (4.0 * math.pi)
+    S = math.pi * r_h**2
+
+    r_s = np.asarray(params["r_s"], dtype=float)
+    plus = dict(params, r_s=r_s * (1 + HEAT_EPS))
+    minus = dict(params, r_s=r_s * (1 - HEAT_EPS))
+    T_plus = model_fp(model, _newton(model, r_h * (1 + HEAT_EPS), plus), plus) / (4.0 * math.pi)
+    T_minus = model_fp(model, _newton(model, r_h * (1 - HEAT_EPS), minus), minus) / (4.0 * math.pi)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        C = (r_s * HEAT_EPS) / (T_plus - T_minus)   # ΔM = Δr_s / 2 = r_s·ε
+    return T, S, C
+
+
+def horizon_task(model_name, params):
+    """Sweep task: horizons + thermodynamics for a chunk of parameter sets."""
+    r_outer, r_inner, n_roots = find_horizons(model_name, params)
+    T_out, S_out, C_out = hawking_thermo(model_name, params, r_outer)
+    T_in = model_fp(model_name, r_inner, params) / (4.0 * math.pi)
+    return {"n_horizons": n_roots, "r_outer": r_outer, "r_inner": r_inner,
+            "T_outer": T_out, "T_inner": T_in, "S_outer": S_out, "C_outer": C_out}
+
+
+# ═══════════════════════════════════════════════════════════════
+# RUN
+# ═══════════════════════════════════════════════════════════════
+
+if __name__ == "__main__":
+    n_points = int(sys.argv[sys.argv.index("--points") + 1]) if "--points" in sys.argv else 10000
+    workers = int(sys.argv[sys.argv.index("--workers") + 1]) if "--workers" in sys.argv else None
+
+    print()
+    print("=" * 120)
+    print("  BATCH HORIZON FINDER + HAWKING THERMODYNAMICS")
+    print("  T_H = f'(r_h)/4π,  S = π r_h²,  C = dM/dT_H")
+    print("=" * 120)
+
+    # ─── TEST 1: SCHWARZSCHILD CHECK ────────────────────────────
+    print()
+    print("─" * 120)
+    print("  TEST 1: SCHWARZSCHILD — r_h = r_s, T_H = 1/(4π r_s), C = -2π r_s²")
+    print("─" * 120)
+    print()
+    params = {"r_s": np.array([0.1, 1.0, 10.0])}
+    res = horizon_task("Standard GR", params)
+    print(f"  {'r_s':<8s} {'r_h':<14s} {'T_H':<14s} {'exact':<14s} {'C':<14s} {'exact':<14s}")
+    print(f"  {'─'*8} {'─'*14} {'─'*14} {'─'*14} {'─'*14} {'─'*14}")
+    for i, r_s in enumerate(params["r_s"]):
+        print(f"  {r_s:<8.2f} {res['r_outer'][i]:<14.10f} {res['T_outer'][i]:<14.6e} "
+              f"{1/(4*math.pi*r_s):<14.6e} {res['C_outer'][i]:<14.6e} {-2*math.pi*r_s**2:<14.6e}")
+
+    # ─── TEST 2: DEFAULT PARAMETERS, EVERY MODEL ───────────────
+    print()
+    print("─" * 120)
+    print("  TEST 2: HORIZONS AT THE REGISTRY DEFAULTS (r_s = 1, r_P = 1e-4)")
+    print("─" * 120)
+    print()
+    print(f"  {'Model':<22s} {'#':<3s} {'r_outer':<14s} {'r_inner':<14s} {'T_outer':<14s} {'S_outer':<12s} {'C_outer':<14s}")
+    print(f"  {'─'*22} {'─'*3} {'─'*14} {'─'*14} {'─'*14} {'─'*12} {'─'*14}")
+    for model in MODEL_REGISTRY.values():
+        params = {k: np.array([v]) for k, v in model.params.items()}
+        res = horizon_task(model.name, params)
+        print(f"  {model.name:<22s} {res['n_horizons'][0]:<3d} {res['r_outer'][0]:<14.8e} "
+              f"{res['r_inner'][0]:<14.6e} {res['T_outer'][0]:<14.6e} "
+              f"{res['S_outer'][0]:<12.6f} {res['C_outer'][0]:<14.6e}")
+
+    # ─── TEST 3: PARAMETER-GRID SWEEP ──────────────────────────
+    print()
+    print("─" * 120)
+    print(f"  TEST 3: PARAMETER GRIDS (~{n_points:,} points per model, process pool)")
+    print("─" * 120)
+    print()
+    print(f"  {'Model':<22s} {'points':<10s} {'with horizon':<14s} {'two horizons':<14s} {'time':<10s} {'directory'}")
+    print(f"  {'─'*22} {'─'*10} {'─'*14} {'─'*14} {'─'*10} {'─'*30}")
+    for model in MODEL_REGISTRY.values():
+        out_dir = os.path.join(OUTPUT_DIR, f"horizons_{slug(model.name)}")
+        t0 = time.perf_counter()
+        run_sweep(model.name, cartesian_samples(model, n_points), task=horizon_task,
+                  out_dir=out_dir, workers=workers)
+        dt = time.perf_counter() - t0
+        cols = load_sweep(out_dir)
+        n = cols["r_s"].size
+        one = int(np.sum(cols["n_horizons"] >= 1))
+        two = int(np.sum(cols["n_horizons"] >= 2))
+        print(f"  {model.name:<22s} {n:<10,d} {one:<14,d} {two:<14,d} {dt:<10.2f} {os.path.relpath(out_dir)}")
+    print()
@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+"""
+Quantum Gravity Model Registry + Parallel Parameter Sweeps
+==========================================================
+nine_models_kretschner.py used to hard-code each model's constants inside
+its f(r); it now reads the models from here. Every model DECLARES its
+parameters (with defaults) and a vectorizable f, so adding or sweeping a
+model never means editing code.
+
+Two ways to plug a model in:
+
+    # 1. Symbolic source — exact jets from the symbolic cache
+    register_model("Hayward", {"r_s": 1.0, "ell": 1e-2},
+                   f_src="1 - r_s*r**2/(r**3 + r_s*ell**2)")
+
+    # 2. Any NumPy function — jets by central differences
+    @register_model("Bardeen", {"r_s": 1.0, "g": 1e-2})
+    def f_bardeen(r, r_s, g):
+        return 1.0 - r_s * r**2 / (r**2 + g**2)**1.5
+
+A sweep draws parameter sets (Cartesian grid or Latin hypercube), splits
+them into chunks, fans the chunks out over a process pool and writes each
+finished chunk to <out_dir>/part_NNNNN.npz as soon as it completes — the
+parent never holds more than one chunk of results.
+
+Author: Christopher Riner & Barron
+"""
+
+import math
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from symbolic_cache import load_kernels
+
+OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "output")
+
+QGModel = namedtuple("QGModel", ["name", "params", "description", "f_src", "f_func", "ranges"])
+
+MODEL_REGISTRY = {}   # name → QGModel, in registration order
+
+# Default sweep ranges by parameter name: (low, high, log-spaced?)
+PARAM_RANGES = {
+    "r_s":       (0.1, 10.0, True),
+    "r_P":       (1e-6, 0.5, True),
+    "omega":     (0.1, 10.0, True),
+    "alpha":     (0.1, 10.0, True),
+    "sigma":     (0.1, 10.0, True),
+    "c1":        (0.01, 10.0, True),
+    "floor_val": (0.01, 1.0, False),
+    "zeta_str":  (0.0, 3.0, False),     # orbit-simulator.html slider
+}
+
+
+# ═══════════════════════════════════════════════════════════════
+# REGISTRATION
+# ═══════════════════════════════════════════════════════════════
+
+def register_model(name, params, f_src=None, description="", ranges=None):
+    """
+    Register a model f(r; params).
+    With f_src: registers immediately and returns the QGModel.
+    Without:    returns a decorator for a NumPy function f(r, **params).
+    ranges overrides PARAM_RANGES for this model's sweeps.
+    """
+    if "r_s" not in params:
+        raise ValueError(f"model '{name}' must declare r_s")
+
+    def _register(f_func):
+        if name in MODEL_REGISTRY:
+            raise ValueError(f"model '{name}' is already registered")
+        MODEL_REGISTRY[name] = QGModel(name, dict(params), description, f_src,
+                                       f_func, dict(ranges or {}))
+        return f_func
+
+    if f_src is not None:
+        _register(None)
+        return MODEL_REGISTRY[name]
+    return _register
+
+
+def get_model(model):
+    """Accept a QGModel or a registered name."""
+    if isinstance(model, QGModel):
+        return model
+    try:
+        return MODEL_REGISTRY[model]
+    except KeyError:
+        raise KeyError(f"unknown model '{model}' — registered: {', '.join(MODEL_REGISTRY)}")
+
+
+def param_range(model, p):
+    return get_model(model).ranges.get(p, PARAM_RANGES.get(p))
+
+
+def slug(name):
+    """'String (GUP)' → 'string_gup',  'ζ Embedded' → 'zeta_embedded'"""
+    name = name.lower().replace("ζ", "zeta ")
+    return "_".join("".join(c if c.isascii() and c.isalnum() else " " for c in name).split())
+
+
+# ═══════════════════════════════════════════════════════════════
+# THE NINE MODELS (+ GR) — read by nine_models_kretschner.py
+# ═══════════════════════════════════════════════════════════════
+
+register_model("Standard GR", {"r_s": 1.0},
+               f_src="1 - r_s/r",
+               description="Baseline: K → ∞ at r=0")
+# Modesto (2004), Ashtekar & Bojowald (2006)
+register_model("Loop QG", {"r_s": 1.0, "r_P": 1e-4},
+               f_src="(1 - r_s/r)*(1 + r_s*r_P**2/r**3)",
+               description="Bounce replaces singularity")
+# Bonanno & Reuter (2000); ω = 118/(15π)
+register_model("Asymptotic Safety", {"r_s": 1.0, "r_P": 1e-4, "omega": 118.0 / (15.0 * math.pi)},
+               f_src="1 - r_s*r**2/(r**3 + omega*r_s*r_P**2)",
+               description="de Sitter core, G(r) → 0")
+# Nicolini, Smailagic & Spallucci (2006); √θ ~ r_P
+register_model("Non-Comm Geometry", {"r_s": 1.0, "r_P": 1e-4},
+               f_src="1 - (r_s/r)*erf(r/(2*r_P))",
+               description="Gaussian-smeared mass")
+# Adler, Chen & Santiago (2001)
+register_model("String (GUP)", {"r_s": 1.0, "r_P": 1e-4, "alpha": 1.0},
+               f_src="1 - r_s/(r + alpha*r_P**2/r)",
+               description="Minimum length from uncertainty")
+# Sorkin (2003); floor from the Benford conformance threshold
+register_model("Causal Sets", {"r_s": 1.0, "floor_val": 0.4068},
+               f_src="Piecewise((r**4/floor_val, (r**4 < floor_val) & (r < r_s)), (1 - r_s/r, True))",
+               description="Volume floor at det = 0.4068")
+# Ambjørn, Jurkiewicz & Loll (2005)
+register_model("CDT", {"r_s": 1.0, "r_P": 1e-4},
+               f_src="1 - (r_s/r)*r**2/(r**2 + r_P**2)",
+               description="Running spectral dimension")
+# Penrose (1967)
+register_model("Twistor Theory", {"r_s": 1.0, "r_P": 1e-4},
+               f_src="1 - r_s/r + r_P**4/(4*r**4)",
+               description="Complex plane r⁻⁴ correction")
+# Oriti (2009), Gielen & Sindoni (2016)
+register_model("Group Field Theory", {"r_s": 1.0, "r_P": 1e-4, "sigma": 1.0},
+               f_src="(1 - r_s/r)*(1 + sigma*(r_P/r)**4)",
+               description="GFT condensate correction")
+# Verlinde (2011)
+register_model("Emergent Gravity", {"r_s": 1.0, "r_P": 1e-4, "c1": 1.0},
+               f_src="1 - r_s/r + c1*r_P**2/r**2",
+               description="Entropic 1/r² correction")
+
+
+# ═══════════════════════════════════════════════════════════════
+# VECTORIZED EVALUATION
+# ═══════════════════════════════════════════════════════════════
+
+def _args(model, params):
+    """Declared parameters in order, defaults filled in."""
+    params = params or {}
+    return [params.get(p, default) for p, default in model.params.items()]
+
+
+def _fd_step(r, rel_h=1e-5, min_h=1e-20):
+    return np.maximum(np.abs(r) * rel_h, min_h)
+
+
+def model_f(model, r, params=None):
+    """f(r) for any registered model; r and params broadcast."""
+    model = get_model(model)
+    args = _args(model, params)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        if model.f_src is not None:
+            return load_kernels(model.f_src, list(model.params)).f(r, *args)
+        return model.f_func(r, *args)
+
+
+def model_fp(model, r, params=None):
+    """f'(r): exact for symbolic models, central difference otherwise."""
+    model = get_model(model)
+    args = _args(model, params)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        if model.f_src is not None:
+            return load_kernels(model.f_src, list(model.params)).fp(r, *args)
+        h = _fd_step(r)
+        return (model.f_func(r + h, *args) - model.f_func(r - h, *args)) / (2 * h)
+
+
+def model_jets(model, r, params=None):
+    """
+    (f, f', f'') on r. Symbolic models use the cached exact derivatives;
+    function models use the central-difference stencil of kretschner()
+    in nine_models_kretschner.py (three evaluations of f per point).
+    """
+    model = get_model(model)
+    args = _args(model, params)
+    r = np.asarray(r, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        if model.f_src is not None:
+            kern = load_kernels(model.f_src, list(model.params))
+            return kern.f(r, *args), kern.fp(r, *args), kern.fpp(r, *args)
+        h = _fd_step(r)
+        f0 = model.f_func(r, *args)
+        fp = model.f_func(r + h, *args)
+        fm = model.f_func(r - h, *args)
+        return f0, (fp - fm) / (2 * h), (fp - 2 * f0 + fm) / h**2
+
+
+# ═══════════════════════════════════════════════════════════════
+# PARAMETER SAMPLING
+# ═══════════════════════════════════════════════════════════════
+
+def _scale(u, lo, hi, log):
+    """Map u ∈ [0, 1] onto [lo, hi]."""
+    if log:
+        return np.exp(np.log(lo) + u * (np.log(hi) - np.log(lo)))
+    return lo + u * (hi - lo)
+
+
+def _fill(model, varying, n):
+    """Every declared parameter as an (n,) column; fixed ones at their default."""
+    cols = {p: np.full(n, float(default)) for p, default in model.params.items()}
+    cols.update(varying)
+    return cols
+
+
+def cartesian_samples(model, n_points, sweep=None):
+    """Cartesian grid with ≈ n_points over the parameters in sweep (default: all)."""
+    model = get_model(model)
+    sweep = list(sweep or model.params)
+    per_axis = max(2, int(round(n_points ** (1.0 / len(sweep)))))
+    u = np.linspace(0.0, 1.0, per_axis)
+    axes = [_scale(u, *param_range(model, p)) for p in sweep]
+    mesh = np.meshgrid(*axes, indexing="ij")
+    return _fill(model, {p: m.ravel() for p, m in zip(sweep, mesh)}, mesh[0].size)
+
+
+def latin_hypercube_samples(model, n_points, sweep=None, seed=0):
+    """Latin hypercube: each axis split into n_points strata, one sample per stratum."""
+    model = get_model(model)
+    sweep = list(sweep or model.params)
+    rng = np.random.default_rng(seed)
+    varying = {}
+    for p in sweep:
+        u = (rng.permutation(n_points) + rng.random(n_points)) / n_points
+        varying[p] = _scale(u, *param_range(model, p))
+    return _fill(model, varying, n_points)
+
+
+# ═══════════════════════════════════════════════════════════════
+# SWEEP RUNNER
+# ═══════════════════════════════════════════════════════════════
+
+def kretschner_task(model_name, params, radii=(2.0, 1.01, 0.5, 0.1, 0.01, 1e-3, 1e-4)):
+    """
+    Default sweep task: K at fixed radii (in units of r_s) for every
+    parameter set. Returns {"K": (n, n_radii), "K_peak": (n,)}.
+    """
+    u = np.asarray(radii, dtype=float)[None, :]
+    col = {k: v[:, None] for k, v in params.items()}
+    r = col["r_s"] * u
+    f, fp, fpp = model_jets(model_name, r, col)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        K = fpp**2 + 4 * fp**2 / r**2 + 4 * (1 - f)**2 / r**4
+    return {"K": K, "K_peak": np.nanmax(np.where(np.isfinite(K), K, np.nan), axis=1)}
+
+
+def _run_chunk(task, model_name, params, task_kwargs):
+    out = task(model_name, params, **task_kwargs)
+    out.update(params)
+    return out
+
+
+def run_sweep(model_name, samples, task=kretschner_task, out_dir=None,
+              workers=None, chunk=5000, verbose=False, **task_kwargs):
+    """
+    Run task(model_name, params_chunk, **task_kwargs) → {column: array}
+    over every chunk of samples on a process pool. Each finished chunk is
+    written to out_dir/part_NNNNN.npz (parameters + task columns) as soon
+    as it completes. Returns the list of part paths in chunk order.
+    Workers look the model up by name in their own import of this module,
+    so a model registered at runtime (in a script's __main__) is only
+    visible to them under fork — sweep it with workers=1.
+    """
+    model = get_model(model_name)
+    out_dir = out_dir or os.path.join(OUTPUT_DIR, "sweep_" + slug(model.name))
+    os.makedirs(out_dir, exist_ok=True)
+    for stale in os.listdir(out_dir):
+        if stale.startswith("part_") and stale.endswith(".npz"):
+            os.remove(os.path.join(out_dir, stale))
+    if model.f_src is not None:
+        load_kernels(model.f_src, list(model.params))   # derive once; workers hit the cache
+
+    total = len(next(iter(samples.values())))
+    starts = range(0, total, chunk)
+    paths = [os.path.join(out_dir, f"part_{i:05d}.npz") for i in range(len(starts))]
+    t0 = time.perf_counter()
+
+    def _save(idx, cols):
+        np.savez(paths[idx], **cols)
+        if verbose:
+            print(f"    chunk {idx + 1}/{len(paths)} written  ({time.perf_counter() - t0:.2f} s)")
+
+    pieces = [{k: v[s:s + chunk] for k, v in samples.items()} for s in starts]
+    if workers == 1 or len(pieces) == 1:
+        for idx, params in enumerate(pieces):
+            _save(idx, _run_chunk(task, model.name, params, task_kwargs))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(_run_chunk, task, model.name, params, task_kwargs): idx
+                       for idx, params in enumerate(pieces)}
+            for fut in as_completed(futures):
+                _save(futures[fut], fut.result())
+    return paths
+
+
+def load_sweep(out_dir):
+    """Concatenate every part_NNNNN.npz in out_dir (chunk order) → {column: array}."""
+    parts = sorted(p for p in os.listdir(out_dir) if p.startswith("part_") and p.endswith(".npz"))
+    cols = {}
+    for name in parts:
+        with np.load(os.path.join(out_dir, name)) as data:
+            for k in data.files:
+                cols.setdefault(k, []).append(data[k])
+    return {k: np.concatenate(v) for k, v in cols.items()}
+
+
+# ═══════════════════════════════════════════════════════════════
+# RUN
+# ═══════════════════════════════════════════════════════════════
+
+if __name__ == "__main__":
+    # Plug-in example: a model registered from a plain NumPy function
+    @register_model("Bardeen", {"r_s": 1.0, "g": 1e-2},
+                    description="Magnetic-monopole regular core",
+                    ranges={"g": (1e-4, 0.3, True)})
+    def f_bardeen(r, r_s, g):
+        return 1.0 - r_s * r**2 / (r**2 + g**2)**1.5
+
+    print()
+    print("=" * 120)
+    print("  QUANTUM GRAVITY MODEL REGISTRY")
+    print("=" * 120)
+    print()
+    print(f"  {'Model':<22s} {'kind':<10s} {'parameters'}")
+    print(f"  {'─'*22} {'─'*10} {'─'*70}")
+    for m in MODEL_REGISTRY.values():
+        kind = "symbolic" if m.f_src is not None else "function"
+        pstr = ", ".join(f"{k}={v:g}" for k, v in m.params.items())
+        print(f"  {m.name:<22s} {kind:<10s} {pstr}")
+
+    # ─── TEST 1: DEFAULTS REPRODUCE nine_models_kretschner.py ──
+    print()
+    print("─" * 120)
+    print("  TEST 1: K AT DEFAULT PARAMETERS (compare with the COMPARISON MATRIX)")
+    print("─" * 120)
+    print()
+    radii = (2.0, 1.01, 0.5, 0.1, 0.01, 1e-3, 1e-4)
+    header = f"  {'Model':<22s}" + "".join(f"{'r=' + format(r, 'g'):<12s}" for r in radii)
+    print(header)
+    print("  " + "─" * (22 + 12 * len(radii)))
+    for m in MODEL_REGISTRY.values():
+        defaults = {k: np.array([v]) for k, v in m.params.items()}
+        K = kretschner_task(m.name, defaults, radii)["K"][0]
+        print(f"  {m.name:<22s}" + "".join(f"{k:<12.3e}" for k in K))
+
+    # ─── TEST 2: SWEEPS ────────────────────────────────────────
+    print()
+    print("─" * 120)
+    print("  TEST 2: PARALLEL SWEEPS, STREAMED TO DISK")
+    print("─" * 120)
+    print()
+    runs = [    # Bardeen is registered above, so it runs in-process (see run_sweep)
+        ("Loop QG", "cartesian", cartesian_samples("Loop QG", 40000), None),
+        ("String (GUP)", "LHS", latin_hypercube_samples("String (GUP)", 40000, seed=1), None),
+        ("Bardeen", "LHS", latin_hypercube_samples("Bardeen", 40000, sweep=["g"], seed=2), 1),
+    ]
+    print(f"  {'Model':<22s} {'design':<11s} {'sets':<10s} {'parts':<7s} {'time':<9s} {'median K_peak':<16s} {'directory'}")
+    print(f"  {'─'*22} {'─'*11} {'─'*10} {'─'*7} {'─'*9} {'─'*16} {'─'*30}")
+    for name, design, samples, workers in runs:
+        out_dir = os.path.join(OUTPUT_DIR, "sweep_" + slug(name))
+        t0 = time.perf_counter()
+        paths = run_sweep(name, samples, out_dir=out_dir, workers=workers)
+        dt = time.perf_counter() - t0
+        cols = load_sweep(out_dir)
+        n = len(cols["r_s"])
+        print(f"  {name:<22s} {design:<11s} {n:<10,d} {len(paths):<7d} {dt:<9.2f} "
+              f"{np.nanmedian(cols['K_peak']):<16.4e} {os.path.relpath(out_dir)}")
+    print()
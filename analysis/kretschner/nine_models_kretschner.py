@@ -7,12 +7,14 @@ Since Benford conformance holds for all 9 models through to the singularity
 
 Each QG model modifies f(r) differently near the singularity.
 K = f''² + 4f'²/r² + 4(1-f)²/r⁴ reveals which models resolve r = 0.
+The models are the MODEL_REGISTRY entries of model_registry.py, with
+r_s and r_P set below and every other parameter at its default.
 
 Author: Christopher Riner & Barron
 Date: February 25, 2026
 """
 
-import math
+from model_registry import MODEL_REGISTRY, model_f
 
 # ═══════════════════════════════════════════════════════════════
 # CONSTANTS (Planck units for QG corrections)
@@ -26,162 +28,15 @@ GAMMA = 0.5772156649  # Euler-Mascheroni constant
 
 
 # ═══════════════════════════════════════════════════════════════
-# THE 9 MODELS — each defines f(r) and a description
+# THE 9 MODELS — f(r), parameters and references live in model_registry.py
 # ═══════════════════════════════════════════════════════════════
 
-def f_standard_gr(r):
-    """Standard Schwarzschild: f = 1 - r_s/r"""
-    return 1.0 - r_s / r
+def _registered(name):
+    """f(r) of a registered model at r_s, r_P above (other parameters at their defaults), as a float."""
+    return lambda r: float(model_f(name, r, {"r_s": r_s, "r_P": r_P}))
 
 
-def f_loop_qg(r):
-    """
-    Loop Quantum Gravity: singularity replaced by bounce.
-    Effective metric from LQG polymer quantization:
-      f(r) = (1 - r_s/r) × (1 + r_s·r_P²/r³)
-    The correction factor makes f > 0 at small r → no singularity.
-    Ref: Modesto (2004), Ashtekar & Bojowald (2006)
-    """
-    return (1.0 - r_s / r) * (1.0 + r_s * r_P**2 / r**3)
-
-
-def f_asymptotic_safety(r):
-    """
-    Asymptotic Safety: running Newton's constant G(r) → 0 at UV.
-    Effective metric:
-      f(r) = 1 - r_s·r² / (r³ + ω·r_s·r_P²)
-    where ω = 118/(15π) ≈ 2.505.
-    Singularity replaced by de Sitter core.
-    Ref: Bonanno & Reuter (2000)
-    """
-    omega = 118.0 / (15.0 * math.pi)
-    return 1.0 - r_s * r**2 / (r**3 + omega * r_s * r_P**2)
-
-
-def f_noncommutative(r):
-    """
-    Non-Commutative Geometry: point mass smeared into Gaussian.
-    Effective metric:
-      f(r) = 1 - (r_s/r) × erf(r / (2√θ))
-    where √θ ~ r_P (non-commutativity scale).
-    Singularity replaced by finite-density core.
-    Ref: Nicolini, Smailagic & Spallucci (2006)
-    """
-    theta = r_P
-    # erf approximation (good to ~10⁻⁷)
-    x = r / (2.0 * theta)
-    # Use math.erf
-    return 1.0 - (r_s / r) * math.erf(x)
-
-
-def f_string_gup(r):
-    """
-    String Theory (GUP correction): minimum length from generalized
-    uncertainty principle.
-      f(r) = 1 - r_s / (r + α·r_P²/r)
-    where α ~ O(1) is the string tension parameter.
-    The effective radius r_eff = r + α·r_P²/r > 0 always.
-    Ref: Adler, Chen & Santiago (2001)
-    """
-    alpha = 1.0
-    r_eff = r + alpha * r_P**2 / r
-    return 1.0 - r_s / r_eff
-
-
-def f_causal_sets(r):
-    """
-    Causal Set Theory: discrete spacetime with minimum volume element.
-    Metric identical to Schwarzschild but with volume floor:
-      det(g_spatial) ≥ ε_vol
-    When floor activates, g_rr is modified to prevent total collapse.
-    Floor value: 0.4068 (from Benford conformance threshold).
-    Ref: Sorkin (2003), Riner Paper #1
-    """
-    f_gr = 1.0 - r_s / r
-    if abs(f_gr) < 1e-30:
-        return f_gr
-
-    # Check if floor is needed
-    g_rr = 1.0 / f_gr if f_gr != 0 else 1e30
-    det_spatial = r**4  # r² × r² (θ and φ components)
-    FLOOR_VAL = 0.4068
-
-    if abs(det_spatial) < FLOOR_VAL and r < r_s:
-        # Floor activates: effective f modified
-        # g_rr_mod = FLOOR_VAL / r⁴
-        # f_mod = 1 / g_rr_mod = r⁴ / FLOOR_VAL
-        return r**4 / FLOOR_VAL
-    return f_gr
-
-
-def f_cdt(r):
-    """
-    Causal Dynamical Triangulations: spectral dimension runs from
-    4 at large scales to ~2 at Planck scale.
-    Effective metric picks up a running-dimension correction:
-      f(r) = 1 - r_s/r × (r²/(r² + r_P²))
-    The correction smoothly reduces to GR at large r and
-    weakens gravity at small r (fewer effective dimensions).
-    Ref: Ambjørn, Jurkiewicz & Loll (2005)
-    """
-    dim_factor = r**2 / (r**2 + r_P**2)
-    return 1.0 - (r_s / r) * dim_factor
-
-
-def f_twistor(r):
-    """
-    Twistor Theory: metric naturally extends to complex plane.
-    On the real line, the leading correction is:
-      f(r) = 1 - r_s/r + r_P⁴/(4r⁴)
-    The r⁻⁴ correction from the complex structure prevents
-    f from diverging negatively at small r.
-    Ref: Penrose (1967), inspired by twistor string theory
-    """
-    return 1.0 - r_s / r + r_P**4 / (4.0 * r**4)
-
-
-def f_group_field(r):
-    """
-    Group Field Theory: condensate correction from GFT.
-    Similar to LQG but with different power:
-      f(r) = (1 - r_s/r) × (1 + σ·(r_P/r)⁴)
-    where σ ~ O(1) is the condensate parameter.
-    Higher-power correction than LQG.
-    Ref: Oriti (2009), Gielen & Sindoni (2016)
-    """
-    sigma = 1.0
-    return (1.0 - r_s / r) * (1.0 + sigma * (r_P / r)**4)
-
-
-def f_emergent_gravity(r):
-    """
-    Emergent/Entropic Gravity (Verlinde): leading entropic correction.
-      f(r) = 1 - r_s/r + c₁·r_P²/r²
-    where c₁ ~ O(1) is the entropic coefficient.
-    The 1/r² correction from thermodynamic origin modifies
-    near-horizon and near-singularity behavior.
-    Ref: Verlinde (2011)
-    """
-    c1 = 1.0
-    return 1.0 - r_s / r + c1 * r_P**2 / r**2
-
-
-# ═══════════════════════════════════════════════════════════════
-# ALL MODELS
-# ═══════════════════════════════════════════════════════════════
-
-MODELS = [
-    ("Standard GR",       f_standard_gr,       "Baseline: K → ∞ at r=0"),
-    ("Loop QG",           f_loop_qg,           "Bounce replaces singularity"),
-    ("Asymptotic Safety", f_asymptotic_safety,  "de Sitter core, G(r) → 0"),
-    ("Non-Comm Geometry", f_noncommutative,     "Gaussian-smeared mass"),
-    ("String (GUP)",      f_string_gup,         "Minimum length from uncertainty"),
-    ("Causal Sets",       f_causal_sets,        "Volume floor at det = 0.4068"),
-    ("CDT",               f_cdt,                "Running spectral dimension"),
-    ("Twistor Theory",    f_twistor,            "Complex plane r⁻⁴ correction"),
-    ("Group Field Theory",f_group_field,         "GFT condensate correction"),
-    ("Emergent Gravity",  f_emergent_gravity,    "Entropic 1/r² correction"),
-]
+MODELS = [(m.name, _registered(m.name), m.description) for m in MODEL_REGISTRY.values()]
 
 
 # ═══════════════════════════════════════════════════════════════
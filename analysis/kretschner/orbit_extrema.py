@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Batch ISCO, Marginally Bound Orbit, Photon Sphere and Shadow Radius
+===================================================================
+For ds² = -A dt² + B dr² + C dφ² (any spacetime in spacetimes.py),
+circular geodesics follow from A and C alone:
+
+    D(r) = A C' - A' C
+    E²   = A² C' / D,    L² = C² A' / D,    Ω² = (dφ/dt)² = A' / C'
+
+    photon sphere     r_ph :  D = 0                 (outermost root)
+    shadow radius     b_c  :  √(C/A) at r_ph        (critical impact parameter)
+    ISCO              r_isco: inner edge of the outermost band of stable
+                              orbits (D > 0, L² > 0, dL²/dr > 0); dL²/dr = 0 in GR
+    marginally bound  r_mb :  E² = 1                (r_ph < r < r_isco)
+
+Schwarzschild check: r_ph = 1.5 r_s, b_c = (3√3/2) r_s, r_isco = 3 r_s,
+r_mb = 2 r_s, E_isco = √(8/9).
+
+Every parameter point of a (mass × model-parameter) grid is solved in one
+vectorized pass: A, C and their derivatives are sampled on a log grid in
+r/r_h (over 10⁻³ … 10³ r_s where there is no horizon), sign changes
+bracket the outermost roots and all brackets are bisected together
+(dL²/dr by central differences of L²). Sign changes across a jump (the
+Causal Sets floor, the s = 1.001 clamp of the orbit simulator) are
+rejected, as in horizons.py.
+
+Usage:
+    python3 orbit_extrema.py                  # ~2000 points per spacetime
+    python3 orbit_extrema.py --points 100000
+
+Author: Christopher Riner & Barron
+"""
+
+import json
+import math
+import os
+import sys
+import time
+
+import numpy as np
+
+from model_registry import slug
+from spacetimes import SPACETIMES, get_spacetime, horizon_radius, metric_functions, spacetime_samples
+
+OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "output")
+
+U_GRID = np.geomspace(1e-6, 1e3, 1024)     # r / r_h - 1 sample points for bracketing
+R_RANGE_NO_HORIZON = (1e-3, 1e3)            # × r_s: absolute grid where there is no horizon
+BISECT_STEPS = 60
+FD_REL_STEP = 1e-5                          # relative step for dL²/dr
+CHUNK = 2000
+
+RESULT_COLUMNS = ["r_horizon", "r_ph", "b_c", "r_isco", "E_isco", "L_isco", "Omega_isco", "r_mb"]
+
+
+# ═══════════════════════════════════════════════════════════════
+# CIRCULAR-ORBIT FUNCTIONS
+# ═══════════════════════════════════════════════════════════════
+
+def circular_orbit(spacetime, r, params=None):
+    """(D, E², L², Ω²) of circular geodesics at r; inf/negative where none exist."""
+    A, dA, _, _, C, dC = metric_functions(spacetime, r, params)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        D = A * dC - dA * C
+        return D, A**2 * dC / D, C**2 * dA / D, dA / dC
+
+
+def _photon(st, r, params):
+    return circular_orbit(st, r, params)[0]
+
+
+def _dL2(st, r, params):
+    h = FD_REL_STEP * r
+    return (circular_orbit(st, r + h, params)[2] - circular_orbit(st, r - h, params)[2]) / (2 * h)
+
+
+def _stable(st, r, params):
+    """+1 where a stable circular orbit exists (D > 0, L² > 0, dL²/dr > 0), else -1."""
+    D, _, L2, _ = circular_orbit(st, r, params)
+    return np.where((D > 0) & (L2 > 0) & (_dL2(st, r, params) > 0), 1.0, -1.0)
+
+
+def _E2_minus_1(st, r, params):
+    return circular_orbit(st, r, params)[1] - 1.0
+
+
+# ═══════════════════════════════════════════════════════════════
+# ROOT FINDING
+# ═══════════════════════════════════════════════════════════════
+
+def _outermost_root(fn, st, r, g, params, continuous=True):
+    """
+    Largest r at which g changes sign between neighbouring grid points
+    (row by row), refined by geometric bisection of fn(st, r, params).
+    r, g: (n, m) grids; params: {name: (n,)}. NaN where there is no root.
+    For continuous g, sign changes across a jump (|g| stays O(1) on both
+    sides of the converged bracket) are rejected.
+    """
+    n = r.shape[0]
+    cross = (np.sign(g[:, :-1]) * np.sign(g[:, 1:]) < 0) & np.isfinite(g[:, :-1]) & np.isfinite(g[:, 1:])
+    has = cross.any(axis=1)
+    row = np.nonzero(has)[0]
+    j = cross.shape[1] - 1 - np.argmax(cross[row, ::-1], axis=1)
+
+    lo, hi = r[row, j], r[row, j + 1]
+    g_lo, g_hi = g[row, j], g[row, j + 1]
+    scale = np.maximum(np.abs(g_lo), np.abs(g_hi))
+    sub = {k: v[row] for k, v in params.items()}
+    for _ in range(BISECT_STEPS):
+        mid = np.sqrt(lo * hi)
+        g_mid = fn(st, mid, sub)
+        left = np.sign(g_mid) == np.sign(g_lo)
+        lo, g_lo = np.where(left, mid, lo), np.where(left, g_mid, g_lo)
+        hi, g_hi = np.where(left, hi, mid), np.where(left, g_hi, g_mid)
+
+    if continuous:
+        genuine = np.maximum(np.abs(g_lo), np.abs(g_hi)) <= 1e-6 * scale
+        row, lo, hi = row[genuine], lo[genuine], hi[genuine]
+    root = np.full(n, np.nan)
+    root[row] = np.sqrt(lo * hi)
+    return root
+
+
+def orbit_extrema(spacetime, params=None, u_grid=U_GRID):
+    """
+    Photon sphere, shadow radius, ISCO and marginally bound orbit for a
+    batch of parameter points. params: {name: (n,) array or scalar}.
+    Returns {column: (n,) array} over RESULT_COLUMNS.
+    """
+    st = get_spacetime(spacetime)
+    full = {k: np.atleast_1d(np.asarray(v, dtype=float))
+            for k, v in dict(st.params, **(params or {})).items()}
+    shape = np.broadcast(*full.values()).shape
+    full = {k: np.broadcast_to(v, shape).ravel().copy() for k, v in full.items()}
+
+    r_h = horizon_radius(st, full)
+    no_horizon = ~np.isfinite(r_h)
+    base = np.where(no_horizon, R_RANGE_NO_HORIZON[0] * full["r_s"], r_h)
+    exterior = np.geomspace(*R_RANGE_NO_HORIZON, u_grid.size)
+    r = np.where(no_horizon[:, None], full["r_s"][:, None] * exterior[None, :],
+                 r_h[:, None] * (1.0 + u_grid[None, :]))
+    col = {k: v[:, None] for k, v in full.items()}
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        D, E2, _, _ = circular_orbit(st, r, col)
+        r_ph = _outermost_root(_photon, st, r, D, full)
+
+        # Inner edge of the outermost band of stable circular orbits: dL²/dr = 0
+        # in GR, but L² → 0 (A' = 0) or a kink of f where L² has no minimum
+        r_isco = _outermost_root(_stable, st, r, _stable(st, r, col), full, continuous=False)
+
+        outside = r > np.fmax(r_ph, base)[:, None]
+        between = outside & (r < r_isco[:, None]) & (E2 > 0)
+        r_mb = _outermost_root(_E2_minus_1, st, r, np.where(between, E2 - 1.0, np.nan), full)
+
+        A_ph, _, _, _, C_ph, _ = metric_functions(st, r_ph, full)
+        _, E2_i, L2_i, W2_i = circular_orbit(st, r_isco, full)
+        return {
+            "r_horizon": r_h,
+            "r_ph": r_ph,
+            "b_c": np.where(A_ph > 0, np.sqrt(C_ph / A_ph), np.nan),
+            "r_isco": r_isco,
+            "E_isco": np.sqrt(E2_i),
+            "L_isco": np.sqrt(L2_i),
+            "Omega_isco": np.sqrt(W2_i),
+            "r_mb": r_mb,
+        }
+
+
+def orbit_extrema_grid(spacetime, samples, chunk=CHUNK):
+    """orbit_extrema over a large parameter grid, chunk by chunk; samples are returned alongside."""
+    total = len(next(iter(samples.values())))
+    parts = []
+    for s in range(0, total, chunk):
+        parts.append(orbit_extrema(spacetime, {k: v[s:s + chunk] for k, v in samples.items()}))
+    out = {k: np.concatenate([p[k] for p in parts]) for k in RESULT_COLUMNS}
+    out.update(samples)
+    return out
+
+
+# ═══════════════════════════════════════════════════════════════
+# RUN
+# ═══════════════════════════════════════════════════════════════
+
+if __name__ == "__main__":
+    n_points = int(sys.argv[sys.argv.index("--points") + 1]) if "--points" in sys.argv else 2000
+
+    print()
+    print("=" * 120)
+    print("  ISCO, MARGINALLY BOUND ORBIT, PHOTON SPHERE AND SHADOW RADIUS")
+    print("  D = AC' - A'C,  E² = A²C'/D,  L² = C²A'/D")
+    print("=" * 120)
+
+    # ─── TEST 1: SCHWARZSCHILD ──────────────────────────────────
+    print()
+    print("─" * 120)
+    print("  TEST 1: SCHWARZSCHILD — r_ph = 1.5, b_c = 3√3/2, r_isco = 3, r_mb = 2, E_isco = √(8/9)   (r_s = 1)")
+    print("─" * 120)
+    print()
+    res = orbit_extrema("Standard GR", {"r_s": np.array([1.0, 10.0])})
+    exact = {"r_ph": 1.5, "b_c": 1.5 * math.sqrt(3), "r_isco": 3.0, "r_mb": 2.0,
+             "E_isco": math.sqrt(8 / 9), "L_isco": math.sqrt(3), "Omega_isco": 1 / math.sqrt(54)}
+    print(f"  {'quantity':<12s} {'r_s = 1':<20s} {'exact':<20s} {'rel err':<10s} {'r_s = 10 (÷ r_s)':<20s}")
+    print(f"  {'─'*12} {'─'*20} {'─'*20} {'─'*10} {'─'*20}")
+    for k, v in exact.items():
+        scaled = res[k][1] / 10.0 if k in ("r_ph", "b_c", "r_isco", "r_mb", "L_isco") else res[k][1]
+        scaled = scaled * 10.0 if k == "Omega_isco" else scaled
+        print(f"  {k:<12s} {res[k][0]:<20.14f} {v:<20.14f} {abs(res[k][0] / v - 1):<10.2e} {scaled:<20.14f}")
+
+    print()
+    print("  No horizon: at r_s = 0.1, floor 0.01 the Causal Sets f jumps over zero at r = r_s (no horizon)")
+    print("  but the exterior is Schwarzschild, so the orbits must not move; the NC point is stable down")
+    print("  to the centre (no ISCO). Lengths ÷ r_s:")
+    print()
+    print(f"  {'point':<40s} {'r_h':<8s} {'r_ph':<12s} {'b_c':<12s} {'r_mb':<12s} {'r_isco':<12s} {'E_isco':<12s}")
+    print(f"  {'─'*40} {'─'*8} {'─'*12} {'─'*12} {'─'*12} {'─'*12} {'─'*12}")
+    for name, params in [("Causal Sets", {"r_s": 0.1, "floor_val": 0.01}), ("Non-Comm Geometry", {"r_P": 0.62})]:
+        res = orbit_extrema(name, params)
+        rs = params.get("r_s", 1.0)
+        label = f"{name}, " + ", ".join(f"{k} = {v:g}" for k, v in params.items())
+        print(f"  {label:<40s} {res['r_horizon'][0] / rs:<8.3g} {res['r_ph'][0] / rs:<12.8f} "
+              f"{res['b_c'][0] / rs:<12.8f} {res['r_mb'][0] / rs:<12.8f} {res['r_isco'][0] / rs:<12.8f} "
+              f"{res['E_isco'][0]:<12.8f}")
+
+    # ─── TEST 2: DEFAULTS, EVERY SPACETIME ──────────────────────
+    print()
+    print("─" * 120)
+    print("  TEST 2: EVERY SPACETIME AT ITS DEFAULT PARAMETERS (r_s = 1)")
+    print("─" * 120)
+    print()
+    print(f"  {'Spacetime':<22s} {'r_h':<12s} {'r_ph':<12s} {'b_c':<12s} {'r_mb':<12s} {'r_isco':<12s} "
+          f"{'E_isco':<12s} {'1 - E_isco':<12s}")
+    print(f"  {'─'*22} {'─'*12} {'─'*12} {'─'*12} {'─'*12} {'─'*12} {'─'*12} {'─'*12}")
+    table = {}
+    for name in SPACETIMES:
+        res = orbit_extrema(name)
+        table[name] = {k: float(v[0]) for k, v in res.items()}
+        print(f"  {name:<22s} {res['r_horizon'][0]:<12.8f} {res['r_ph'][0]:<12.8f} {res['b_c'][0]:<12.8f} "
+              f"{res['r_mb'][0]:<12.8f} {res['r_isco'][0]:<12.8f} {res['E_isco'][0]:<12.8f} "
+              f"{1 - res['E_isco'][0]:<12.6f}")
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    json_path = os.path.join(OUTPUT_DIR, "orbit_extrema.json")
+    with open(json_path, "w", encoding="utf-8") as fh:
+        json.dump({"units": "r_s = 1", "spacetimes": table}, fh, indent=1)
+    print()
+    print(f"  → {os.path.relpath(json_path)}")
+
+    # ─── TEST 3: PARAMETER GRIDS ────────────────────────────────
+    print()
+    print("─" * 120)
+    print(f"  TEST 3: PARAMETER GRIDS (~{n_points:,} points per spacetime, one vectorized pass per chunk)")
+    print("─" * 120)
+    print()
+    print(f"  {'Spacetime':<22s} {'points':<8s} {'r_isco/r_s range':<24s} {'b_c/r_s range':<24s} "
+          f"{'no ISCO':<8s} {'time':<8s} {'file'}")
+    print(f"  {'─'*22} {'─'*8} {'─'*24} {'─'*24} {'─'*8} {'─'*8} {'─'*30}")
+    for name in SPACETIMES:
+        samples = spacetime_samples(name, n_points)
+        t0 = time.perf_counter()
+        res = orbit_extrema_grid(name, samples)
+        dt = time.perf_counter() - t0
+        path = os.path.join(OUTPUT_DIR, f"orbit_extrema_{slug(name)}.npz")
+        np.savez(path, **res)
+        x = res["r_isco"] / res["r_s"]
+        b = res["b_c"] / res["r_s"]
+        with np.errstate(invalid="ignore"):
+            xr = f"{np.nanmin(x):.6f} – {np.nanmax(x):.6f}" if np.isfinite(x).any() else "—"
+            br = f"{np.nanmin(b):.6f} – {np.nanmax(b):.6f}" if np.isfinite(b).any() else "—"
+        print(f"  {name:<22s} {x.size:<8d} {xr:<24s} {br:<24s} {int(np.sum(~np.isfinite(x))):<8d} "
+              f"{dt:<8.2f} {os.path.relpath(path)}")
+    print()
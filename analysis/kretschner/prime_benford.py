@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Benford Statistics of Prime-Derived Sequences — Streaming Segmented Sieve
+=========================================================================
+The premise ties primes to ζ through the Euler product, and ζ to Benford
+through ε_B, but the scripts only ever take digits of ζ-derived metric
+values. Here the sequences built from the primes themselves are measured
+directly:
+
+  p                        the primes
+  p^-s                     the Dirichlet terms over primes, s ∈ S_VALUES
+  (1 - p^-s)⁻¹             Euler factors (for s ≥ 1 in (1, 2]: digit 1 only)
+  (1 - p^-s)⁻¹ - 1         = 1/(p^s - 1), the part that carries digits
+  p#                       primorial, ∏_{q ≤ p} q
+  ∏_{q ≤ p} (1 - q^-s)⁻¹   partial Euler products (→ ζ(s) for s > 1)
+
+Primes come from a segmented sieve of Eratosthenes over odd numbers
+(SEGMENT odd numbers per segment, marked by the base primes ≤ √N), one
+segment per task, so a worker holds one segment however far the sieve
+goes. Each segment is transformed with vectorized kernels into a
+BenfordAccumulator per sequence, and the accumulators merge exactly in
+any order across processes.
+
+The partial products are taken in log space, log₁₀ Π = offset + cumsum
+of the segment's log₁₀ terms, and their digits read from 10^frac (nudged
+a few ulps up, so 2·3·5 = 30 reads 3, not 2.999…). The
+offset of a segment is the sum over all earlier primes, so a first pass
+sieves for the per-segment counts and log sums only and the second pass
+does everything else; log₁₀ p# reaches 4·10⁸ at p ≈ 10⁹, so its mantissa
+is good to ~10⁻⁷.
+
+Usage:
+    python3 prime_benford.py                        # first 10⁷ primes
+    python3 prime_benford.py --n-primes 50000000    # p up to ≈ 9.8·10⁸
+
+Author: Christopher Riner & Barron
+"""
+
+import math
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from fractions import Fraction
+from functools import reduce
+
+import numpy as np
+
+from benford_bases import ULP_GUARD
+from benford_numpy import BenfordAccumulator, bridge_factor, digit_counts
+from benford_significance import null_quantiles
+
+S_VALUES = (0.5, 1.0, 2.0)
+SEGMENT = 1 << 24                        # odd numbers per segment: 2²⁵ integers, 16 MB of flags
+LN10 = math.log(10.0)
+
+
+# ═══════════════════════════════════════════════════════════════
+# SEGMENTED SIEVE
+# ═══════════════════════════════════════════════════════════════
+
+def prime_bound(n):
+    """An upper bound on the n-th prime: n(ln n + ln ln n) for n ≥ 6 (Rosser)."""
+    if n < 6:
+        return 13
+    return int(n * (math.log(n) + math.log(math.log(n)))) + 1
+
+
+def base_primes(limit):
+    """All primes ≤ limit, from a plain odd-only sieve."""
+    if limit < 2:
+        return np.zeros(0, dtype=np.int64)
+    odd = np.ones((limit - 1) // 2, dtype=bool)             # 3, 5, 7, … ≤ limit
+    for i in range((math.isqrt(limit) - 1) // 2):
+        if odd[i]:
+            p = 2 * i + 3
+            odd[(p * p - 3) // 2::p] = False
+    return np.concatenate([[2], 2 * np.flatnonzero(odd) + 3]).astype(np.int64)
+
+
+def segment_primes(lo, hi, base):
+    """Primes in [lo, hi) given the base primes up to √hi."""
+    first = lo | 1                                          # first odd number ≥ lo
+    flags = np.ones(max(0, (hi - first + 1) // 2), dtype=bool)
+    for p in base[1:]:
+        p = int(p)
+        if p * p >= hi:
+            break
+        start = max(p * p, -(-first // p) * p)
+        if start % 2 == 0:
+            start += p
+        flags[(start - first) // 2::p] = False
+    primes = first + 2 * np.flatnonzero(flags).astype(np.int64)
+    if lo <= 1 < hi:
+        primes = primes[primes > 1]
+    if lo <= 2 < hi:
+        primes = np.concatenate([[2], primes])
+    return primes
+
+
+def segments(limit, size=SEGMENT):
+    """[lo, hi) bounds covering 0 … limit, 2·size integers each."""
+    return [(lo, min(lo + 2 * size, limit + 1)) for lo in range(0, limit + 1, 2 * size)]
+
+
+# ═══════════════════════════════════════════════════════════════
+# SEQUENCES
+# ═══════════════════════════════════════════════════════════════
+
+def sequence_names(s_values=S_VALUES):
+    """Every sequence measured, direct ones first, then the partial products."""
+    direct = ["p"] + [f"{kind} s={s:g}" for kind in ("p^-s", "euler", "euler-1") for s in s_values]
+    return direct + ["p#"] + [f"Π euler s={s:g}" for s in s_values]
+
+
+def direct_terms(p, s_values=S_VALUES):
+    """{name: values} for p, p^-s, (1 - p^-s)⁻¹ and 1/(p^s - 1) of a block of primes."""
+    x = p.astype(float)
+    ln_p = np.log(x)
+    out = {"p": x}
+    for s in s_values:
+        out[f"p^-s s={s:g}"] = np.exp(-s * ln_p)
+        em1 = 1.0 / np.expm1(s * ln_p)
+        out[f"euler-1 s={s:g}"] = em1
+        out[f"euler s={s:g}"] = em1 + 1.0
+    return out
+
+
+def log_terms(p, s_values=S_VALUES):
+    """{name: log₁₀ of each factor} for the primorial and the partial Euler products."""
+    ln_p = np.log(p.astype(float))
+    out = {"p#": ln_p / LN10}
+    for s in s_values:
+        out[f"Π euler s={s:g}"] = -np.log1p(-np.exp(-s * ln_p)) / LN10
+    return out
+
+
+def _segment_sums(lo, hi, base, s_values):
+    """Pass 1 (module level for the pool): prime count and Σ log₁₀ terms of one segment."""
+    p = segment_primes(lo, hi, base)
+    return p.size, {k: float(v.sum()) for k, v in log_terms(p, s_values).items()}
+
+
+def _segment_digits(lo, hi, base, take, offsets, s_values):
+    """Pass 2: one BenfordAccumulator per sequence over the first `take` primes of [lo, hi)."""
+    p = segment_primes(lo, hi, base)[:take]
+    accs = {k: BenfordAccumulator().update(v) for k, v in direct_terms(p, s_values).items()}
+    for k, v in log_terms(p, s_values).items():
+        L = offsets[k] + np.cumsum(v)
+        accs[k] = BenfordAccumulator().update(10.0 ** np.mod(L + ULP_GUARD * (L + 1.0), 1.0))
+    return accs
+
+
+def _pool_map(fn, workers, *args):
+    if workers == 1:
+        return list(map(fn, *args))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(fn, *args))
+
+
+def prime_benford(n_primes, s_values=S_VALUES, workers=None, segment=SEGMENT):
+    """
+    Digit statistics of every sequence over the first n_primes primes.
+    Returns {n, p_max, accumulators: {name: BenfordAccumulator}}.
+    """
+    limit = prime_bound(n_primes)
+    base = base_primes(math.isqrt(limit) + 1)
+    bounds = segments(limit, segment)
+    k = len(bounds)
+    sums = _pool_map(_segment_sums, workers, *zip(*bounds), [base] * k, [s_values] * k)
+    counts = np.cumsum([c for c, _ in sums])
+    last = int(np.searchsorted(counts, n_primes))
+    takes = [None] * last + [int(n_primes - (counts[last - 1] if last else 0))]
+    offsets, running = [], dict.fromkeys(sums[0][1], 0.0)
+    for _, seg in sums[:last + 1]:
+        offsets.append(dict(running))
+        running = {key: (running[key] + seg[key]) % 1.0 for key in running}
+    m = last + 1
+    parts = _pool_map(_segment_digits, workers, *zip(*bounds[:m]), [base] * m, takes, offsets, [s_values] * m)
+    accs = {name: reduce(BenfordAccumulator.merge, [part[name] for part in parts]) for name in parts[0]}
+    p_max = int(segment_primes(*bounds[last], base)[takes[-1] - 1])
+    return {"n": n_primes, "p_max": p_max, "accumulators": accs}
+
+
+# ═══════════════════════════════════════════════════════════════
+# RUN
+# ═══════════════════════════════════════════════════════════════
+
+if __name__ == "__main__":
+    n_primes = int(float(sys.argv[sys.argv.index("--n-primes") + 1])) if "--n-primes" in sys.argv else 10_000_000
+
+    print()
+    print("=" * 100)
+    print("  BENFORD STATISTICS OF PRIME-DERIVED SEQUENCES — STREAMING SEGMENTED SIEVE")
+    print("=" * 100)
+
+    # ─── TEST 1: SIEVE AND PRODUCTS ───────────────────────────
+    print()
+    print("─" * 100)
+    print("  TEST 1: SEGMENTED SIEVE AND LOG-SPACE PRODUCTS AGAINST DIRECT COMPUTATION")
+    print("─" * 100)
+    print()
+    whole = base_primes(2_000_000)
+    base = base_primes(math.isqrt(2_000_000) + 1)
+    pieces = np.concatenate([segment_primes(lo, hi, base) for lo, hi in segments(2_000_000, 1 << 10)])
+    print(f"  primes ≤ 2·10⁶ in 977 segments of 2¹¹ integers vs one sieve: equal — {np.array_equal(pieces, whole)}")
+    t0 = time.perf_counter()
+    pi = {}
+    limit = 10**9
+    base = base_primes(math.isqrt(limit) + 1)
+    total = 0
+    for lo, hi in segments(limit):
+        total += segment_primes(lo, hi, base).size
+    dt = time.perf_counter() - t0
+    print(f"  π(10⁹) = {total:,} (known 50,847,534) — full sieve to 10⁹ in {dt:.1f} s, one process")
+
+    n_check = 800                                          # p# stays under 4300 decimal digits
+    run = prime_benford(n_check, workers=1, segment=1 << 8)
+    primes = [int(v) for v in whole[:n_check]]
+    exact = {"p#": Fraction(1), "Π euler s=1": Fraction(1), "Π euler s=2": Fraction(1)}
+    want = {k: np.zeros(9, dtype=np.int64) for k in exact}
+    for p in primes:
+        exact["p#"] *= p
+        exact["Π euler s=1"] *= Fraction(p, p - 1)
+        exact["Π euler s=2"] *= Fraction(p * p, p * p - 1)
+        for k, v in exact.items():
+            want[k][int(str(v.numerator // v.denominator)[0]) - 1] += 1
+    want["Π euler s=0.5"] = digit_counts(np.cumprod(1.0 / (1.0 - np.array(primes, dtype=float) ** -0.5)))
+    same = {k: np.array_equal(run["accumulators"][k].first, w) for k, w in want.items()}
+    print(f"  first {n_check} primes, split over {len(segments(prime_bound(n_check), 1 << 8))} segments: "
+          f"log-space product digits == exact fractions: " + ", ".join(f"{k} {v}" for k, v in same.items()))
+
+    # ─── TEST 2: THE FULL RUN ─────────────────────────────────
+    print()
+    print("─" * 100)
+    print(f"  TEST 2: FIRST {n_primes:,} PRIMES")
+    print("─" * 100)
+    print()
+    t0 = time.perf_counter()
+    run = prime_benford(n_primes)
+    dt = time.perf_counter() - t0
+    q95 = float(null_quantiles(n_primes, q=(0.95,))[0, 0])
+    print(f"  p ≤ {run['p_max']:,}; two sieve passes + {len(run['accumulators'])} sequences in {dt:.1f} s "
+          f"({n_primes / dt / 1e6:.2f} M primes/s); exact-Benford q95 at this N: δ_B = {q95:.2e}")
+    print()
+    print(f"  {'sequence':<18s} {'δ_B':<10s} {'δ_B 2nd':<10s} {'⟨m⟩':<9s} {'var m':<9s} "
+          f"{'digit 1':<9s} {'digit 9':<9s} {'Benford':<8s}")
+    print(f"  {'─'*18} {'─'*10} {'─'*10} {'─'*9} {'─'*9} {'─'*9} {'─'*9} {'─'*8}")
+    for name in sequence_names():
+        acc = run["accumulators"][name]
+        st = acc.stats()
+        f = acc.first / acc.n
+        print(f"  {name:<18s} {st['delta_B']:<10.6f} {st['delta_B_second']:<10.6f} {st['mantissa_mean']:<9.5f} "
+              f"{st['mantissa_var']:<9.5f} {f[0]:<9.5f} {f[8]:<9.5f} {'yes' if st['delta_B'] < q95 else 'no':<8s}")
+    print(f"  {'Benford':<18s} {'0':<10s} {'0':<10s} {0.5:<9.5f} {1 / 12:<9.5f} {math.log10(2):<9.5f} "
+          f"{math.log10(10 / 9):<9.5f}")
+    print()
+    print("  The primes follow their density 1/ln p, not Benford, over a range ending mid-decade; p^-s and")
+    print("  1/(p^s - 1) inherit that, and the Euler factors for s ≥ 1 sit in (1, 2]. Of the products, s = 2")
+    print("  converges to ζ(2) = 1.645 (digit 1), s = 1 grows only like e^γ ln p (Mertens) and stays on a")
+    print("  few digits, while p# and s = ½ (log Π ~ 2√p / ln p) wrap their mantissas round the circle.")
+
+    # ─── TEST 3: δ_B vs NUMBER OF PRIMES ──────────────────────
+    print()
+    print("─" * 100)
+    print("  TEST 3: δ_B AS THE PRIME COUNT GROWS, AGAINST ε_B(s)")
+    print("─" * 100)
+    print()
+    shown = ["p", "p^-s s=2", "euler-1 s=0.5", "p#", "Π euler s=0.5"]
+    print(f"  {'N primes':<12s} {'p_max':<14s} " + " ".join(f"{name:<15s}" for name in shown))
+    print(f"  {'─'*12} {'─'*14} " + " ".join("─" * 15 for _ in shown))
+    n = 1000
+    while n <= n_primes:
+        r = run if n == n_primes else prime_benford(n, workers=1, segment=min(SEGMENT, 1 << 20))
+        print(f"  {n:<12,d} {r['p_max']:<14,d} "
+              + " ".join(f"{r['accumulators'][name].stats()['delta_B']:<15.6f}" for name in shown))
+        n *= 10
+    print()
+    print("  ε_B for comparison: " + ",  ".join(f"s = {s:g}: {float(bridge_factor(s)):.4f}" for s in S_VALUES))
+    print()
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Vectorized Bose–Einstein / Fermi–Dirac Occupations over (E × T × μ)
+===================================================================
+double_slit_test.py evaluates bose_einstein and fermi_dirac one scalar at
+a time behind hand-written overflow guards (x > 500 → 0, |denominator|
+< 10⁻³⁰ → 10¹⁰). Here both are NumPy ufunc expressions, stable for every
+x = (E - μ)/T without guards:
+
+    n_BE = e⁻ˣ / (-expm1(-x))            x > 0   (no overflow, exact as x → 0⁺)
+         = 1 / expm1(x)                  x < 0   (negative: μ above E, unphysical)
+    n_FD = exp(-logaddexp(0, x))         all x   (relative accuracy down to 10⁻³⁰⁸)
+
+and broadcast, so a full (E, T, μ) grid is one call. dtype=np.float32
+halves the memory (occupations below ~10⁻³⁸ flush to zero and are then
+skipped as the legacy x > 500 cut skips them).
+
+benford_sweep pairs the occupations with benford_numpy: for every (T, μ)
+it counts the leading digits of n(E) over the energy axis, a block of
+temperatures at a time over a process pool (workers=1 stays in-process),
+and returns batched δ_B, χ², … — the grid is never held whole. Values
+are kept where 0 < n < 10¹⁰, the legacy filter, so double_slit_test.py
+TEST 1 is reproduced exactly.
+
+Usage:
+    python3 quantum_statistics.py
+
+Author: Christopher Riner & Barron
+"""
+
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from benford_numpy import benford_stats, digits_in_place
+
+OCCUPATION_CAP = 1e10                  # double_slit_test.py keeps 0 < n < 10¹⁰
+BLOCK_VALUES = 1 << 18                 # occupations per Benford block (T rows × E)
+
+
+# ═══════════════════════════════════════════════════════════════
+# OCCUPATION NUMBERS
+# ═══════════════════════════════════════════════════════════════
+
+def _reduced_energy(E, T, mu, dtype):
+    E, T, mu = (np.asarray(a, dtype=dtype) for a in (E, T, mu))
+    return (E - mu) / T
+
+
+def bose_einstein_np(E, T, mu=0.0, dtype=np.float64):
+    """1/(e^((E-μ)/T) - 1), broadcast over E, T, μ; +inf at E = μ."""
+    x = _reduced_energy(E, T, mu, dtype)
+    with np.errstate(divide="ignore", over="ignore", invalid="ignore"):
+        pos = np.exp(-np.abs(x)) / -np.expm1(-np.abs(x))
+        return np.where(x > 0, pos, 1.0 / np.expm1(x)).astype(dtype, copy=False)
+
+
+def fermi_dirac_np(E, T, mu=0.0, dtype=np.float64):
+    """1/(e^((E-μ)/T) + 1), broadcast over E, T, μ."""
+    x = _reduced_energy(E, T, mu, dtype)
+    return np.exp(-np.logaddexp(np.zeros((), dtype), x))
+
+
+OCCUPATIONS = {"boson": bose_einstein_np, "fermion": fermi_dirac_np}
+
+
+def occupation_grid(kind, E, T, mu=(0.0,), dtype=np.float32):
+    """Occupations of kind "boson" or "fermion" on the full grid, shape (n_E, n_T, n_μ)."""
+    E, T, mu = (np.atleast_1d(np.asarray(a, dtype=dtype)) for a in (E, T, mu))
+    return OCCUPATIONS[kind](E[:, None, None], T[None, :, None], mu[None, None, :], dtype)
+
+
+# ═══════════════════════════════════════════════════════════════
+# BENFORD OVER THE GRID
+# ═══════════════════════════════════════════════════════════════
+
+def _row_counts(kind, E, rows, dtype, cap):
+    """Digit counts (len(rows), 9) of n(E) for each (T, μ) row, over 0 < n < cap."""
+    n = OCCUPATIONS[kind](E[None, :], rows[:, :1], rows[:, 1:], dtype)
+    d = digits_in_place(np.where((n > 0) & (n < cap), n, 0)).astype(np.int64)
+    idx = d + 10 * np.repeat(np.arange(len(rows)), E.size)
+    return np.bincount(idx, minlength=10 * len(rows)).reshape(-1, 10)[:, 1:]
+
+
+def sweep_counts(kind, E, T, mu=(0.0,), dtype=np.float64, cap=OCCUPATION_CAP, block=BLOCK_VALUES,
+                 workers=None):
+    """
+    Leading-digit counts (n_T, n_μ, 9) of the occupations n(E) at every
+    (T, μ), over the values with 0 < n < cap — the legacy filter, which
+    also drops the negative BE values where μ > E.
+    (T, μ) rows are evaluated about `block` occupations at a time —
+    small enough to stay in cache — on a process pool unless workers=1.
+    """
+    E, T, mu = (np.atleast_1d(np.asarray(a, dtype=dtype)) for a in (E, T, mu))
+    rows = np.stack(np.meshgrid(T, mu, indexing="ij"), axis=-1).reshape(-1, 2)
+    step = max(1, block // E.size)
+    parts = [rows[lo:lo + step] for lo in range(0, rows.shape[0], step)]
+    args = ([kind] * len(parts), [E] * len(parts), parts, [dtype] * len(parts), [cap] * len(parts))
+    if workers == 1 or len(parts) == 1:
+        counts = list(map(_row_counts, *args))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            counts = list(pool.map(_row_counts, *args))
+    return np.concatenate(counts).reshape(T.size, mu.size, 9)
+
+
+def benford_sweep(kind, E, T, mu=(0.0,), dtype=np.float64, cap=OCCUPATION_CAP, block=BLOCK_VALUES,
+                  workers=None):
+    """benford_stats of every (T, μ) column of the grid, plus "counts"."""
+    counts = sweep_counts(kind, E, T, mu, dtype, cap, block, workers)
+    return {"counts": counts, **benford_stats(counts)}
+
+
+# ═══════════════════════════════════════════════════════════════
+# RUN
+# ═══════════════════════════════════════════════════════════════
+
+if __name__ == "__main__":
+    print()
+    print("=" * 100)
+    print("  VECTORIZED BOSE–EINSTEIN / FERMI–DIRAC ENGINE")
+    print("=" * 100)
+
+    def bose_einstein(E, T, mu=0):
+        """double_slit_test.py, verbatim."""
+        x = (E - mu) / T
+        if x > 500:
+            return 0.0
+        if x < -500:
+            return 1e10
+        denom = math.exp(x) - 1
+        if abs(denom) < 1e-30:
+            return 1e10
+        return 1.0 / denom
+
+    def fermi_dirac(E, T, mu=0):
+        """double_slit_test.py, verbatim."""
+        x = (E - mu) / T
+        if x > 500:
+            return 0.0
+        if x < -500:
+            return 1.0
+        return 1.0 / (math.exp(x) + 1)
+
+    # ─── TEST 1: AGAINST THE SCALAR FUNCTIONS ─────────────────
+    print()
+    print("─" * 100)
+    print("  TEST 1: double_slit_test.py TEST 1 — 5000 energies × 8 temperatures")
+    print("─" * 100)
+    print()
+    from benford_numpy import compute_delta_B
+    temperatures = np.array([0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 50.0, 100.0])
+    E = 0.01 * np.arange(1, 5001)
+    t0 = time.perf_counter()
+    legacy = {}
+    for kind, fn in (("boson", bose_einstein), ("fermion", fermi_dirac)):
+        rows = []
+        for T in temperatures:
+            vals = [v for v in (fn(e, T) for e in E) if 0 < v < 1e10]
+            rows.append((np.array(vals), compute_delta_B(vals)[0]))
+        legacy[kind] = rows
+    t_legacy = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    sweep = {kind: benford_sweep(kind, E, temperatures) for kind in OCCUPATIONS}
+    t_vec = time.perf_counter() - t0
+    print(f"  {'T':<8s} {'kind':<9s} {'max rel diff n(E)':<19s} {'δ_B scalar':<12s} {'δ_B grid':<12s} {'equal':<6s}")
+    print(f"  {'─'*8} {'─'*9} {'─'*19} {'─'*12} {'─'*12} {'─'*6}")
+    for i, T in enumerate(temperatures):
+        for kind in OCCUPATIONS:
+            vals, dB = legacy[kind][i]
+            n = OCCUPATIONS[kind](E, T)
+            n = n[(n > 0) & (n < 1e10)]
+            rel = np.max(np.abs(n - vals) / vals) if n.size == vals.size else float("nan")
+            new = float(sweep[kind]["delta_B"][i, 0])
+            print(f"  {T if kind == 'boson' else '':<8} {kind:<9s} {rel:<19.2e} {dB:<12.6f} {new:<12.6f} "
+                  f"{'yes' if new == dB else 'NO':<6s}")
+    print()
+    print(f"  scalar loops + compute_delta_B: {t_legacy:.2f} s;  benford_sweep (both kinds): {t_vec * 1e3:.1f} ms")
+
+    # ─── TEST 2: STABILITY ────────────────────────────────────
+    print()
+    print("─" * 100)
+    print("  TEST 2: STABILITY AT EXTREME x = (E - μ)/T — no guards")
+    print("─" * 100)
+    print()
+    xs = np.array([1e-300, 1e-12, 1e-3, 1.0, 50.0, 500.0, 708.0, 740.0, 1e5, -1e-12, -50.0, -1e5])
+    print(f"  {'x':<10s} {'n_BE grid':<24s} {'n_BE scalar':<24s} {'n_FD grid':<24s} {'n_FD scalar':<24s}")
+    print(f"  {'─'*10} {'─'*24} {'─'*24} {'─'*24} {'─'*24}")
+    be, fd = bose_einstein_np(xs, 1.0), fermi_dirac_np(xs, 1.0)
+    for x, b, f in zip(xs, be, fd):
+        print(f"  {x:<10.3g} {float(b)!r:<24} {bose_einstein(x, 1.0)!r:<24} {float(f)!r:<24} "
+              f"{fermi_dirac(x, 1.0)!r:<24}")
+    print()
+    print("  The scalar guards return 0 from x = 500 and 10¹⁰ as x → 0; the grid keeps the true values.")
+
+    # ─── TEST 3: TEMPERATURE SWEEP ────────────────────────────
+    print()
+    print("─" * 100)
+    print("  TEST 3: 10³ TEMPERATURES × 10⁵ ENERGIES — occupations and δ_B per temperature")
+    print("─" * 100)
+    print()
+    E = np.linspace(1e-3, 100.0, 100_000)
+    temperatures = np.geomspace(0.05, 200.0, 1000)
+    print(f"  {'dtype':<9s} {'kind':<9s} {'time (s)':<10s} {'M values/s':<12s} {'δ_B min':<10s} {'δ_B max':<10s} "
+          f"{'max |Δδ_B| vs f64':<18s}")
+    print(f"  {'─'*9} {'─'*9} {'─'*10} {'─'*12} {'─'*10} {'─'*10} {'─'*18}")
+    ref = {}
+    for dtype in (np.float64, np.float32):
+        for kind in OCCUPATIONS:
+            t0 = time.perf_counter()
+            dB = benford_sweep(kind, E, temperatures, dtype=dtype)["delta_B"][:, 0]
+            dt = time.perf_counter() - t0
+            ref.setdefault(kind, dB)
+            print(f"  {np.dtype(dtype).name:<9s} {kind:<9s} {dt:<10.2f} {E.size * temperatures.size / dt / 1e6:<12.0f} "
+                  f"{np.nanmin(dB):<10.5f} {np.nanmax(dB):<10.5f} {np.nanmax(np.abs(dB - ref[kind])):<18.2e}")
+    print()
+    print("  float32 loses the occupations below ~10⁻³⁸ (x ≳ 87), which shifts δ_B at the lowest T.")
+
+    # ─── TEST 4: THE FULL (E, T, μ) GRID ──────────────────────
+    print()
+    print("─" * 100)
+    print("  TEST 4: FERMI–DIRAC δ_B OVER (T, μ) — grid of 5000 E × 64 T × 16 μ")
+    print("─" * 100)
+    print()
+    E = 0.01 * np.arange(1, 5001)
+    temperatures = np.geomspace(0.1, 100.0, 64)
+    mus = np.linspace(-10.0, 40.0, 16)
+    t0 = time.perf_counter()
+    grid = occupation_grid("fermion", E, temperatures, mus)
+    dt = time.perf_counter() - t0
+    print(f"  occupation_grid float32 {grid.shape}: {grid.nbytes / 2**20:.1f} MB in {dt * 1e3:.0f} ms")
+    dB = benford_sweep("fermion", E, temperatures, mus)["delta_B"]
+    shown_T = [0, 21, 42, 63]
+    print()
+    print(f"  {'μ':<8s} " + " ".join(f"{'T = ' + format(temperatures[j], '.3g'):<12s}" for j in shown_T))
+    print(f"  {'─'*8} " + " ".join("─" * 12 for _ in shown_T))
+    for k in range(0, mus.size, 3):
+        print(f"  {mus[k]:<8.2f} " + " ".join(f"{dB[j, k]:<12.5f}" for j in shown_T))
+    print()
+    b = bose_einstein_np(E, 1.0, 10.0)
+    kept = int(sweep_counts("boson", E, [1.0], [10.0], workers=1).sum())
+    print(f"  Bose–Einstein at μ = 10 > E for E < 10: {kept} values counted, legacy 0 < n < 10¹⁰ keeps "
+          f"{int(np.sum((b > 0) & (b < OCCUPATION_CAP)))} (negative occupations dropped)")
+    print()
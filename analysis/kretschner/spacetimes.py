@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Static Spherically Symmetric Spacetimes: QG Models + ζ-Modified Metrics
+=======================================================================
+Orbit and geodesic codes only need the equatorial metric
+
+    ds² = -A(r) dt² + B(r) dr² + C(r) dφ²
+
+and its first derivatives. This module puts every metric in the project
+behind that one interface:
+
+  • every model of the QG registry:      A = f,  B = 1/f,  C = r²
+  • ζ Orbit Simulator   (orbit-simulator.html):
+        A = 1/B = (1 - r_s/r)·[1 + (ζ(s) - 1)·zeta_str],  s = max(1.001, r/r_s)
+  • ζ Embedded          (metric-structure approach A, ligo_substrate_sim.py s-map):
+        A = (1 - r_s/r)·ζ,  B = ζ/(1 - r_s/r),  C = r²ζ,   s = 1 + (r/r_s)³
+  • ζ Spatial           (blackhole-simulator.html):
+        A = 1 - r_s/r,  B = (1 + r_s/r)·ζ,  C = r²ζ,        s = 1 + (r/r_s)³
+
+ζ(s) is the full zeta function (zeta_numpy.py: Euler–Maclaurin, vectorized),
+not the truncated Dirichlet sums of the simulators; ζ'(s) comes from a
+complex step, so every metric derivative is exact to float64.
+
+Author: Christopher Riner & Barron
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from horizons import find_horizons
+from model_registry import MODEL_REGISTRY, PARAM_RANGES, cartesian_samples, model_f, model_fp
+from zeta_numpy import zeta_and_prime_np
+
+Spacetime = namedtuple("Spacetime", ["name", "params", "metric", "horizon", "description"])
+
+SPACETIMES = {}   # name → Spacetime, QG registry first, then the ζ metrics
+
+
+# ═══════════════════════════════════════════════════════════════
+# REGISTRATION
+# ═══════════════════════════════════════════════════════════════
+
+def register_spacetime(name, params, description=""):
+    """
+    Decorator: metric(r, **params) → (A, dA, B, dB, C, dC).
+    The decorated function may carry a .horizon(params) attribute;
+    otherwise the horizon is r = r_s.
+    """
+    def _register(metric):
+        horizon = getattr(metric, "horizon", None) or _rs_horizon
+        SPACETIMES[name] = Spacetime(name, dict(params), metric, horizon, description)
+        return metric
+    return _register
+
+
+def get_spacetime(spacetime):
+    if isinstance(spacetime, Spacetime):
+        return spacetime
+    try:
+        return SPACETIMES[spacetime]
+    except KeyError:
+        raise KeyError(f"Unknown spacetime {spacetime!r}; registered: {', '.join(SPACETIMES)}")
+
+
+def _full(st, params):
+    """Declared parameters, defaults filled in."""
+    params = params or {}
+    return {p: params.get(p, default) for p, default in st.params.items()}
+
+
+def metric_functions(spacetime, r, params=None):
+    """(A, A', B, B', C, C') on r; r and params broadcast."""
+    st = get_spacetime(spacetime)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        return st.metric(np.asarray(r, dtype=float), **_full(st, params))
+
+
+def horizon_radius(spacetime, params=None):
+    """Outer horizon r_h (NaN where there is none), as a 1-D array."""
+    st = get_spacetime(spacetime)
+    full = {k: np.atleast_1d(np.asarray(v, dtype=float)) for k, v in _full(st, params).items()}
+    shape = np.broadcast(*full.values()).shape
+    full = {k: np.broadcast_to(v, shape).ravel() for k, v in full.items()}
+    return st.horizon(full)
+
+
+def spacetime_samples(spacetime, n_points):
+    """
+    Cartesian parameter grid with ≈ n_points: the registry sampler for QG
+    models, PARAM_RANGES over every declared parameter otherwise.
+    """
+    st = get_spacetime(spacetime)
+    if st.name in MODEL_REGISTRY:
+        return cartesian_samples(st.name, n_points)
+    per_axis = max(2, int(round(n_points ** (1.0 / len(st.params)))))
+    u = np.linspace(0.0, 1.0, per_axis)
+    axes = []
+    for p in st.params:
+        lo, hi, log = PARAM_RANGES[p]
+        axes.append(np.exp(np.log(lo) + u * np.log(hi / lo)) if log else lo + u * (hi - lo))
+    mesh = np.meshgrid(*axes, indexing="ij")
+    return {p: m.ravel() for p, m in zip(st.params, mesh)}
+
+
+def _rs_horizon(params):
+    return np.asarray(params["r_s"], dtype=float).copy()
+
+
+# ═══════════════════════════════════════════════════════════════
+# QG REGISTRY MODELS:  A = f,  B = 1/f,  C = r²
+# ═══════════════════════════════════════════════════════════════
+
+def _registry_spacetime(model):
+    def metric(r, **params):
+        f = model_f(model.name, r, params)
+        fp = model_fp(model.name, r, params)
+        return f, fp, 1.0 / f, -fp / f**2, r**2, 2.0 * r
+
+    metric.horizon = lambda params: find_horizons(model.name, params)[0]
+    SPACETIMES[model.name] = Spacetime(model.name, dict(model.params), metric,
+                                       metric.horizon, model.description)
+
+
+for _model in MODEL_REGISTRY.values():
+    _registry_spacetime(_model)
+
+
+# ═══════════════════════════════════════════════════════════════
+# ζ-MODIFIED METRICS
+# ═══════════════════════════════════════════════════════════════
+
+def s_cubic(r, r_s):
+    """s(r) = 1 + (r/r_s)³ and ds/dr (ligo_substrate_sim.py, blackhole-simulator.html)."""
+    x = r / r_s
+    return 1.0 + x**3, 3.0 * x**2 / r_s
+
+
+def s_linear_clamped(r, r_s):
+    """s(r) = max(1.001, r/r_s) and ds/dr (orbit-simulator.html)."""
+    x = r / r_s
+    inside = x > 1.001
+    return np.where(inside, x, 1.001), np.where(inside, 1.0 / r_s, 0.0)
+
+
+@register_spacetime("ζ Orbit Simulator", {"r_s": 1.0, "zeta_str": 1.0},
+                    description="Scalar ζ factor on f (orbit-simulator.html)")
+def zeta_orbit_metric(r, r_s, zeta_str):
+    s, ds = s_linear_clamped(r, r_s)
+    zs, dzs = zeta_and_prime_np(s)
+    z = 1.0 + (zs - 1.0) * zeta_str
+    dz = dzs * zeta_str * ds
+    g = 1.0 - r_s / r
+    f = g * z
+    fp = r_s / r**2 * z + g * dz
+    return f, fp, 1.0 / f, -fp / f**2, r**2, 2.0 * r
+
+
+@register_spacetime("ζ Embedded", {"r_s": 1.0},
+                    description="All four components × ζ(1 + (r/r_s)³) (approach A)")
+def zeta_embedded_metric(r, r_s):
+    s, ds = s_cubic(r, r_s)
+    z, dz = zeta_and_prime_np(s)
+    dz = dz * ds
+    g = 1.0 - r_s / r
+    dg = r_s / r**2
+    return (g * z, dg * z + g * dz,
+            z / g, dz / g - z * dg / g**2,
+            r**2 * z, 2.0 * r * z + r**2 * dz)
+
+
+@register_spacetime("ζ Spatial", {"r_s": 1.0},
+                    description="Spatial components × ζ, Schwarzschild g_tt (blackhole-simulator.html)")
+def zeta_spatial_metric(r, r_s):
+    s, ds = s_cubic(r, r_s)
+    z, dz = zeta_and_prime_np(s)
+    dz = dz * ds
+    h = 1.0 + r_s / r
+    dh = -r_s / r**2
+    return (1.0 - r_s / r, r_s / r**2,
+            h * z, dh * z + h * dz,
+            r**2 * z, 2.0 * r * z + r**2 * dz)
+
+
+# ═══════════════════════════════════════════════════════════════
+# RUN
+# ═══════════════════════════════════════════════════════════════
+
+if __name__ == "__main__":
+    print()
+    print("=" * 120)
+    print("  STATIC SPHERICALLY SYMMETRIC SPACETIMES")
+    print("=" * 120)
+
+    # ─── TEST 1: METRIC DERIVATIVES ─────────────────────────────
+    print()
+    print("─" * 120)
+    print("  TEST 1: ANALYTIC A', B', C' vs CENTRAL DIFFERENCES (r = 1.2 … 20 r_s)")
+    print("─" * 120)
+    print()
+    r = np.geomspace(1.2, 20.0, 200)
+    h = 1e-6 * r
+    print(f"  {'Spacetime':<22s} {'r_h':<12s} {'max rel err A′':<16s} {'B′':<12s} {'C′':<12s}")
+    print(f"  {'─'*22} {'─'*12} {'─'*16} {'─'*12} {'─'*12}")
+    for name in SPACETIMES:
+        A, dA, B, dB, C, dC = metric_functions(name, r)
+        Ap, _, Bp, _, Cp, _ = metric_functions(name, r + h)
+        Am, _, Bm, _, Cm, _ = metric_functions(name, r - h)
+        errs = []
+        for exact, p, m in ((dA, Ap, Am), (dB, Bp, Bm), (dC, Cp, Cm)):
+            fd = (p - m) / (2 * h)
+            errs.append(np.max(np.abs(fd - exact) / np.maximum(np.abs(exact), 1e-12)))
+        r_h = horizon_radius(name)[0]
+        print(f"  {name:<22s} {r_h:<12.6g} {errs[0]:<16.2e} {errs[1]:<12.2e} {errs[2]:<12.2e}")
+    print()
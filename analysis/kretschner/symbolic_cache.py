@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Symbolic Curvature Cache: Derive Once, Load in Milliseconds
+===========================================================
+TEST 1 of kretschner_scalar.py writes the orthonormal Riemann components
+of ds² = -f(r)dt² + dr²/f(r) + r²dΩ² by hand. This module derives them
+symbolically (sympy) from the metric itself, substitutes a concrete f(r),
+and emits NumPy source for the jets and curvature components:
+
+    f, f', f''
+    R̂₀₁₀₁, R̂₀₂₀₂, R̂₁₂₁₂, R̂₂₃₂₃
+    K = f''² + 4f'²/r² + 4(1-f)²/r⁴
+
+Symbolic work is slow (sympy import alone is ~0.5 s), so every derived
+kernel is written to .symcache/<key>.py, where the key is a SHA-256 of the
+metric definition (normalized f(r) source + parameter names + cache
+version). A repeat run only reads and compiles that file — sympy is never
+imported — which costs well under a millisecond per metric.
+
+Parameters are NOT part of the key: they are arguments of the generated
+kernels, so one cached derivation serves a whole parameter sweep.
+
+Usage:
+    python3 symbolic_cache.py            # derive (or load) every registered model
+    python3 symbolic_cache.py --clear    # wipe the cache first
+
+Author: Christopher Riner & Barron
+"""
+
+import hashlib
+import math
+import os
+import sys
+import time
+import types
+
+import numpy as np
+
+# ═══════════════════════════════════════════════════════════════
+# CACHE LOCATION
+# ═══════════════════════════════════════════════════════════════
+CACHE_VERSION = 1
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".symcache")
+
+# Names emitted by the generated source, in output order
+KERNEL_NAMES = ["f", "fp", "fpp", "R0101", "R0202", "R1212", "R2323", "K"]
+
+_MEMO = {}  # in-process: key → kernels
+
+
+# ═══════════════════════════════════════════════════════════════
+# CACHE KEY (no sympy needed)
+# ═══════════════════════════════════════════════════════════════
+
+def metric_key(f_src, param_names):
+    """
+    SHA-256 of the metric definition.
+    Whitespace in f_src is ignored; parameter ORDER matters because it
+    fixes the argument order of the generated kernels.
+    """
+    canonical = "v{}|{}|{}".format(CACHE_VERSION, "".join(f_src.split()),
+                                   ",".join(param_names))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+# ═══════════════════════════════════════════════════════════════
+# SYMBOLIC DERIVATION (only runs on a cache miss)
+# ═══════════════════════════════════════════════════════════════
+
+def _import_sympy():
+    try:
+        import sympy
+    except ImportError:
+        raise ImportError("sympy is required to derive uncached metrics — "
+                          "install with: pip3 install sympy")
+    return sympy
+
+
+def _orthonormal_riemann(sp):
+    """
+    Riemann tensor of ds² = -f dt² + dr²/f + r²dΩ² for a GENERIC f(r),
+    projected onto the static orthonormal frame.
+    Returns (r, f, {name: expression in f, f', f''}).
+    """
+    t, r, th, ph = sp.symbols("t r theta phi", positive=True)
+    f = sp.Function("f")(r)
+    x = [t, r, th, ph]
+    g = sp.diag(-f, 1 / f, r**2, r**2 * sp.sin(th)**2)
+    ginv = g.inv()
+
+    # Christoffel symbols Γ^a_bc
+    Gam = [[[sp.simplify(sum(ginv[a, d] * (sp.diff(g[d, b], x[c])
+                                           + sp.diff(g[d, c], x[b])
+                                           - sp.diff(g[b, c], x[d]))
+                             for d in range(4)) / 2)
+             for c in range(4)] for b in range(4)] for a in range(4)]
+
+    def riemann_up(a, b, c, d):
+        """R^a_bcd"""
+        expr = sp.diff(Gam[a][b][d], x[c]) - sp.diff(Gam[a][b][c], x[d])
+        expr += sum(Gam[a][c][e] * Gam[e][b][d] - Gam[a][d][e] * Gam[e][b][c]
+                    for e in range(4))
+        return expr
+
+    def riemann_down(a, b, c, d):
+        """R_abcd"""
+        return sum(g[a, e] * riemann_up(e, b, c, d) for e in range(4))
+
+    # Orthonormal frame: e_â = e_a / √|g_aa|
+    norm = [sp.sqrt(f), 1 / sp.sqrt(f), r, r * sp.sin(th)]
+
+    def hat(a, b, c, d):
+        val = riemann_down(a, b, c, d) / (norm[a] * norm[b] * norm[c] * norm[d])
+        return sp.simplify(val)
+
+    comps = {
+        "R0101": hat(0, 1, 0, 1),
+        "R0202": hat(0, 2, 0, 2),
+        "R1212": hat(1, 2, 1, 2),
+        "R2323": hat(2, 3, 2, 3),
+    }
+    return r, f, comps
+
+
+def _numpy_printer(sp):
+    """NumPy code printer that emits a bare erf (bound at load time)."""
+    from sympy.printing.numpy import NumPyPrinter
+
+    class _Printer(NumPyPrinter):
+        def _print_erf(self, expr):
+            return "erf({})".format(self._print(expr.args[0]))
+
+    return _Printer({"fully_qualified_modules": False})
+
+
+def derive_source(f_src, param_names, key):
+    """Symbolically derive all kernels for one metric → Python source."""
+    sp = _import_sympy()
+    r_gen, f_gen, comps = _orthonormal_riemann(sp)
+
+    r = sp.Symbol("r", positive=True)
+    params = {p: sp.Symbol(p, positive=True) for p in param_names}
+    local = dict(params, r=r, erf=sp.erf, Piecewise=sp.Piecewise)
+    f_expr = sp.sympify(f_src, locals=local)
+    fp_expr = sp.diff(f_expr, r)
+    fpp_expr = sp.diff(fp_expr, r)
+
+    # Replace f, f', f'' (highest derivative first) in the generic components
+    subs = [(sp.Derivative(f_gen, (r_gen, 2)), fpp_expr),
+            (sp.Derivative(f_gen, r_gen), fp_expr),
+            (f_gen, f_expr),
+            (r_gen, r)]
+    exprs = {"f": f_expr, "fp": fp_expr, "fpp": fpp_expr}
+    for name, comp in comps.items():
+        exprs[name] = comp.subs(subs)
+    exprs["K"] = 4 * (exprs["R0101"]**2 + 2 * exprs["R0202"]**2
+                      + 2 * exprs["R1212"]**2 + exprs["R2323"]**2)
+
+    printer = _numpy_printer(sp)
+    args = ", ".join(["r"] + list(param_names))
+    lines = [
+        "# Generated by symbolic_cache.py — do not edit.",
+        "# key:    {}".format(key),
+        "# metric: f(r) = {}".format(" ".join(f_src.split())),
+        "",
+    ]
+    for name in KERNEL_NAMES:
+        lines.append("def {}({}):".format(name, args))
+        lines.append("    return {}".format(printer.doprint(exprs[name])))
+        lines.append("")
+    return "\n".join(lines)
+
+
+# ═══════════════════════════════════════════════════════════════
+# LOADING
+# ═══════════════════════════════════════════════════════════════
+
+_ERF = []  # resolved on first use: scipy.special.erf, else vectorized math.erf
+
+
+def _erf():
+    if not _ERF:
+        try:
+            from scipy.special import erf
+        except ImportError:
+            erf = np.vectorize(math.erf, otypes=[float])
+        _ERF.append(erf)
+    return _ERF[0]
+
+
+def _compile(source, key, param_names):
+    namespace = {"numpy": np}
+    if "erf(" in source:
+        namespace["erf"] = _erf()
+    for attr in ("select", "logical_and", "less", "greater", "sqrt", "exp",
+                 "pi", "nan", "sin", "cos", "log"):
+        namespace[attr] = getattr(np, attr)
+    exec(compile(source, "<symcache:{}>".format(key[:12]), "exec"), namespace)
+
+    kernels = types.SimpleNamespace(key=key, params=tuple(param_names), source=source)
+    for name in KERNEL_NAMES:
+        setattr(kernels, name, namespace[name])
+    return kernels
+
+
+def load_kernels(f_src, param_names, cache_dir=CACHE_DIR):
+    """
+    Return NumPy kernels (f, fp, fpp, R0101, R0202, R1212, R2323, K) for
+    f(r) = f_src. Each kernel is called as kernel(r, *params) with the
+    parameters in param_names order, and broadcasts over array inputs.
+
+    Lookup order: in-process memo → .symcache/<key>.py → sympy derivation.
+    """
+    param_names = tuple(param_names)
+    key = metric_key(f_src, param_names)
+    if key in _MEMO:
+        return _MEMO[key]
+
+    path = os.path.join(cache_dir, key + ".py")
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as fh:
+            source = fh.read()
+    else:
+        source = derive_source(f_src, param_names, key)
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp = path + ".tmp{}".format(os.getpid())
+        with open(tmp, "w", encoding="utf-8") as fh:
+            fh.write(source)
+        os.replace(tmp, path)  # atomic: concurrent workers never see half a file
+
+    kernels = _compile(source, key, param_names)
+    _MEMO[key] = kernels
+    return kernels
+
+
+def evaluate(kernels, r, params):
+    """Evaluate every kernel at r with a params dict → {name: ndarray}."""
+    args = [params[p] for p in kernels.params]
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        return {name: np.asarray(getattr(kernels, name)(r, *args), dtype=float)
+                for name in KERNEL_NAMES}
+
+
+def clear_cache(cache_dir=CACHE_DIR):
+    """Delete every cached kernel file. Returns the number removed."""
+    _MEMO.clear()
+    if not os.path.isdir(cache_dir):
+        return 0
+    n = 0
+    for name in os.listdir(cache_dir):
+        if name.endswith(".py"):
+            os.remove(os.path.join(cache_dir, name))
+            n += 1
+    return n
+
+
+# ═══════════════════════════════════════════════════════════════
+# RUN
+# ═══════════════════════════════════════════════════════════════
+
+if __name__ == "__main__":
+    from model_registry import MODEL_REGISTRY
+
+    # (name, f(r) source, default parameters) for every symbolic model
+    QG_METRICS = [(m.name, m.f_src, m.params) for m in MODEL_REGISTRY.values()
+                  if m.f_src is not None]
+
+    if "--clear" in sys.argv:
+        print(f"  Cleared {clear_cache()} cached kernels from {CACHE_DIR}")
+
+    print()
+    print("=" * 100)
+    print("  SYMBOLIC CURVATURE CACHE")
+    print("  Riemann components derived from the metric, cached as NumPy source")
+    print("=" * 100)
+
+    # ─── TEST 1: LOAD / DERIVE EVERY MODEL ─────────────────────
+    print()
+    print("─" * 100)
+    print("  TEST 1: FIRST LOAD (derives with sympy on a cache miss)")
+    print("─" * 100)
+    print()
+    print(f"  {'Model':<22s} {'key':<14s} {'source':<10s} {'time':<12s}")
+    print(f"  {'─'*22} {'─'*14} {'─'*10} {'─'*12}")
+
+    for name, f_src, params in QG_METRICS:
+        key = metric_key(f_src, list(params))
+        hit = os.path.exists(os.path.join(CACHE_DIR, key + ".py"))
+        t0 = time.perf_counter()
+        load_kernels(f_src, list(params))
+        dt = time.perf_counter() - t0
+        print(f"  {name:<22s} {key[:12]:<14s} {'disk' if hit else 'sympy':<10s} {dt*1e3:>8.2f} ms")
+
+    # ─── TEST 2: WARM LOAD (what every repeat run pays) ────────
+    print()
+    print("─" * 100)
+    print("  TEST 2: WARM LOAD FROM DISK (in-process memo cleared)")
+    print("─" * 100)
+    print()
+    _MEMO.clear()
+    total = 0.0
+    for name, f_src, params in QG_METRICS:
+        t0 = time.perf_counter()
+        load_kernels(f_src, list(params))
+        total += time.perf_counter() - t0
+    print(f"  {len(QG_METRICS)} metrics loaded in {total*1e3:.2f} ms "
+          f"({total*1e3/len(QG_METRICS):.3f} ms per metric)")
+    print(f"  sympy imported this run: {'yes' if 'sympy' in sys.modules else 'NO'}")
+
+    # ─── TEST 3: VERIFICATION ──────────────────────────────────
+    print()
+    print("─" * 100)
+    print("  TEST 3: VERIFICATION — symbolic components vs TEST 1 of kretschner_scalar.py")
+    print("─" * 100)
+    print()
+    name, f_src, params = QG_METRICS[0]
+    kern = load_kernels(f_src, list(params))
+    r = np.array([100.0, 10.0, 2.0, 1.5, 1.01, 1.001, 0.5, 0.01])
+    out = evaluate(kern, r, params)
+    r_s = params["r_s"]
+    K_exact = 12.0 * r_s**2 / r**6
+
+    print(f"  {'r/r_s':<10s} {'K (symbolic)':<20s} {'12r_s²/r⁶':<20s} {'rel err':<12s} {'R̂₀₁₀₁ - f″/2':<14s}")
+    print(f"  {'─'*10} {'─'*20} {'─'*20} {'─'*12} {'─'*14}")
+    for i in range(len(r)):
+        err = abs(out["K"][i] - K_exact[i]) / K_exact[i]
+        comp = out["R0101"][i] - out["fpp"][i] / 2
+        print(f"  {r[i]:<10.3f} {out['K'][i]:<20.10e} {K_exact[i]:<20.10e} {err:<12.2e} {comp:<14.2e}")
+
+    print()
+    print("  Component check against the hand derivation, all models, r ∈ [1e-4, 10]:")
+    r = np.geomspace(1e-4, 10.0, 2001)
+    for name, f_src, params in QG_METRICS:
+        out = evaluate(load_kernels(f_src, list(params)), r, params)
+        ok = (np.allclose(out["R0101"], out["fpp"] / 2, rtol=1e-10, atol=0)
+              and np.allclose(out["R0202"], out["fp"] / (2 * r), rtol=1e-10, atol=0)
+              and np.allclose(out["R1212"], -out["fp"] / (2 * r), rtol=1e-10, atol=0)
+              and np.allclose(out["R2323"], (1 - out["f"]) / r**2, rtol=1e-10, atol=1e-300))
+        print(f"    {'✓' if ok else '✗'} {name}")
+    print()
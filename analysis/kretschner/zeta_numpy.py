@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Vectorized Riemann ζ(s): Values, Derivatives and Inverse on NumPy Arrays
+========================================================================
+The scripts in this project evaluate ζ(s) one float at a time (Euler
+product over 10⁴ primes or a truncated Dirichlet sum). Metric, orbit and
+mapping sweeps need it on millions of points, so here ζ is computed by
+Euler–Maclaurin summation, which is exact to float64 and has no loop
+over points:
+
+    ζ(s) = Σ_{n<N} n⁻ˢ + N¹⁻ˢ/(s-1) + N⁻ˢ/2
+           + Σ_k B_2k/(2k)! · s(s+1)…(s+2k-2) · N^(-s-2k+1)      (N = 10)
+
+  zeta_np(s)                 ζ for real or complex arrays
+  zeta_and_prime_np(s)       (ζ, ζ') from one complex-step evaluation
+  zeta_derivatives_np(s, k)  ζ, ζ', …, ζ⁽ᵏ⁾ — every term differentiated exactly
+  invert_zeta_np(z, zm1)     s with ζ(s) = z > 1 (Newton on ln(ζ - 1))
+
+Author: Christopher Riner & Barron
+"""
+
+import math
+
+import numpy as np
+
+EM_N = 10                                           # terms summed directly
+EM_BERNOULLI = [1/6, -1/30, 1/42, -1/30, 5/66, -691/2730, 7/6, -3617/510]
+ZETA_S_MAX = 60.0                                   # beyond: ζ = 1 + 2⁻ˢ + 3⁻ˢ
+COMPLEX_STEP = 1e-30
+EULER_GAMMA = 0.5772156649015329
+NEWTON_STEPS = 40
+NEWTON_TOL = 1e-15                                  # |Δs| / (s - 1): converged points leave the batch
+
+
+# ═══════════════════════════════════════════════════════════════
+# ζ(s)
+# ═══════════════════════════════════════════════════════════════
+
+def zeta_np(s):
+    """
+    ζ(s) for real or complex arrays (s ≠ 1) by Euler–Maclaurin summation
+    with N = 10 and eight Bernoulli corrections — full float64 accuracy
+    for Re(s) > 0 (~1e-11 at s = -2.5), no loop over points.
+    """
+    s = np.asarray(s)
+    big = s.real > ZETA_S_MAX
+    sc = np.where(big, s - s.real + ZETA_S_MAX, s)
+    n = np.arange(1, EM_N, dtype=float).reshape((-1,) + (1,) * sc.ndim)
+    N = float(EM_N)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        total = np.sum(n ** -sc, axis=0) + N ** (1 - sc) / (sc - 1) + 0.5 * N ** -sc
+        poch = sc                                   # s(s+1)…(s+2k-2)
+        power = N ** (-sc - 1)
+        fact = 2.0                                  # (2k)!
+        for k, b2k in enumerate(EM_BERNOULLI, start=1):
+            if k > 1:
+                poch = poch * (sc + 2 * k - 3) * (sc + 2 * k - 2)
+                power = power / N**2
+                fact *= (2 * k - 1) * (2 * k)
+            total = total + b2k / fact * poch * power
+        tail = 1.0 + 2.0 ** -s + 3.0 ** -s
+    return np.where(big, tail, total)
+
+
+def zeta_prime_np(s):
+    """ζ'(s) for real s by complex step: Im ζ(s + ih) / h, no cancellation."""
+    return zeta_and_prime_np(s)[1]
+
+
+def zeta_and_prime_np(s):
+    """(ζ(s), ζ'(s)) from one complex evaluation: Re and Im/h of ζ(s + ih)."""
+    z = zeta_np(np.asarray(s, dtype=float) + 1j * COMPLEX_STEP)
+    return z.real, z.imag / COMPLEX_STEP
+
+
+# ═══════════════════════════════════════════════════════════════
+# HIGHER DERIVATIVES
+# ═══════════════════════════════════════════════════════════════
+
+def zeta_derivatives_np(s, order=2, minus_one=False):
+    """
+    [ζ(s), ζ'(s), …, ζ⁽ᵒʳᵈᵉʳ⁾(s)] as one (order+1, *s.shape) array, real s.
+    minus_one=True returns ζ(s) - 1 in row 0 without cancellation
+    (weak fields: ζ - 1 ~ 2⁻ˢ).
+    Each Euler–Maclaurin term is differentiated in closed form:
+        head       (-ln n)ᵏ n⁻ˢ
+        pole term  dᵏ/dsᵏ [N⁻ᵘ/u],  u = s - 1
+        Bernoulli  Leibniz rule on  P_m(s) · N^(-s-2m+1)
+    """
+    s = np.asarray(s, dtype=float)
+    big = s > ZETA_S_MAX
+    sc = np.where(big, ZETA_S_MAX, s)
+    N = float(EM_N)
+    L = math.log(N)
+    out = np.zeros((order + 1,) + s.shape)
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        ln_n = np.log(np.arange(2, EM_N, dtype=float)).reshape((-1,) + (1,) * s.ndim)
+        head = np.exp(-ln_n * sc)
+        u = sc - 1.0
+        eN = N ** -u                                 # N^(1-s)
+        half = 0.5 * N ** -sc
+        polys = []
+        coeffs = np.poly1d([1.0, 0.0])               # P_1(s) = s
+        for m in range(1, len(EM_BERNOULLI) + 1):
+            if m > 1:
+                coeffs = coeffs * np.poly1d([1.0, 2 * m - 3]) * np.poly1d([1.0, 2 * m - 2])
+            polys.append(coeffs)
+
+        for k in range(order + 1):
+            val = np.sum((-ln_n)**k * head, axis=0)
+            # dᵏ/duᵏ [e^(-uL) · u⁻¹] = Σ_j C(k,j) (-L)^(k-j) e^(-uL) · (-1)ʲ j! u^(-1-j)
+            val = val + sum(math.comb(k, j) * (-L)**(k - j) * (-1)**j * math.factorial(j)
+                            * eN * u**(-1 - j) for j in range(k + 1))
+            val = val + (-L)**k * half
+            fact = 1.0
+            for m, (b2m, poly) in enumerate(zip(EM_BERNOULLI, polys), start=1):
+                fact *= (2 * m - 1) * (2 * m)
+                power = N ** (-sc - 2 * m + 1)
+                term = sum(math.comb(k, j) * np.polyval(np.polyder(poly, j), sc) * (-L)**(k - j)
+                           for j in range(min(k, poly.order) + 1))
+                val = val + b2m / fact * term * power
+            tail = sum((-math.log(n))**k * n ** -s for n in (2.0, 3.0))
+            out[k] = np.where(big, tail, val)
+    if not minus_one:
+        out[0] += 1.0                                # the n = 1 term
+    return out
+
+
+# ═══════════════════════════════════════════════════════════════
+# INVERSE
+# ═══════════════════════════════════════════════════════════════
+
+def invert_zeta_np(z, zm1=None):
+    """
+    s > 1 with ζ(s) = z, for arrays z > 1. Pass zm1 = z - 1 when it is
+    known more accurately than z itself (weak fields: z - 1 ~ 1e-9).
+    Newton on h(s) = ln(ζ(s) - 1) - ln(z - 1), which is nearly linear in s
+    for large s and monotone everywhere; NaN where z ≤ 1.
+    """
+    z = np.asarray(z, dtype=float)
+    zm1 = z - 1.0 if zm1 is None else np.asarray(zm1, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        target = np.log(zm1)
+        # Near the pole ζ ≈ 1/(s-1) + γ; far away ζ - 1 ≈ 2⁻ˢ
+        s = np.where(z > 2.0, 1.0 + 1.0 / np.maximum(z - EULER_GAMMA, 1e-300), -np.log2(zm1))
+        s = np.maximum(s, 1.0 + 1e-15).ravel()
+        target = np.broadcast_to(target, z.shape).ravel()
+        active = np.flatnonzero(np.isfinite(target))
+        for _ in range(NEWTON_STEPS):
+            if not len(active):
+                break
+            sa = s[active]
+            zm1_s, dzeta = zeta_derivatives_np(sa, order=1, minus_one=True)
+            step = (np.log(zm1_s) - target[active]) * zm1_s / dzeta
+            s[active] = np.maximum(sa - step, 1.0 + 0.5 * (sa - 1.0))
+            done = np.abs(step) <= np.maximum(NEWTON_TOL * (sa - 1.0), 4 * np.finfo(float).eps * sa)
+            active = active[~done]
+    return np.where(zm1 > 0, s.reshape(z.shape), np.nan)
+
+
+# ═══════════════════════════════════════════════════════════════
+# RUN
+# ═══════════════════════════════════════════════════════════════
+
+if __name__ == "__main__":
+    print()
+    print("=" * 120)
+    print("  VECTORIZED RIEMANN ZETA")
+    print("=" * 120)
+
+    S = np.array([1.001, 1.1, 1.5, 2.0, 3.0, 9.0, 30.0, 100.0, 0.5, -2.5])
+    try:
+        import mpmath
+    except ImportError:
+        mpmath = None
+        print()
+        print("  mpmath not installed — comparisons skipped")
+
+    if mpmath is not None:
+        # ─── TEST 1: ζ, ζ′ ───────────────────────────────────────
+        print()
+        print("─" * 120)
+        print("  TEST 1: ζ(s) AND COMPLEX-STEP ζ'(s) vs mpmath")
+        print("─" * 120)
+        print()
+        z, dz = zeta_np(S), zeta_prime_np(S)
+        print(f"  {'s':<8s} {'ζ(s)':<24s} {'rel err':<12s} {'ζ′(s)':<24s} {'rel err':<12s}")
+        print(f"  {'─'*8} {'─'*24} {'─'*12} {'─'*24} {'─'*12}")
+        for s, a, b in zip(S, z, dz):
+            ea, eb = float(mpmath.zeta(s)), float(mpmath.zeta(s, derivative=1))
+            print(f"  {s:<8g} {a:<24.17g} {abs(a - ea) / abs(ea):<12.2e} "
+                  f"{b:<24.17g} {abs(b - eb) / abs(eb):<12.2e}")
+
+        # ─── TEST 2: HIGHER DERIVATIVES ─────────────────────────
+        print()
+        print("─" * 120)
+        print("  TEST 2: ζ⁽ᵏ⁾(s), k = 0…3, FROM THE DIFFERENTIATED SERIES vs mpmath")
+        print("─" * 120)
+        print()
+        D = zeta_derivatives_np(S, order=3)
+        print(f"  {'s':<8s} " + " ".join(f"{'rel err ζ' + '′' * k:<14s}" for k in range(4)))
+        print(f"  {'─'*8} " + " ".join(f"{'─'*14}" for _ in range(4)))
+        for i, s in enumerate(S):
+            errs = []
+            for k in range(4):
+                e = float(mpmath.zeta(s, derivative=k))
+                errs.append(abs(D[k, i] - e) / abs(e))
+            print(f"  {s:<8g} " + " ".join(f"{e:<14.2e}" for e in errs))
+
+    # ─── TEST 3: INVERSE ───────────────────────────────────────
+    print()
+    print("─" * 120)
+    print("  TEST 3: ζ⁻¹ — s(z) then ζ(s(z)) back, including weak fields z - 1 = r_s/(r - r_s)")
+    print("─" * 120)
+    print()
+    x = np.geomspace(1.0001, 1e12, 9)            # r / r_s
+    zm1 = 1.0 / (x - 1.0)
+    s = invert_zeta_np(1.0 + zm1, zm1)
+    back = zeta_derivatives_np(s, order=0, minus_one=True)[0]
+    print(f"  {'r/r_s':<12s} {'z - 1':<14s} {'s':<22s} {'|ζ(s)-1 - (z-1)| / (z-1)':<24s}")
+    print(f"  {'─'*12} {'─'*14} {'─'*22} {'─'*24}")
+    for xi, t, si, b in zip(x, zm1, s, back):
+        print(f"  {xi:<12.4e} {t:<14.4e} {si:<22.16g} {abs(b - t) / t:<24.2e}")
+    print()
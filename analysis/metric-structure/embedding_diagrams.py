@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Embedding Diagrams and (r, θ) Field Maps as Tile Pyramids
+=========================================================
+wormhole_3d_interactive.html and dimension_stack_chart.html draw surfaces
+that no Python script produces. Here, for every distinct metric of
+metric_engine.py:
+
+  embedding profile  the equatorial slice dℓ² = g_rr dr² + R² dφ², R = √g_φφ,
+                     as a surface of revolution in flat 3-space:
+                         ρ = R(r),   z(r) = ∫ √(g_rr - (dR/dr)²) dr
+                     (Flamm's paraboloid z = 2√(r_s(r - r_s)) for Schwarzschild;
+                     where g_rr < R'² the slice is not embeddable — flagged 0,
+                     and NaN where the metric itself is undefined)
+  field map          g_φφ, √|det g| and Tr g over (r, θ)
+
+Both are sampled uniformly in ξ = log₁₀(r/r_s - 1), which resolves the
+horizon, and cut into a mipmap pyramid: level L holds 2^L tiles (profile)
+or 2^L × 2^L tiles (field map) of fixed size, level L being every
+2^(Lmax-L)-th sample of the finest level. A viewer loads level 0 (one
+small tile for the whole range), then only the high-level tiles of the
+window it zooms into — the horizon region — never the full resolution.
+
+    out_dir/manifest.json
+    out_dir/<metric>/profile/L<level>/<i>.f32.gz        fields × PROFILE_TILE
+    out_dir/<metric>/fields/L<level>/<i>_<j>.f32.gz     fields × FIELD_TILE² (ξ-major)
+
+Tiles are gzip'd little-endian float32, field-major, as in export_tiles.py.
+
+Usage:
+    python3 embedding_diagrams.py
+    python3 embedding_diagrams.py --out ../../simulators/data/embedding
+
+Author: Christopher Riner & Barron
+"""
+
+import gzip
+import json
+import math
+import os
+import sys
+import time
+
+import numpy as np
+
+from metric_engine import METRICS, evaluate, evaluate_grid
+
+OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "output", "embedding_tiles")
+
+# ═══════════════════════════════════════════════════════════
+# CONSTANTS
+# ═══════════════════════════════════════════════════════════
+XI_RANGE = (-6.0, 9.0)          # log₁₀(r/r_s - 1): 1 + 10⁻⁶ … 10⁹ r_s
+PROFILE_TILE = 256              # samples per profile tile
+PROFILE_LEVELS = 7              # L = 0 … 6 → finest 16384 samples
+FIELD_TILE = 64                 # (ξ, θ) samples per field tile side
+FIELD_LEVELS = 4                # L = 0 … 3 → finest 512 × 512
+PROFILE_FIELDS = ["x", "rho", "z", "g_rr", "zeta", "embeddable"]
+MAP_FIELDS = ["g_phph", "volume", "trace"]
+
+
+def distinct_metrics():
+    """One legacy name per distinct (embedding, mapping) pair, in METRICS order."""
+    seen, names = set(), []
+    for name, pair in METRICS.items():
+        if pair not in seen:
+            seen.add(pair)
+            names.append(name)
+    return names
+
+
+# ═══════════════════════════════════════════════════════════
+# EMBEDDING PROFILE
+# ═══════════════════════════════════════════════════════════
+
+def xi_axis(n, xi_range=XI_RANGE):
+    """n samples ξ₀ + kΔ, Δ = (ξ₁ - ξ₀)/n — decimating by 2 keeps every other sample."""
+    return xi_range[0] + (xi_range[1] - xi_range[0]) / n * np.arange(n)
+
+
+def embedding_profile(metric, n=PROFILE_TILE << (PROFILE_LEVELS - 1), xi_range=XI_RANGE):
+    """
+    {x, rho, z, g_rr, zeta, embeddable} on n samples of ξ = log₁₀(x - 1).
+    dz/dξ = √(g_rr - R'²) · ln10 · (x - 1), integrated by cumulative
+    trapezoid; z(ξ₀) from the (x - 1)^(-1/2) horizon behaviour of g_rr.
+    embeddable is 1 where g_rr ≥ R'², 0 where g_rr < R'², and NaN where
+    the fields are undefined (prime_metric_v2 beyond PSI_X_MAX); outside
+    the embeddable set the integrand is taken as 0 (z stays flat).
+    """
+    xi = xi_axis(n, xi_range)
+    xm1 = 10.0**xi
+    x = 1.0 + xm1
+    m = evaluate(x, metric=metric)
+    rho = np.sqrt(m.g_phph)
+    dx_dxi = math.log(10.0) * xm1
+    # R = x·q and g_rr - R'² = (g_rr - 1) - [(q² - 1) + 2q·xq' + (xq')²]: far out both
+    # sides are 1 + O(1/x), so the deficits are formed before the cancellation
+    with np.errstate(invalid="ignore"):
+        q2m1 = m.g_phph / x**2 - 1.0
+        q = np.sqrt(1.0 + q2m1)
+        xdq = x * np.gradient(q2m1, xi, edge_order=2) / (2.0 * q * dx_dxi)
+        arg = (m.g_rr - 1.0) - (q2m1 + 2.0 * q * xdq + xdq**2)
+        embeddable = np.where(np.isfinite(arg), arg >= 0.0, np.nan)
+        f = np.sqrt(np.where(embeddable == 1.0, arg, 0.0))
+    dz = f * dx_dxi
+    z = np.empty_like(x)
+    z[0] = 2.0 * xm1[0] * f[0]
+    z[1:] = z[0] + np.cumsum(0.5 * (dz[1:] + dz[:-1]) * np.diff(xi))
+    return {"x": x, "rho": rho, "z": z, "g_rr": np.asarray(m.g_rr), "zeta": np.asarray(m.zeta),
+            "embeddable": embeddable}
+
+
+def embeddable_fraction(profile):
+    """(embeddable fraction of the finite samples, fraction of samples with NaN fields)."""
+    flag = profile["embeddable"]
+    finite = np.isfinite(flag)
+    return (float(flag[finite].mean()) if finite.any() else math.nan), float(1.0 - finite.mean())
+
+
+def field_map(metric, n_xi=FIELD_TILE << (FIELD_LEVELS - 1), n_theta=None, xi_range=XI_RANGE):
+    """MAP_FIELDS over (ξ, θ ∈ [0, π]) as (n_xi, n_theta) arrays."""
+    n_theta = n_theta or n_xi
+    x = 1.0 + 10.0**xi_axis(n_xi, xi_range)
+    theta = np.pi * np.arange(n_theta) / n_theta
+    grid = evaluate_grid(x, [1.0], theta, metric=metric, fields=MAP_FIELDS)
+    return {f: getattr(grid, f)[:, 0, :] for f in MAP_FIELDS}
+
+
+# ═══════════════════════════════════════════════════════════
+# TILE PYRAMIDS
+# ═══════════════════════════════════════════════════════════
+
+def _write(path, block):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    raw = np.ascontiguousarray(block, dtype="<f4").tobytes()
+    with open(path, "wb") as fh:
+        fh.write(gzip.compress(raw, compresslevel=6, mtime=0))
+    return len(raw), os.path.getsize(path)
+
+
+def write_profile_pyramid(profile, out_dir, levels=PROFILE_LEVELS, tile=PROFILE_TILE):
+    """Level L = every 2^(levels-1-L)-th sample, cut into 2^L tiles. Returns (files, raw B, gzip B)."""
+    files = raw = packed = 0
+    for L in range(levels):
+        step = 1 << (levels - 1 - L)
+        block = np.stack([profile[f][::step] for f in PROFILE_FIELDS])
+        for i in range(1 << L):
+            r, p = _write(os.path.join(out_dir, "profile", f"L{L}", f"{i}.f32.gz"),
+                          block[:, i * tile:(i + 1) * tile])
+            files, raw, packed = files + 1, raw + r, packed + p
+    return files, raw, packed
+
+
+def write_field_pyramid(fields, out_dir, levels=FIELD_LEVELS, tile=FIELD_TILE):
+    """Quadtree: level L = 2^L × 2^L tiles of tile × tile samples."""
+    files = raw = packed = 0
+    for L in range(levels):
+        step = 1 << (levels - 1 - L)
+        block = np.stack([fields[f][::step, ::step] for f in MAP_FIELDS])
+        for i in range(1 << L):
+            for j in range(1 << L):
+                r, p = _write(os.path.join(out_dir, "fields", f"L{L}", f"{i}_{j}.f32.gz"),
+                              block[:, i * tile:(i + 1) * tile, j * tile:(j + 1) * tile])
+                files, raw, packed = files + 1, raw + r, packed + p
+    return files, raw, packed
+
+
+def export_pyramids(metrics=None, out_dir=OUTPUT_DIR, verbose=False):
+    """Profile + field-map pyramids for every metric, and the manifest. Returns the manifest."""
+    metrics = list(metrics or distinct_metrics())
+    manifest = {
+        "generator": "analysis/metric-structure/embedding_diagrams.py",
+        "axis": {"name": "xi", "definition": "log10(r/r_s - 1)", "min": XI_RANGE[0], "max": XI_RANGE[1],
+                 "sampling": "xi_k = min + k (max - min) / n_level, k = 0 … n_level - 1"},
+        "dtype": "float32-le", "layout": "field-major",
+        "profile": {"fields": PROFILE_FIELDS, "tile": PROFILE_TILE, "levels": PROFILE_LEVELS,
+                    "path": "{metric}/profile/L{level}/{i}.f32.gz"},
+        "fields": {"fields": MAP_FIELDS, "tile": [FIELD_TILE, FIELD_TILE], "levels": FIELD_LEVELS,
+                   "theta": "theta_j = pi j / n_level", "order": "xi-major",
+                   "path": "{metric}/fields/L{level}/{i}_{j}.f32.gz"},
+        "metrics": {},
+    }
+    for name in metrics:
+        t0 = time.perf_counter()
+        profile = embedding_profile(name)
+        pf = write_profile_pyramid(profile, os.path.join(out_dir, name))
+        ff = write_field_pyramid(field_map(name), os.path.join(out_dir, name))
+        embeddable, undefined = embeddable_fraction(profile)
+        manifest["metrics"][name] = {
+            "embedding": METRICS[name][0], "mapping": METRICS[name][1],
+            "embeddable_fraction": embeddable, "undefined_fraction": undefined,
+            "z_max": float(profile["z"][-1]),
+            "files": pf[0] + ff[0], "bytes": pf[1] + ff[1], "gzip_bytes": pf[2] + ff[2],
+        }
+        if verbose:
+            print(f"  {name:<20s} {pf[0] + ff[0]:<7d} {(pf[1] + ff[1]) / 2**20:<10.2f} "
+                  f"{(pf[2] + ff[2]) / 2**20:<10.2f} {embeddable:<12.1%} "
+                  f"{time.perf_counter() - t0:<8.2f}")
+    os.makedirs(out_dir, exist_ok=True)
+    with open(os.path.join(out_dir, "manifest.json"), "w") as fh:
+        json.dump(manifest, fh, indent=2)
+        fh.write("\n")
+    return manifest
+
+
+# ═══════════════════════════════════════════════════════════
+# RUN
+# ═══════════════════════════════════════════════════════════
+
+if __name__ == "__main__":
+    out_dir = sys.argv[sys.argv.index("--out") + 1] if "--out" in sys.argv else OUTPUT_DIR
+
+    print()
+    print("=" * 100)
+    print("  EMBEDDING DIAGRAMS AND (r, θ) FIELD MAPS")
+    print("=" * 100)
+
+    # ─── TEST 1: FLAMM'S PARABOLOID ───────────────────────────
+    print()
+    print("─" * 100)
+    print("  TEST 1: SCHWARZSCHILD SLICE vs FLAMM'S PARABOLOID z = 2√(r/r_s - 1)")
+    print("─" * 100)
+    print()
+    p = embedding_profile("standard_gr")
+    exact = 2.0 * np.sqrt(p["x"] - 1.0)
+    err = np.abs(p["z"] - exact) / exact
+    print(f"  {len(p['x']):,} samples, max rel err {err.max():.2e} (at r/r_s - 1 = {p['x'][err.argmax()] - 1:.2e})")
+
+    # ─── TEST 2: PROFILES ─────────────────────────────────────
+    print()
+    print("─" * 100)
+    print("  TEST 2: EMBEDDING PROFILES z(r) AND ρ(r) = √g_φφ  (r_s = 1)")
+    print("─" * 100)
+    print()
+    names = distinct_metrics()
+    profiles = {name: embedding_profile(name) for name in names}
+    x_show = [1.001, 1.1, 1.5, 2.0, 5.0, 100.0]
+    print(f"  {'Metric':<20s} " + " ".join(f"{'z(' + format(v, 'g') + ')':<13s}" for v in x_show)
+          + f" {'embeddable':<11s} {'undefined':<10s} {'folds out to r/r_s':<18s}")
+    print(f"  {'─'*20} " + " ".join(f"{'─'*13}" for _ in x_show) + f" {'─'*11} {'─'*10} {'─'*18}")
+    for name, prof in profiles.items():
+        idx = [np.searchsorted(prof["x"], v) for v in x_show]
+        folded = prof["x"][prof["embeddable"] == 0]
+        embeddable, undefined = embeddable_fraction(prof)
+        print(f"  {name:<20s} " + " ".join(f"{prof['z'][i]:<13.6g}" for i in idx)
+              + f" {embeddable:<11.1%} {undefined:<10.1%} "
+              f"{folded.max() if folded.size else float('nan'):<18.6g}")
+    print()
+    print("  Not embeddable where g_rr < R'²: the areal radius R = √g_φφ changes faster than proper")
+    print("  radial distance. analyze_radius: R = r√ζ, ζ = 1/(1 - r_s/r), has its throat (R' = 0) at")
+    print("  1.5 r_s and grows back inward too steeply below ~1.25 r_s; prime_metric_v2: the ψ staircase")
+    print("  makes R' jump at every prime power. The embeddable fraction is over finite samples; undefined")
+    print("  counts NaN fields separately (prime_metric_v2 beyond PSI_X_MAX, r ≳ 3162 r_s).")
+
+    # ─── TEST 3: PYRAMIDS ─────────────────────────────────────
+    print()
+    print("─" * 100)
+    print(f"  TEST 3: TILE PYRAMIDS → {os.path.normpath(out_dir)}")
+    print(f"  profile: {PROFILE_LEVELS} levels × {PROFILE_TILE}-sample tiles;"
+          f" field map: {FIELD_LEVELS} levels × {FIELD_TILE}² tiles")
+    print("─" * 100)
+    print()
+    print(f"  {'Metric':<20s} {'files':<7s} {'raw (MB)':<10s} {'gzip (MB)':<10s} {'embeddable':<12s} {'time (s)':<8s}")
+    print(f"  {'─'*20} {'─'*7} {'─'*10} {'─'*10} {'─'*12} {'─'*8}")
+    manifest = export_pyramids(names, out_dir, verbose=True)
+    level0 = sum(os.path.getsize(os.path.join(out_dir, n, "profile", "L0", "0.f32.gz")) for n in names)
+    print()
+    print(f"  First paint (level-0 profile of every metric): {level0 / 1024:.1f} kB")
+    print(f"  Horizon zoom (ξ < -3, finest profile level): "
+          f"{math.ceil((-3 - XI_RANGE[0]) / (XI_RANGE[1] - XI_RANGE[0]) * (1 << (PROFILE_LEVELS - 1)))} tiles per metric")
+    print()
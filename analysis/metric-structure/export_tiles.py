@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Binary Lookup Tiles for the HTML Simulators
+===========================================
+metric.html, dimension_stack_chart.html and blackhole-simulator.html each
+re-implement ζ in JavaScript (a truncated Dirichlet sum, clamped near the
+pole), so their numbers drift from the Python analysis. This script
+evaluates metric_engine.py on exactly the radii each page needs and
+writes one tile per page to simulators/data/:
+
+    <tile>.f32.gz     gzip of little-endian float32, field-major:
+                      [field 0: n samples][field 1: n samples]…
+    manifest.json     per tile: metric, θ, axis (min, max, n, spacing),
+                      field order, byte count, sha256 of the raw block
+
+The page fetches the tile once with loadTile (simulators/tile_loader.js,
+shared by the three pages), which inflates it with DecompressionStream
+and wraps the buffer in a Float32Array — no parsing — falling back to
+its JavaScript ζ if the fetch fails (e.g. opened from file://).
+
+Usage:
+    python3 export_tiles.py
+
+Author: Christopher Riner & Barron
+"""
+
+import gzip
+import hashlib
+import json
+import math
+import os
+from collections import namedtuple
+
+import numpy as np
+
+from metric_engine import evaluate
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "simulators", "data")
+
+Tile = namedtuple("Tile", ["name", "page", "metric", "theta", "x_min", "x_max", "n", "spacing", "fields"])
+
+# Axes match the pages' own sampling, so most lookups are exact indices.
+TILES = [
+    # slider 5…300 → r/r_s = value/100
+    Tile("metric_explorer", "metric.html", "approach_A", math.pi / 2,
+         0.05, 3.00, 296, "linear", ["g_tt", "g_rr", "g_thth", "zeta"]),
+    # 50 log-spaced radii from 10 down to 0.1, θ = 60°
+    Tile("dimension_stack", "dimension_stack_chart.html", "approach_A", math.pi / 3,
+         10.0, 0.1, 50, "log", ["g_rr", "g_thth", "g_phph", "zeta"]),
+    # continuous r ∈ [R_MIN, R_MAX] — the page interpolates linearly in ln r; ζ ~ r⁻³ near R_MIN
+    Tile("blackhole_zeta", "blackhole-simulator.html", "blackhole_simulator", math.pi / 3,
+         0.15, 20.0, 8192, "log", ["zeta"]),
+]
+
+
+# ═══════════════════════════════════════════════════════════
+# EXPORT
+# ═══════════════════════════════════════════════════════════
+
+def tile_axis(tile):
+    if tile.spacing == "log":
+        return np.geomspace(tile.x_min, tile.x_max, tile.n)
+    return np.linspace(tile.x_min, tile.x_max, tile.n)
+
+
+def page_lookup(tile, values, x):
+    """values at x as the page reads them: linear interpolation in r, or in ln r for log tiles."""
+    axis = tile_axis(tile)
+    if tile.spacing == "log":
+        return np.interp(np.log(x), np.log(axis), values)
+    return np.interp(x, axis, values)
+
+
+def tile_block(tile):
+    """(n_fields, n) float32 block of the tile, straight from the engine."""
+    m = evaluate(tile_axis(tile), theta=tile.theta, metric=tile.metric)
+    return np.stack([np.asarray(getattr(m, f), dtype="<f4") for f in tile.fields])
+
+
+def export_tile(tile, data_dir=DATA_DIR):
+    """Write <name>.f32.gz; return its manifest entry."""
+    block = tile_block(tile)
+    raw = block.tobytes()
+    path = os.path.join(data_dir, tile.name + ".f32.gz")
+    with open(path, "wb") as fh:
+        fh.write(gzip.compress(raw, compresslevel=9, mtime=0))
+    finite = [block[i][np.isfinite(block[i])] for i in range(len(tile.fields))]
+    return {
+        "file": os.path.basename(path), "page": tile.page, "metric": tile.metric,
+        "theta": tile.theta,
+        "axis": {"name": "r_over_rs", "min": tile.x_min, "max": tile.x_max, "n": tile.n,
+                 "spacing": tile.spacing},
+        "dtype": "float32-le", "layout": "field-major", "fields": tile.fields,
+        "range": {f: [float(v.min()), float(v.max())] if v.size else None
+                  for f, v in zip(tile.fields, finite)},
+        "bytes": len(raw), "gzip_bytes": os.path.getsize(path),
+        "sha256": hashlib.sha256(raw).hexdigest(),
+    }
+
+
+def export_all(tiles=TILES, data_dir=DATA_DIR):
+    os.makedirs(data_dir, exist_ok=True)
+    manifest = {"generator": "analysis/metric-structure/export_tiles.py",
+                "tiles": {t.name: export_tile(t, data_dir) for t in tiles}}
+    with open(os.path.join(data_dir, "manifest.json"), "w") as fh:
+        json.dump(manifest, fh, indent=2)
+        fh.write("\n")
+    return manifest
+
+
+def read_tile(name, data_dir=DATA_DIR):
+    """Read a tile back exactly as the browser does: {field: float32 array}."""
+    with open(os.path.join(data_dir, "manifest.json")) as fh:
+        entry = json.load(fh)["tiles"][name]
+    with open(os.path.join(data_dir, entry["file"]), "rb") as fh:
+        raw = gzip.decompress(fh.read())
+    if hashlib.sha256(raw).hexdigest() != entry["sha256"]:
+        raise ValueError(f"{entry['file']}: checksum mismatch with manifest")
+    block = np.frombuffer(raw, dtype="<f4").reshape(len(entry["fields"]), entry["axis"]["n"])
+    return dict(zip(entry["fields"], block))
+
+
+# ═══════════════════════════════════════════════════════════
+# RUN
+# ═══════════════════════════════════════════════════════════
+
+if __name__ == "__main__":
+    print()
+    print("=" * 100)
+    print("  SIMULATOR LOOKUP TILES")
+    print("=" * 100)
+    print()
+    manifest = export_all()
+    print(f"  {'Tile':<18s} {'Page':<28s} {'Metric':<20s} {'n':<6s} {'fields':<4s} "
+          f"{'raw (B)':<10s} {'gzip (B)':<10s} {'round trip':<10s}")
+    print(f"  {'─'*18} {'─'*28} {'─'*20} {'─'*6} {'─'*4} {'─'*10} {'─'*10} {'─'*10}")
+    for tile in TILES:
+        entry = manifest["tiles"][tile.name]
+        back = read_tile(tile.name)
+        exact = tile_block(tile)
+        same = all(np.array_equal(back[f], exact[i], equal_nan=True) for i, f in enumerate(tile.fields))
+        print(f"  {tile.name:<18s} {tile.page:<28s} {tile.metric:<20s} {tile.n:<6d} {len(tile.fields):<4d} "
+              f"{entry['bytes']:<10d} {entry['gzip_bytes']:<10d} {'exact' if same else 'MISMATCH':<10s}")
+
+    print()
+    print("  ζ: engine vs the pages' JavaScript sums (metric.html: Σ n≤200, clamped to 100 for s ≤ 1.01)")
+    print()
+    z = read_tile("metric_explorer")["zeta"]
+    x = tile_axis(TILES[0])
+    print(f"  {'r/r_s':<8s} {'s':<12s} {'ζ tile':<16s} {'ζ JS':<16s} {'rel diff':<10s}")
+    print(f"  {'─'*8} {'─'*12} {'─'*16} {'─'*16} {'─'*10}")
+    for i in (0, 10, 25, 50, 95, 150, 295):
+        s = 1 + x[i]**3
+        js = 100.0 if s <= 1.01 else 1.0 + sum(n ** -s for n in range(2, 201))
+        print(f"  {x[i]:<8.2f} {s:<12.6g} {z[i]:<16.8g} {js:<16.8g} {abs(z[i] - js) / z[i]:<10.2e}")
+    print()
+    tile = TILES[2]
+    x = np.geomspace(tile.x_min, tile.x_max, 200_001)
+    exact = np.asarray(evaluate(x, theta=tile.theta, metric=tile.metric).zeta)
+    err = np.abs(page_lookup(tile, read_tile(tile.name)["zeta"], x) - exact) / exact
+    print(f"  blackhole-simulator.html zetaAt (ln-r interpolation of {tile.n} samples) vs the engine at "
+          f"{x.size:,} radii:")
+    print(f"  max rel err {err.max():.1e} at r/r_s = {x[err.argmax()]:.4f} (float32 itself: 6.0e-08)")
+    print()
+    print(f"  → {os.path.normpath(DATA_DIR)}")
+    print()
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Mass × Radius Sweep: Chunked, Parallel, Resumable
+=================================================
+zeta_embedded_vs_dimension.py and black_hole_prime_metric.py look at a
+solar-mass hole and Earth at a dozen radii. This runner evaluates any
+metric_engine.py metric on a dense (M, r) grid — asteroid (10¹⁵ kg) to
+supermassive (10⁴¹ kg), 1.0001 r_s to 10⁹ r_s — split into bands of
+masses. Each band is computed by a worker process and written as its own
+columnar file
+
+    out_dir/manifest.json        grid axes, metric, fields, dtype, units
+    out_dir/radial.npz           fields that don't depend on M, shape (n_r,)
+    out_dir/part_NNNNN.npz       the rest, shape (masses in band, n_r)
+
+Each file is written to a temporary name and renamed when complete, so
+an interrupted run leaves only whole parts. Re-running with the same
+arguments skips every part already on disk: a 10⁸-cell sweep can be
+stopped and resumed at will.
+
+No mapping in metric_engine.py depends on M, so in lengths of r_s every
+field is a function of r/r_s alone; only units="si" (the default here)
+brings M in, through r_s² in g_θθ, g_φφ, volume and trace. Fields that
+don't depend on M are evaluated once as a radial profile, and a sweep in
+which nothing does is rejected.
+
+Usage:
+    python3 mass_radius_sweep.py
+    python3 mass_radius_sweep.py --metric approach_A --nm 10000 --nr 10000 --workers 8
+
+Author: Christopher Riner & Barron
+"""
+
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from metric_engine import FIELDS, MAPPINGS, METRICS, evaluate_grid, r_s_of
+
+OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "output")
+
+# ═══════════════════════════════════════════════════════════
+# CONSTANTS
+# ═══════════════════════════════════════════════════════════
+M_RANGE = (1e15, 1e41)          # kg: km-size asteroid … 5·10¹⁰ M_sun
+X_RANGE = (1.0001, 1e9)         # r / r_s
+DEFAULT_FIELDS = ["g_tt", "g_rr", "clock", "zeta", "volume"]
+CELLS_PER_PART = 1 << 22        # ≈ 4M cells → 32 MB per float64 field
+SI_MASS_FIELDS = {"g_thth", "g_phph", "volume", "trace"}   # carry r_s² when units="si"
+
+
+# ═══════════════════════════════════════════════════════════
+# SWEEP
+# ═══════════════════════════════════════════════════════════
+
+def sweep_spec(metric="approach_A", n_m=1000, n_r=1000, m_range=M_RANGE, x_range=X_RANGE,
+               theta=math.pi / 2, fields=None, dtype="float64", units="si", masses_per_part=None):
+    """
+    The manifest of a sweep: everything that determines its output.
+    "radial" lists the requested fields that depend on r/r_s alone; if
+    that is all of them the sweep is a single profile and ValueError is
+    raised (use evaluate_grid with one mass instead).
+    """
+    if metric not in METRICS:
+        raise KeyError(f"Unknown metric {metric!r}; known: {', '.join(METRICS)}")
+    fields = list(fields or DEFAULT_FIELDS)
+    unknown = set(fields) - set(FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown fields {sorted(unknown)}; available: {', '.join(FIELDS)}")
+    if units not in ("rs", "si"):
+        raise ValueError(f"units must be 'rs' or 'si', not {units!r}")
+    if MAPPINGS[METRICS[metric][1]].mass_dependent:
+        radial = []
+    else:
+        radial = [f for f in fields if not (units == "si" and f in SI_MASS_FIELDS)]
+    if len(radial) == len(fields):
+        raise ValueError(f"No field of {metric!r} in units={units!r} depends on M — every mass row "
+                         f"would be identical; sweep with units='si' and one of "
+                         f"{', '.join(sorted(SI_MASS_FIELDS))}, or evaluate one radial profile")
+    masses_per_part = masses_per_part or max(1, CELLS_PER_PART // n_r)
+    return {
+        "metric": metric, "embedding": METRICS[metric][0], "mapping": METRICS[metric][1],
+        "n_m": int(n_m), "n_r": int(n_r),
+        "m_range": [float(v) for v in m_range], "x_range": [float(v) for v in x_range],
+        "theta": float(theta), "fields": fields, "radial": radial,
+        "dtype": np.dtype(dtype).name, "units": units,
+        "masses_per_part": int(masses_per_part),
+        "n_parts": math.ceil(n_m / masses_per_part),
+    }
+
+
+def axes(spec):
+    """(M [kg], x = r/r_s) axes of a sweep."""
+    return np.geomspace(*spec["m_range"], spec["n_m"]), np.geomspace(*spec["x_range"], spec["n_r"])
+
+
+def _part_path(out_dir, idx):
+    return os.path.join(out_dir, f"part_{idx:05d}.npz")
+
+
+def _radial_path(out_dir):
+    return os.path.join(out_dir, "radial.npz")
+
+
+def _mass_fields(spec):
+    return [f for f in spec["fields"] if f not in spec["radial"]]
+
+
+def _run_radial(spec, out_dir):
+    M, x = axes(spec)
+    grid = evaluate_grid(x, M[:1], [spec["theta"]], metric=spec["metric"], units=spec["units"],
+                         fields=spec["radial"], dtype=np.dtype(spec["dtype"]))
+    path = _radial_path(out_dir)
+    tmp = path + ".tmp.npz"
+    np.savez(tmp, **{f: getattr(grid, f)[:, 0, 0] for f in spec["radial"]})
+    os.replace(tmp, path)
+
+
+def _run_part(spec, out_dir, idx):
+    M, x = axes(spec)
+    lo = idx * spec["masses_per_part"]
+    Mb = M[lo:lo + spec["masses_per_part"]]
+    fields = _mass_fields(spec)
+    grid = evaluate_grid(x, Mb, [spec["theta"]], metric=spec["metric"], units=spec["units"],
+                         fields=fields, dtype=np.dtype(spec["dtype"]))
+    cols = {f: np.ascontiguousarray(getattr(grid, f)[:, :, 0].T) for f in fields}
+    path = _part_path(out_dir, idx)
+    tmp = path + ".tmp.npz"
+    np.savez(tmp, M=Mb, **cols)
+    os.replace(tmp, path)
+    return idx
+
+
+def run_sweep(spec, out_dir=None, workers=None, overwrite=False, verbose=False):
+    """
+    Compute every missing part of the sweep described by spec. An existing
+    out_dir must hold the same manifest (else ValueError, or start over
+    with overwrite=True). Returns out_dir.
+    """
+    out_dir = out_dir or os.path.join(OUTPUT_DIR, f"mass_radius_{spec['metric']}")
+    os.makedirs(out_dir, exist_ok=True)
+    manifest = os.path.join(out_dir, "manifest.json")
+    if os.path.exists(manifest):
+        with open(manifest) as fh:
+            old = json.load(fh)
+        if old != spec:
+            if not overwrite:
+                raise ValueError(f"{out_dir} holds a different sweep; pass overwrite=True to replace it")
+            for name in os.listdir(out_dir):
+                if name.startswith(("part_", "radial")):
+                    os.remove(os.path.join(out_dir, name))
+    with open(manifest, "w") as fh:
+        json.dump(spec, fh, indent=2)
+    for name in os.listdir(out_dir):
+        if name.endswith(".tmp.npz"):
+            os.remove(os.path.join(out_dir, name))
+
+    if spec["radial"] and not os.path.exists(_radial_path(out_dir)):
+        _run_radial(spec, out_dir)
+    todo = [i for i in range(spec["n_parts"]) if not os.path.exists(_part_path(out_dir, i))]
+    t0 = time.perf_counter()
+    if verbose:
+        print(f"    {spec['n_parts'] - len(todo)}/{spec['n_parts']} parts on disk, {len(todo)} to run")
+
+    def _done(k, idx):
+        if verbose:
+            dt = time.perf_counter() - t0
+            eta = dt / k * (len(todo) - k)
+            print(f"    part {idx + 1}/{spec['n_parts']} written  ({dt:.1f} s, ETA {eta:.1f} s)")
+
+    if workers == 1 or len(todo) <= 1:
+        for k, idx in enumerate(todo, start=1):
+            _done(k, _run_part(spec, out_dir, idx))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_run_part, spec, out_dir, idx) for idx in todo]
+            for k, fut in enumerate(as_completed(futures), start=1):
+                _done(k, fut.result())
+    return out_dir
+
+
+def sweep_status(out_dir):
+    """(parts done, parts total) of the sweep in out_dir."""
+    with open(os.path.join(out_dir, "manifest.json")) as fh:
+        spec = json.load(fh)
+    done = sum(os.path.exists(_part_path(out_dir, i)) for i in range(spec["n_parts"]))
+    return done, spec["n_parts"]
+
+
+def load_sweep(out_dir, fields=None):
+    """
+    {"M", "x", "r_s", field…} with fields as (n_m, n_r) arrays, parts in
+    order; radial fields are read-only broadcasts of their one profile.
+    Raises if the sweep is incomplete.
+    """
+    with open(os.path.join(out_dir, "manifest.json")) as fh:
+        spec = json.load(fh)
+    done, total = sweep_status(out_dir)
+    if done < total:
+        raise RuntimeError(f"{out_dir}: {done}/{total} parts — resume the sweep first")
+    fields = list(fields or spec["fields"])
+    M, x = axes(spec)
+    shape = (spec["n_m"], spec["n_r"])
+    out = {}
+    radial = [f for f in fields if f in spec["radial"]]
+    if radial:
+        with np.load(_radial_path(out_dir)) as data:
+            out.update({f: np.broadcast_to(data[f], shape) for f in radial})
+    per_mass = [f for f in fields if f not in spec["radial"]]
+    out.update({f: np.empty(shape, dtype=spec["dtype"]) for f in per_mass})
+    for i in range(total if per_mass else 0):
+        lo = i * spec["masses_per_part"]
+        with np.load(_part_path(out_dir, i)) as data:
+            for f in per_mass:
+                out[f][lo:lo + len(data["M"])] = data[f]
+    return {"M": M, "x": x, "r_s": r_s_of(M), **out}
+
+
+# ═══════════════════════════════════════════════════════════
+# RUN
+# ═══════════════════════════════════════════════════════════
+
+if __name__ == "__main__":
+    metric = sys.argv[sys.argv.index("--metric") + 1] if "--metric" in sys.argv else "approach_A"
+    n_m = int(float(sys.argv[sys.argv.index("--nm") + 1])) if "--nm" in sys.argv else 2000
+    n_r = int(float(sys.argv[sys.argv.index("--nr") + 1])) if "--nr" in sys.argv else 5000
+    workers = int(sys.argv[sys.argv.index("--workers") + 1]) if "--workers" in sys.argv else None
+
+    print()
+    print("=" * 100)
+    print("  MASS × RADIUS SWEEP")
+    print(f"  M ∈ [{M_RANGE[0]:g}, {M_RANGE[1]:g}] kg × r/r_s ∈ [{X_RANGE[0]:g}, {X_RANGE[1]:g}]")
+    print("=" * 100)
+
+    # ─── TEST 1: INTERRUPT AND RESUME ─────────────────────────
+    print()
+    print("─" * 100)
+    print("  TEST 1: INTERRUPT + RESUME — 200 × 1000 cells in 8 parts, 3 parts deleted, rerun")
+    print("─" * 100)
+    print()
+    spec = sweep_spec("v4", n_m=200, n_r=1000, masses_per_part=25, fields=FIELDS, dtype="float64")
+    out_dir = run_sweep(spec, os.path.join(OUTPUT_DIR, "mass_radius_resume_test"), workers=workers,
+                        overwrite=True)
+    for i in (1, 4, 6):
+        os.remove(_part_path(out_dir, i))
+    print(f"  after deletion: {sweep_status(out_dir)[0]}/{spec['n_parts']} parts")
+    t0 = time.perf_counter()
+    run_sweep(spec, out_dir, workers=workers, verbose=True)
+    print(f"  resumed in {time.perf_counter() - t0:.2f} s")
+    data = load_sweep(out_dir)
+    M, x = axes(spec)
+    ref = evaluate_grid(x, M, [spec["theta"]], metric="v4", units="si")
+    worst = max(np.nanmax(np.abs(data[f] - getattr(ref, f)[:, :, 0].T)) for f in FIELDS
+                if np.isfinite(getattr(ref, f)).any())
+    print(f"  max |resumed - direct| over all fields: {worst:.1e}  "
+          f"(radial profile: {', '.join(spec['radial'])})")
+    try:
+        sweep_spec("v4", units="rs")
+    except ValueError as err:
+        print(f"  units='rs' rejected: {str(err)[:72]}…")
+
+    # ─── TEST 2: FULL SWEEP ───────────────────────────────────
+    print()
+    print("─" * 100)
+    print(f"  TEST 2: {metric} — {n_m:,} masses × {n_r:,} radii = {n_m * n_r:,} cells")
+    print("─" * 100)
+    print()
+    spec = sweep_spec(metric, n_m=n_m, n_r=n_r)
+    t0 = time.perf_counter()
+    out_dir = run_sweep(spec, workers=workers, overwrite=True, verbose=True)
+    dt = time.perf_counter() - t0
+    size = sum(os.path.getsize(os.path.join(out_dir, f)) for f in os.listdir(out_dir))
+    print()
+    print(f"  {n_m * n_r:,} cells in {dt:.1f} s ({n_m * n_r / dt / 1e6:.2f} M cells/s), "
+          f"{size / 2**20:.0f} MB on disk → {out_dir}")
+    print(f"  10⁸ cells at this rate: {1e8 / (n_m * n_r / dt) / 60:.1f} min")
+
+    data = load_sweep(out_dir, ["g_tt", "zeta", "volume"])
+    print()
+    print(f"  {'M (kg)':<12s} {'r/r_s':<10s} {'g_tt':<16s} {'ζ':<16s} {'√|g| (m²)':<16s}")
+    print(f"  {'─'*12} {'─'*10} {'─'*16} {'─'*16} {'─'*16}")
+    for i in (0, n_m // 2, n_m - 1):
+        for j in (0, n_r // 1000, n_r - 1):
+            print(f"  {data['M'][i]:<12.3e} {data['x'][j]:<10.4g} {data['g_tt'][i, j]:<16.8g} "
+                  f"{data['zeta'][i, j]:<16.8g} {data['volume'][i, j]:<16.8g}")
+    rows = np.unique(data["volume"], axis=0).shape[0]
+    print()
+    print(f"  g_tt and ζ depend on r/r_s alone (stored once); {rows} distinct volume rows of {n_m}")
+    print()
@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+Metric Engine: Every Prime/ζ Metric on (r, M, θ) Grids
+======================================================
+approach_A / approach_B (zeta_embedded_vs_dimension.py), prime_4d /
+standard_gr (zeta_4d_pure.py), prime_metric (gr_emergence_from_primes.py
+and gr_emergence_v2.py), analyze_radius (black_hole_prime_metric.py) and
+symmetry_at (v3, v4) are the same computation with two choices swapped:
+
+  mapping     how the radius sets the ζ factor    x = r/r_s, M → (s, ζ - 1)
+  embedding   where the factor enters g_μν        (x, sin²θ, ζ - 1) → diag g
+
+Both are plug-ins (register_mapping / register_embedding); METRICS names
+the combination each legacy script uses. Evaluation is vectorized with
+ζ from kretschner/zeta_numpy.py and returns a structure of arrays
+
+    g_tt, g_rr, g_thth, g_phph, clock = √|g_tt|, zeta, s,
+    volume = √|det g|, trace = g_tt + g_rr + g_θθ + g_φφ
+
+in geometric units (lengths in r_s; units="si" rescales the angular
+components and volume by r_s²). evaluate_grid fills preallocated arrays
+chunk by chunk, so a 10⁷-point (r, M, θ) sweep costs only its output.
+
+Usage:
+    python3 metric_engine.py
+    python3 metric_engine.py --n 10000000
+
+Author: Christopher Riner & Barron
+"""
+
+import math
+import os
+import sys
+import time
+from collections import namedtuple
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "kretschner"))
+from zeta_numpy import invert_zeta_np, zeta_derivatives_np  # noqa: E402
+
+# ═══════════════════════════════════════════════════════════
+# CONSTANTS
+# ═══════════════════════════════════════════════════════════
+G = 6.67430e-11
+c = 2.99792458e8
+M_sun = 1.989e30
+
+CHUNK = 1 << 18                 # points per evaluation pass
+PSI_X_MAX = 10_000_000          # ψ(x) tabulated exactly up to here (v2: x = (r/r_s)²)
+
+FIELDS = ["g_tt", "g_rr", "g_thth", "g_phph", "clock", "zeta", "s", "volume", "trace"]
+MetricFields = namedtuple("MetricFields", FIELDS)
+
+Mapping = namedtuple("Mapping", ["name", "func", "description", "mass_dependent"])
+Embedding = namedtuple("Embedding", ["name", "func", "description"])
+MAPPINGS = {}     # name → Mapping
+EMBEDDINGS = {}   # name → Embedding
+
+# Legacy function → (embedding, mapping)
+METRICS = {
+    "standard_gr":         ("gr", "cubic"),
+    "approach_A":          ("embedded", "cubic"),
+    "approach_B":          ("gr", "cubic"),
+    "prime_4d":            ("embedded", "cubic"),
+    "prime_metric_v1":     ("prime", "linear"),
+    "prime_metric_v2":     ("prime", "psi"),
+    "analyze_radius":      ("prime", "zeta-inversion"),
+    "v3":                  ("inverse", "zeta-inversion"),
+    "v4":                  ("inverse", "zeta-inversion"),
+    "blackhole_simulator": ("spatial", "cubic"),
+}
+
+
+def r_s_of(M):
+    return 2 * G * np.asarray(M, dtype=float) / c**2
+
+
+# ═══════════════════════════════════════════════════════════
+# MAPPINGS:  (x = r/r_s, M) → (s, ζ - 1)
+# ═══════════════════════════════════════════════════════════
+
+def register_mapping(name, description="", mass_dependent=False):
+    """mass_dependent=False: s depends on r/r_s alone, evaluated once per radius on grids."""
+    def _register(func):
+        MAPPINGS[name] = Mapping(name, func, description, mass_dependent)
+        return func
+    return _register
+
+
+def _zeta_minus_one(s):
+    """ζ(s) - 1, ∞ at and below the pole (as the Euler-product scripts return)."""
+    zm1 = zeta_derivatives_np(s, order=0, minus_one=True)[0]
+    return np.where(s > 1.0, zm1, np.inf)
+
+
+@register_mapping("cubic", "s = 1 + (r/r_s)³  (approach A/B, prime_4d, LIGO, black-hole simulator)")
+def map_cubic(x, M):
+    s = 1.0 + x**3
+    return s, _zeta_minus_one(s)
+
+
+@register_mapping("linear", "s = 1 + r/r_s  (s_linear, v1)")
+def map_linear(x, M):
+    s = 1.0 + x
+    return s, _zeta_minus_one(s)
+
+
+@register_mapping("log2", "s = log₂(r/r_s)  (weak-field law of v3/v4)")
+def map_log2(x, M):
+    s = np.log2(x)
+    return s, _zeta_minus_one(s)
+
+
+@register_mapping("zeta-inversion", "ζ(s) = (1 - r_s/r)⁻¹  (analyze_radius, v3, v4)")
+def map_zeta_inversion(x, M):
+    outside = x > 1.0
+    zm1 = np.where(outside, 1.0 / np.where(outside, x - 1.0, 1.0), np.inf)
+    s = np.where(outside, invert_zeta_np(1.0 + zm1, zm1), 1.0)
+    return s, zm1
+
+
+@register_mapping("psi", "ζ → x/ψ(x), x = (r/r_s)²  (Chebyshev ψ, v2; NaN beyond PSI_X_MAX)")
+def map_psi(x, M):
+    x2 = x**2
+    psi = chebyshev_psi(x2)
+    zm1 = np.where(psi > 0, x2 / np.where(psi > 0, psi, 1.0) - 1.0, np.inf)
+    return np.full_like(x2, np.nan), np.where(x2 <= PSI_X_MAX, zm1, np.nan)
+
+
+_PSI_TABLE = None
+
+
+def chebyshev_psi(x):
+    """ψ(x) = Σ_{pᵏ ≤ x} ln p, exact for x ≤ PSI_X_MAX (sieve + cumulative sum, built once)."""
+    global _PSI_TABLE
+    if _PSI_TABLE is None:
+        sieve = np.ones(PSI_X_MAX + 1, dtype=bool)
+        sieve[:2] = False
+        for i in range(2, int(PSI_X_MAX**0.5) + 1):
+            if sieve[i]:
+                sieve[i * i::i] = False
+        primes = np.flatnonzero(sieve)
+        powers, logs = [primes.astype(float)], [np.log(primes)]
+        p = primes.astype(float)
+        while True:
+            p = p * primes[:len(p)]
+            keep = p <= PSI_X_MAX
+            if not keep.any():
+                break
+            p = p[keep]
+            powers.append(p)
+            logs.append(np.log(primes[:len(p)]))
+        pp = np.concatenate(powers)
+        order = np.argsort(pp)
+        _PSI_TABLE = (pp[order], np.cumsum(np.concatenate(logs)[order]))
+    pp, cum = _PSI_TABLE
+    i = np.searchsorted(pp, x, side="right")
+    return np.where(i > 0, cum[np.maximum(i - 1, 0)], 0.0)
+
+
+# ═══════════════════════════════════════════════════════════
+# EMBEDDINGS:  (x, sin²θ, ζ - 1) → (g_tt, g_rr, g_θθ, g_φφ), r_s = 1
+# ═══════════════════════════════════════════════════════════
+
+def register_embedding(name, description=""):
+    def _register(func):
+        EMBEDDINGS[name] = Embedding(name, func, description)
+        return func
+    return _register
+
+
+@register_embedding("gr", "Schwarzschild; ζ tracked separately (standard_gr, approach B)")
+def embed_gr(x, sin2, zm1):
+    g = 1.0 - 1.0 / x
+    return -g, 1.0 / g, x**2, x**2 * sin2
+
+
+@register_embedding("embedded", "All four Schwarzschild components × ζ (approach A, prime_4d)")
+def embed_embedded(x, sin2, zm1):
+    g = 1.0 - 1.0 / x
+    z = 1.0 + zm1
+    return -g * z, z / g, x**2 * z, x**2 * sin2 * z
+
+
+@register_embedding("prime", "diag(-1/ζ, ζ, r²ζ, r²sin²θ ζ)  (prime_metric v1/v2, analyze_radius)")
+def embed_prime(x, sin2, zm1):
+    z = 1.0 + zm1
+    return -1.0 / z, z, x**2 * z, x**2 * sin2 * z
+
+
+@register_embedding("inverse", "diag(-1/ζ, ζ, r², r²sin²θ)  (v3 symmetry_at, v4)")
+def embed_inverse(x, sin2, zm1):
+    z = 1.0 + zm1
+    return -1.0 / z, z, x**2, x**2 * sin2
+
+
+@register_embedding("spatial", "Schwarzschild g_tt, (1 + r_s/r)ζ, r²ζ  (blackhole-simulator.html)")
+def embed_spatial(x, sin2, zm1):
+    z = 1.0 + zm1
+    return -(1.0 - 1.0 / x), (1.0 + 1.0 / x) * z, x**2 * z, x**2 * sin2 * z
+
+
+# ═══════════════════════════════════════════════════════════
+# EVALUATION
+# ═══════════════════════════════════════════════════════════
+
+def _resolve(metric, embedding, mapping):
+    if metric is not None:
+        try:
+            embedding, mapping = METRICS[metric]
+        except KeyError:
+            raise KeyError(f"Unknown metric {metric!r}; known: {', '.join(METRICS)}")
+    for name, table, kind in ((embedding, EMBEDDINGS, "embedding"), (mapping, MAPPINGS, "mapping")):
+        if name not in table:
+            raise KeyError(f"Unknown {kind} {name!r}; registered: {', '.join(table)}")
+    return EMBEDDINGS[embedding], MAPPINGS[mapping]
+
+
+def _mapped(mp, x, M):
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        return mp.func(x, M)
+
+
+def _fields(x, M, theta, s, zm1, emb, units):
+    """All nine fields as float64 arrays on broadcast (x, M, θ) with the mapping already applied."""
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        sin2 = np.sin(theta)**2
+        g_tt, g_rr, g_thth, g_phph = emb.func(x, sin2, zm1)
+        if units == "si":
+            rs2 = r_s_of(M)**2
+            g_thth, g_phph = g_thth * rs2, g_phph * rs2
+        elif units != "rs":
+            raise ValueError(f"units must be 'rs' or 'si', not {units!r}")
+        volume = np.sqrt(np.abs(g_tt * g_rr)) * np.sqrt(np.abs(g_thth)) * np.sqrt(np.abs(g_phph))
+        return {
+            "g_tt": g_tt, "g_rr": g_rr, "g_thth": g_thth, "g_phph": g_phph,
+            "clock": np.sqrt(np.abs(g_tt)), "zeta": 1.0 + zm1, "s": s,
+            "volume": volume, "trace": g_tt + g_rr + g_thth + g_phph,
+        }
+
+
+def evaluate(x, M=M_sun, theta=math.pi / 2, metric=None, embedding="embedded", mapping="cubic",
+             units="rs"):
+    """
+    MetricFields at points x = r/r_s, M [kg], θ (broadcast together).
+    Pass metric="approach_A", "v4", … for a legacy combination, or choose
+    embedding and mapping directly.
+    """
+    emb, mp = _resolve(metric, embedding, mapping)
+    x, M, theta = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(M, dtype=float),
+                                      np.asarray(theta, dtype=float))
+    s, zm1 = _mapped(mp, x, M)
+    cols = _fields(x, M, theta, s, zm1, emb, units)
+    return MetricFields(**{f: np.broadcast_to(cols[f], x.shape) for f in FIELDS})
+
+
+def evaluate_grid(x, M, theta, metric=None, embedding="embedded", mapping="cubic", units="rs",
+                  fields=None, dtype=np.float64, chunk=CHUNK):
+    """
+    MetricFields of shape (len(x), len(M), len(θ)) on the outer product of
+    the three axes. Only the requested fields are allocated (others None),
+    in dtype; the grid is evaluated in flat chunks of `chunk` points. The
+    mapping runs once per radius (once per (r, M) if mass-dependent).
+    float32 needs units="rs": r² in metres overflows it beyond ~10¹⁹ m.
+    """
+    emb, mp = _resolve(metric, embedding, mapping)
+    x, M, theta = (np.asarray(a, dtype=float).ravel() for a in (x, M, theta))
+    shape = (len(x), len(M), len(theta))
+    if mp.mass_dependent:
+        s_plane, zm1_plane = _mapped(mp, x[:, None], M[None, :])
+    else:
+        s_plane, zm1_plane = (np.broadcast_to(a[:, None], shape[:2]) for a in _mapped(mp, x, M[:1]))
+    fields = list(fields or FIELDS)
+    out = {f: np.empty(shape, dtype=dtype) for f in fields}
+    flat = {f: a.reshape(-1) for f, a in out.items()}
+    n = math.prod(shape)
+    for start in range(0, n, chunk):
+        idx = np.arange(start, min(start + chunk, n))
+        i, j, k = np.unravel_index(idx, shape)
+        cols = _fields(x[i], M[j], theta[k], s_plane[i, j], zm1_plane[i, j], emb, units)
+        for f in fields:
+            flat[f][start:start + len(idx)] = cols[f]
+    return MetricFields(**{f: out.get(f) for f in FIELDS})
+
+
+# ═══════════════════════════════════════════════════════════
+# RUN
+# ═══════════════════════════════════════════════════════════
+
+if __name__ == "__main__":
+    n_total = int(float(sys.argv[sys.argv.index("--n") + 1])) if "--n" in sys.argv else 10_000_000
+
+    print()
+    print("=" * 110)
+    print("  METRIC ENGINE — PLUGGABLE ζ EMBEDDING × s-MAPPING")
+    print("=" * 110)
+
+    # ─── TEST 1: LEGACY COMBINATIONS ──────────────────────────
+    print()
+    print("─" * 110)
+    print("  TEST 1: EVERY LEGACY METRIC AT r = 1.5, 3, 10, 1000 r_s (θ = π/2, r_s = 1)")
+    print("─" * 110)
+    print()
+    x = np.array([1.5, 3.0, 10.0, 1000.0])
+    print(f"  {'Metric':<20s} {'r/r_s':<8s} {'g_tt':<14s} {'g_rr':<14s} {'g_θθ/r²':<14s} "
+          f"{'clock':<14s} {'ζ':<14s} {'s':<14s} {'√|g|/r²':<12s}")
+    print(f"  {'─'*20} {'─'*8} {'─'*14} {'─'*14} {'─'*14} {'─'*14} {'─'*14} {'─'*14} {'─'*12}")
+    for name in METRICS:
+        m = evaluate(x, metric=name)
+        for i, xi in enumerate(x):
+            print(f"  {name if i == 0 else '':<20s} {xi:<8g} {m.g_tt[i]:<14.8g} {m.g_rr[i]:<14.8g} "
+                  f"{m.g_thth[i] / xi**2:<14.8g} {m.clock[i]:<14.8g} {m.zeta[i]:<14.8g} "
+                  f"{m.s[i]:<14.8g} {m.volume[i] / xi**2:<12.6g}")
+
+    # ─── TEST 2: AGAINST mpmath ───────────────────────────────
+    try:
+        import mpmath
+    except ImportError:
+        mpmath = None
+    if mpmath is not None:
+        print()
+        print("─" * 110)
+        print("  TEST 2: ζ, g_tt, g_rr vs mpmath (approach_A and analyze_radius, 1.01 ≤ r/r_s ≤ 1e6)")
+        print("─" * 110)
+        print()
+        x = np.geomspace(1.01, 1e6, 25)
+        for name in ("approach_A", "analyze_radius"):
+            m = evaluate(x, metric=name)
+            errs = []
+            for xi, s, gtt, grr in zip(x, m.s, m.g_tt, m.g_rr):
+                z = mpmath.zeta(mpmath.mpf(float(s)))
+                g = 1 - 1 / mpmath.mpf(float(xi))
+                ref = (-g * z, z / g) if name == "approach_A" else (-1 / z, z)
+                errs.append(max(abs(float((gtt - ref[0]) / ref[0])), abs(float((grr - ref[1]) / ref[1]))))
+            print(f"  {name:<16s} max rel err {max(errs):.2e}")
+
+    # ─── TEST 3: LARGE GRID ───────────────────────────────────
+    print()
+    print("─" * 110)
+    print(f"  TEST 3: {n_total:,}-POINT (r, M, θ) GRID, ALL NINE FIELDS, float32 (r_s units)")
+    print("─" * 110)
+    print()
+    n_theta = 10
+    n_m = 100
+    n_x = max(1, n_total // (n_theta * n_m))
+    xs = np.geomspace(1.0001, 1e9, n_x)
+    Ms = np.geomspace(1e20, 1e40, n_m)
+    thetas = np.linspace(0.0, math.pi / 2, n_theta)
+    print(f"  {'Metric':<20s} {'points':<14s} {'time (s)':<10s} {'Mpts/s':<10s} {'memory (MB)':<12s}")
+    print(f"  {'─'*20} {'─'*14} {'─'*10} {'─'*10} {'─'*12}")
+    for name in ("approach_A", "v4", "prime_metric_v1", "prime_metric_v2"):
+        t0 = time.perf_counter()
+        grid = evaluate_grid(xs, Ms, thetas, metric=name, dtype=np.float32)
+        dt = time.perf_counter() - t0
+        n = grid.g_tt.size
+        mem = sum(a.nbytes for a in grid if a is not None) / 2**20
+        print(f"  {name:<20s} {n:<14,} {dt:<10.2f} {n / dt / 1e6:<10.2f} {mem:<12.0f}")
+        del grid
+    print()
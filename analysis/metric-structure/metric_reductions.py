@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""
+Volume Element, Determinant and Trace Reductions; Proper Distance and Volume
+============================================================================
+analyze_radius prints vol_prime = r² sinθ ζ² at a dozen radii and
+gr_emergence_from_primes.py loops over s printing Tr(g). Over the
+metric_engine.py output this script computes, with no per-point Python:
+
+  reduce_grid                  min / max / mean of √|det g|, Tr g, … over an
+                               (r, M, θ) grid streamed block by block, plus
+                               the mean at every radius
+  proper_distance(a, b)        ∫ₐᵇ √|g_rr| dr            for arrays of intervals
+  proper_volume(a, b)          ∫ √|g_rr g_θθ g_φφ| dr dθ dφ over shells
+  distance_to_horizon(x)       ∫_{r_s}^{r} √|g_rr| dr     for 10⁶ radii in one pass
+
+The integrals use adaptive Gauss–Kronrod (7/15) quadrature vectorized over
+panels: every round evaluates the engine once on all open panels, accepts
+those whose Kronrod–Gauss difference is within tolerance and bisects the
+rest. Radii are integrated in u = sign(r - r_s)·√|r/r_s - 1|, which turns
+the g_rr ~ 1/(r - r_s) horizon singularity into a smooth integrand.
+distance_to_horizon integrates once out to the largest radius and reads
+every radius off the accepted panels' interpolants, so 10⁶ radii cost a
+few hundred panels rather than 10⁶ integrals.
+
+Usage:
+    python3 metric_reductions.py
+    python3 metric_reductions.py --n 1e7
+
+Author: Christopher Riner & Barron
+"""
+
+import math
+import sys
+import time
+
+import numpy as np
+
+from metric_engine import CHUNK, FIELDS, M_sun, MAPPINGS, METRICS, evaluate, evaluate_grid, r_s_of
+
+# ═══════════════════════════════════════════════════════════
+# CONSTANTS
+# ═══════════════════════════════════════════════════════════
+# Gauss–Kronrod 7/15 on [-1, 1]: nodes 0…6 (±), 7 the centre; Gauss nodes are the odd ones
+GK_X = np.array([0.991455371120812639206854697526329, 0.949107912342758524526189684047851,
+                 0.864864423359769072789712788640926, 0.741531185599394439863864773280788,
+                 0.586087235467691130294144845693013, 0.405845151377397166906606412076961,
+                 0.207784955007898467600689403773245, 0.0])
+GK_W = np.array([0.022935322010529224963732008058970, 0.063092092629978553290700663189204,
+                 0.104790010322250183839876322541518, 0.140653259715525918745189590510238,
+                 0.169004726639267902826583426598550, 0.190350578064785409913256402421014,
+                 0.204432940075298892414161999234649, 0.209482141084727828012999174891714])
+G_W = np.array([0.129484966168869693270611432679082, 0.279705391489276667901467771423780,
+                0.381830050505118944950369775488975, 0.417959183673469387755102040816327])
+NODES = np.concatenate([-GK_X[:7], GK_X[::-1]])                     # 15 ascending nodes
+K_WEIGHTS = np.concatenate([GK_W[:7], GK_W[::-1]])
+G_WEIGHTS = np.zeros(15)
+G_WEIGHTS[[1, 3, 5, 7, 9, 11, 13]] = np.concatenate([G_W[:3], G_W[::-1]])
+TOL = 1e-10                     # relative, per interval
+MAX_ROUNDS = 40                 # bisections: panel width ≥ 2⁻⁴⁰ of the interval
+
+
+# ═══════════════════════════════════════════════════════════
+# FIELD REDUCTIONS
+# ═══════════════════════════════════════════════════════════
+
+def reduce_grid(x, M=(M_sun,), theta=(math.pi / 2,), metric="approach_A", fields=("volume", "trace"),
+                units="rs", cells=CHUNK * 4):
+    """
+    {field: {"min", "max", "mean", "count", "x_mean"}} over the (x, M, θ) grid,
+    non-finite values excluded; x_mean is the mean over (M, θ) at each radius.
+    The grid is evaluated in blocks of ≈ `cells` cells, never held whole.
+    """
+    x, M, theta = (np.asarray(a, dtype=float).ravel() for a in (x, M, theta))
+    unknown = set(fields) - set(FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown fields {sorted(unknown)}; available: {', '.join(FIELDS)}")
+    rows = max(1, cells // (len(M) * len(theta)))
+    acc = {f: {"min": np.inf, "max": -np.inf, "sum": 0.0, "count": 0, "x_mean": np.empty(len(x))}
+           for f in fields}
+    for lo in range(0, len(x), rows):
+        grid = evaluate_grid(x[lo:lo + rows], M, theta, metric=metric, units=units, fields=list(fields))
+        for f in fields:
+            v = getattr(grid, f).reshape(grid_rows := min(rows, len(x) - lo), -1)
+            ok = np.isfinite(v)
+            n = ok.sum(axis=1)
+            a = acc[f]
+            if n.any():
+                a["min"] = min(a["min"], float(np.min(v, where=ok, initial=np.inf)))
+                a["max"] = max(a["max"], float(np.max(v, where=ok, initial=-np.inf)))
+            row_sum = np.sum(v, axis=1, where=ok)
+            a["sum"] += float(row_sum.sum())
+            a["count"] += int(n.sum())
+            with np.errstate(invalid="ignore", divide="ignore"):
+                a["x_mean"][lo:lo + grid_rows] = np.where(n > 0, row_sum / n, np.nan)
+    return {f: {"min": a["min"], "max": a["max"], "mean": a["sum"] / a["count"] if a["count"] else math.nan,
+                "count": a["count"], "x_mean": a["x_mean"]} for f, a in acc.items()}
+
+
+# ═══════════════════════════════════════════════════════════
+# ADAPTIVE QUADRATURE
+# ═══════════════════════════════════════════════════════════
+
+def _to_u(x):
+    return np.sign(x - 1.0) * np.sqrt(np.abs(x - 1.0))
+
+
+def _horizon_noise(a, b):
+    """
+    Relative rounding noise of g_rr on a panel in u: x = 1 + u|u| is stored
+    to ε·x, so g_rr ∝ 1/(x - 1) is known to ≈ ε·x/u² at the panel's
+    innermost node (0.43% of the width in from its inner end).
+    """
+    same = np.sign(a) == np.sign(b)
+    u = np.maximum(np.where(same, np.minimum(np.abs(a), np.abs(b)), 0.0), 0.0043 * np.abs(b - a))
+    with np.errstate(divide="ignore"):
+        return 16.0 * np.finfo(float).eps * (1.0 + u**2) / u**2
+
+
+def _radial_density(kind, metric, M, mass_dependent):
+    """f(u, owner) = density in r times dr/du = 2|u|, on flat node arrays."""
+    def f(u, owner):
+        x = 1.0 + u * np.abs(u)
+        m = evaluate(x, M[owner] if mass_dependent else M[0], metric=metric)
+        with np.errstate(invalid="ignore", over="ignore"):
+            if kind == "distance":
+                dens = np.sqrt(np.abs(m.g_rr))
+            else:
+                dens = np.sqrt(np.abs(m.g_rr)) * np.sqrt(np.abs(m.g_thth)) * np.sqrt(np.abs(m.g_phph))
+            return dens * 2.0 * np.abs(u)
+    return f
+
+
+def adaptive_integrate(f, a, b, tol=TOL, max_rounds=MAX_ROUNDS, panels_per_call=CHUNK // 15,
+                       noise=None, return_panels=False):
+    """
+    ∫ₐᵇ f for arrays of intervals, f(t, owner) vectorized over nodes t of
+    interval `owner`. Returns (value, error estimate, converged).
+    A panel is accepted when |K15 - G7| ≤ tol · max(|K15 panel|, |K15 interval|),
+    or ≤ noise(a, b) · |K15 panel| — the relative rounding noise of f on the
+    panel, below which bisection only multiplies panels.
+    return_panels=True appends (a, b, owner, f at NODES) of the accepted panels.
+    """
+    a, b = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+    shape = a.shape
+    a, b = a.ravel(), b.ravel()
+    value, error = np.zeros(a.size), np.zeros(a.size)
+    converged = np.ones(a.size, dtype=bool)
+    scale = None
+    pa, pb, owner = a, b, np.arange(a.size)
+    kept = []
+    for rnd in range(max_rounds + 1):
+        if not len(pa):
+            break
+        k_est, g_est = np.empty(len(pa)), np.empty(len(pa))
+        fv = np.empty((len(pa), 15))
+        for lo in range(0, len(pa), panels_per_call):
+            sl = slice(lo, lo + panels_per_call)
+            c, h = 0.5 * (pa[sl] + pb[sl]), 0.5 * (pb[sl] - pa[sl])
+            v = f(c[:, None] + h[:, None] * NODES, np.broadcast_to(owner[sl, None], (len(c), 15)))
+            fv[sl] = np.where(np.isfinite(v), v, np.nan)
+            k_est[sl], g_est[sl] = h * (fv[sl] @ K_WEIGHTS), h * (fv[sl] @ G_WEIGHTS)
+        err = np.abs(k_est - g_est)
+        if scale is None:
+            scale = np.abs(k_est)
+        ok = err <= tol * np.maximum(np.abs(k_est), scale[owner])
+        if noise is not None:
+            ok |= err <= noise(pa, pb) * np.abs(k_est)
+        done = ok | (rnd == max_rounds) | ~np.isfinite(err)
+        np.add.at(value, owner[done], k_est[done])
+        np.add.at(error, owner[done], err[done])
+        converged[owner[done & ~ok & (rnd == max_rounds)]] = False
+        if return_panels:
+            kept.append((pa[done], pb[done], owner[done], fv[done]))
+        mid = 0.5 * (pa + pb)
+        keep = ~done
+        pa, pb = np.concatenate([pa[keep], mid[keep]]), np.concatenate([mid[keep], pb[keep]])
+        owner = np.concatenate([owner[keep], owner[keep]])
+    result = (value.reshape(shape), error.reshape(shape), converged.reshape(shape))
+    if return_panels:
+        result += tuple(np.concatenate(p) for p in zip(*kept))
+    return result
+
+
+# Legendre interpolant through the 15 nodes, integrated from -1: ∫₋₁ᵗ p = legvander(t, 15) @ ANTIDERIV @ c
+_LEG_FIT = np.linalg.inv(np.polynomial.legendre.legvander(NODES, 14))
+_ANTIDERIV = np.polynomial.legendre.legint(np.eye(15), lbnd=-1, axis=0)
+
+
+def cumulative_integrate(f, lo, hi, t, tol=TOL * 1e-3):
+    """
+    (∫_lo^t f for every t, ∫_lo^hi f, error estimate, converged) from one
+    adaptive pass over [lo, hi]:
+    whole accepted panels below t are summed, and the panel holding t is
+    integrated through the degree-14 interpolant of its 15 node values —
+    no further evaluations of f, however many t. tol is tighter than for
+    proper_distance because the interpolant is less accurate than K15.
+    """
+    total, err, conv, pa, pb, _, fv = adaptive_integrate(f, lo, hi, tol=tol, noise=_horizon_noise,
+                                                         return_panels=True)
+    order = np.argsort(pa)
+    pa, pb, fv = pa[order], pb[order], fv[order]
+    h = 0.5 * (pb - pa)
+    prefix = np.concatenate([[0.0], np.cumsum(h * (fv @ K_WEIGHTS))])
+    t = np.asarray(t, dtype=float)
+    i = np.clip(np.searchsorted(pa, t, side="right") - 1, 0, len(pa) - 1)
+    tau = np.clip((t - pa[i]) / (2.0 * h[i]) * 2.0 - 1.0, -1.0, 1.0)
+    coeffs = fv[i] @ _LEG_FIT.T
+    partial = np.einsum("...k,...k->...", np.polynomial.legendre.legvander(tau, 15) @ _ANTIDERIV, coeffs)
+    return prefix[i] + h[i] * partial, float(total), float(err), bool(conv)
+
+
+def _radial(kind, x_a, x_b, M, metric, units, tol):
+    x_a, x_b, M = np.broadcast_arrays(np.asarray(x_a, dtype=float), np.asarray(x_b, dtype=float),
+                                      np.asarray(M, dtype=float))
+    if metric not in METRICS:
+        raise KeyError(f"Unknown metric {metric!r}; known: {', '.join(METRICS)}")
+    mass_dependent = MAPPINGS[METRICS[metric][1]].mass_dependent
+    f = _radial_density(kind, metric, M.ravel(), mass_dependent)
+    value, error, converged = adaptive_integrate(f, _to_u(x_a), _to_u(x_b), tol=tol, noise=_horizon_noise)
+    if units == "si":
+        scale = r_s_of(M) ** (1 if kind == "distance" else 3)
+        value, error = value * scale, error * scale
+    elif units != "rs":
+        raise ValueError(f"units must be 'rs' or 'si', not {units!r}")
+    return value, error, converged
+
+
+# ═══════════════════════════════════════════════════════════
+# PROPER DISTANCE AND VOLUME
+# ═══════════════════════════════════════════════════════════
+
+def proper_distance(x_a, x_b, M=M_sun, metric="approach_A", units="rs", tol=TOL):
+    """
+    (∫ √|g_rr| dr from x_a to x_b, error estimate, converged), x = r/r_s,
+    broadcast over x_a, x_b, M. In r_s, or metres with units="si".
+    """
+    return _radial("distance", x_a, x_b, M, metric, units, tol)
+
+
+def proper_volume(x_a, x_b, M=M_sun, metric="approach_A", theta_a=0.0, theta_b=math.pi,
+                  units="rs", tol=TOL):
+    """
+    (proper volume of the shell x_a < r/r_s < x_b, θ_a < θ < θ_b, all φ;
+    error estimate, converged). sin²θ enters only g_φφ, so the angles
+    factor out exactly: 2π (cos θ_a - cos θ_b) ∫ √|g_rr g_θθ g_φφ(π/2)| dr.
+    In r_s³, or m³ with units="si".
+    """
+    value, error, converged = _radial("volume", x_a, x_b, M, metric, units, tol)
+    ang = 2.0 * math.pi * (np.cos(theta_a) - np.cos(theta_b))
+    return value * ang, error * np.abs(ang), converged
+
+
+def distance_to_horizon(x, M=M_sun, metric="approach_A", units="rs", tol=TOL * 1e-3):
+    """
+    Proper radial distance from r_s to every x in one pass: one adaptive
+    integration out to the largest radius (and one in to the smallest if
+    any lie inside), read off at each x by cumulative_integrate.
+    Returns (distance, error estimate of the longest run); M scalar.
+    """
+    if metric not in METRICS:
+        raise KeyError(f"Unknown metric {metric!r}; known: {', '.join(METRICS)}")
+    x = np.asarray(x, dtype=float)
+    u = _to_u(x)
+    f = _radial_density("distance", metric, np.atleast_1d(np.asarray(M, dtype=float)), False)
+    out, err = np.zeros(x.shape), 0.0
+    if (u > 0).any():
+        cum, _, err, _ = cumulative_integrate(f, 0.0, float(u.max()), np.maximum(u, 0.0), tol)
+        out = np.where(u > 0, cum, out)
+    if (u < 0).any():
+        cum, total, err_in, _ = cumulative_integrate(f, float(u.min()), 0.0, np.minimum(u, 0.0), tol)
+        out, err = np.where(u < 0, total - cum, out), max(err, err_in)
+    if units == "si":
+        out, err = out * r_s_of(M), err * float(r_s_of(M))
+    elif units != "rs":
+        raise ValueError(f"units must be 'rs' or 'si', not {units!r}")
+    return out.reshape(x.shape), err
+
+
+def schwarzschild_distance(x):
+    """Closed form ∫₁ˣ dr/√(1 - 1/r) = √(x(x-1)) + arccosh √x   (r_s = 1)."""
+    x = np.asarray(x, dtype=float)
+    return np.sqrt(x * (x - 1.0)) + np.arccosh(np.sqrt(x))
+
+
+# ═══════════════════════════════════════════════════════════
+# RUN
+# ═══════════════════════════════════════════════════════════
+
+if __name__ == "__main__":
+    n_total = int(float(sys.argv[sys.argv.index("--n") + 1])) if "--n" in sys.argv else 1_000_000
+
+    print()
+    print("=" * 100)
+    print("  METRIC REDUCTIONS — √|det g|, Tr g, PROPER DISTANCE AND VOLUME")
+    print("=" * 100)
+
+    # ─── TEST 1: QUADRATURE RULE ──────────────────────────────
+    print()
+    print("─" * 100)
+    print("  TEST 1: GAUSS–KRONROD 7/15 WEIGHTS — ∫₋₁¹ tᵏ dt (K15 exact to k = 22, G7 to k = 13)")
+    print("─" * 100)
+    print()
+    for k in (0, 12, 13, 22, 23):
+        exact = (1.0 - (-1.0)**(k + 1)) / (k + 1)
+        print(f"  k = {k:<3d} |K15 - exact| = {abs(NODES**k @ K_WEIGHTS - exact):<10.1e} "
+              f"|G7 - exact| = {abs(NODES**k @ G_WEIGHTS - exact):.1e}")
+
+    # ─── TEST 2: DISTANCE TO THE HORIZON ──────────────────────
+    print()
+    print("─" * 100)
+    print(f"  TEST 2: PROPER DISTANCE TO THE HORIZON AT {n_total:,} RADII, ONE CALL")
+    print("─" * 100)
+    print()
+    x = np.geomspace(1.0 + 1e-9, 1e6, n_total)
+    exact = schwarzschild_distance(x)
+    print(f"  {'Metric':<20s} {'time (s)':<10s} {'error est.':<12s} {'max rel err vs GR closed form':<30s}")
+    print(f"  {'─'*20} {'─'*10} {'─'*12} {'─'*30}")
+    for metric in ("standard_gr", "v4", "approach_A", "blackhole_simulator"):
+        t0 = time.perf_counter()
+        d, err = distance_to_horizon(x, metric=metric)
+        dt = time.perf_counter() - t0
+        gr = f"{np.max(np.abs(d - exact) / exact):.1e}" if METRICS[metric][0] in ("gr", "inverse") else "—"
+        print(f"  {metric:<20s} {dt:<10.2f} {err:<12.1e} {gr:<30s}")
+    print()
+    print("  (v4 = diag(-1/ζ, ζ, r², r² sin²θ) with ζ = 1/(1 - r_s/r): the same g_rr as Schwarzschild)")
+    print()
+    names = ("standard_gr", "approach_A", "prime_metric_v1", "analyze_radius", "blackhole_simulator")
+    print(f"  {'r/r_s':<10s} " + " ".join(f"{m:<20s}" for m in names))
+    print(f"  {'─'*10} " + " ".join(f"{'─'*20}" for _ in names))
+    x_show = np.array([0.5, 1.001, 1.1, 1.5, 2.0, 3.0, 10.0, 100.0])
+    cols = [distance_to_horizon(x_show, metric=m)[0] for m in names]
+    for i, xi in enumerate(x_show):
+        print(f"  {xi:<10g} " + " ".join(f"{c[i]:<20.12g}" for c in cols))
+    print()
+    print("  r < r_s: |g_rr| integrated inward (spacelike only where g_rr > 0, e.g. prime_metric_v1)")
+    d_sun = distance_to_horizon(3.0, metric="approach_A", units="si")[0]
+    print(f"  Solar mass, approach_A: 3 r_s ({3 * float(r_s_of(M_sun)) / 1e3:.2f} km coordinate) lies "
+          f"{float(d_sun) / 1e3:.3f} km of proper distance above the horizon")
+
+    # ─── TEST 3: AGAINST mpmath ───────────────────────────────
+    try:
+        import mpmath
+    except ImportError:
+        mpmath = None
+    if mpmath is not None:
+        print()
+        print("─" * 100)
+        print("  TEST 3: PROPER DISTANCE AND SHELL VOLUME vs mpmath.quad (approach_A, r_s = 1)")
+        print("─" * 100)
+        print()
+        a, b = np.array([1.0, 1.5, 2.0, 10.0]), np.array([1.5, 3.0, 10.0, 1000.0])
+        dist, derr, _ = proper_distance(a, b)
+        vol, verr, _ = proper_volume(a, b)
+
+        # approach_A in u (x = 1 + u²): √g_rr dr = 2√(xζ) du, √(g_rr g_θθ g_φφ) dr = 2x^(5/2) ζ^(3/2) du
+        print(f"  {'shell':<14s} {'distance':<20s} {'rel err':<10s} {'volume':<20s} {'rel err':<10s}")
+        print(f"  {'─'*14} {'─'*20} {'─'*10} {'─'*20} {'─'*10}")
+        for i in range(len(a)):
+            u0, u1 = math.sqrt(a[i] - 1), math.sqrt(b[i] - 1)
+            ed = float(mpmath.quad(lambda u: 2 * mpmath.sqrt((1 + u**2) * mpmath.zeta(1 + (1 + u**2)**3)),
+                                   [u0, u1]))
+            ev = 4 * math.pi * float(mpmath.quad(
+                lambda u: 2 * (1 + u**2)**2.5 * mpmath.zeta(1 + (1 + u**2)**3)**1.5, [u0, u1]))
+            print(f"  {f'{a[i]:g}–{b[i]:g} r_s':<14s} {dist[i]:<20.14g} {abs(dist[i] - ed) / ed:<10.1e} "
+                  f"{vol[i]:<20.14g} {abs(vol[i] - ev) / ev:<10.1e}")
+
+    # ─── TEST 4: GRID REDUCTIONS ──────────────────────────────
+    print()
+    print("─" * 100)
+    print("  TEST 4: √|det g| AND Tr g OVER A 200 × 100 × 64 (r, M, θ) GRID, STREAMED")
+    print("─" * 100)
+    print()
+    x = np.geomspace(1.01, 1e4, 200)
+    M = np.geomspace(1e20, 1e40, 100)
+    theta = np.linspace(0.0, math.pi, 64)
+    for metric in ("standard_gr", "approach_A", "analyze_radius", "v4"):
+        t0 = time.perf_counter()
+        red = reduce_grid(x, M, theta, metric=metric, fields=("volume", "trace", "g_rr"))
+        dt = time.perf_counter() - t0
+        for i, (f, r) in enumerate(red.items()):
+            print(f"  {metric if i == 0 else '':<16s} {f:<8s} min {r['min']:<14.6g} max {r['max']:<14.6g} "
+                  f"mean {r['mean']:<14.6g} ⟨·⟩(1.01 r_s) {r['x_mean'][0]:<14.6g}"
+                  + (f" ({dt:.2f} s)" if i == 0 else ""))
+    print()
+    print("  analyze_radius (black_hole_prime_metric.py), θ = π/2: the engine's √|det g| against the")
+    print("  script's vol_prime = r² sinθ ζ². Its own components give √(ζ⁻¹ · ζ · r²ζ · r²ζ) = r²ζ.")
+    print()
+    x = np.array([1.1, 1.5, 2.0, 5.0, 10.0])
+    red = reduce_grid(x, metric="analyze_radius", fields=("volume", "zeta"))
+    print(f"  {'r/r_s':<8s} {'√|det g|':<16s} {'r²ζ':<16s} {'vol_prime = r²ζ²':<16s}")
+    print(f"  {'─'*8} {'─'*16} {'─'*16} {'─'*16}")
+    for xi, v, z in zip(x, red["volume"]["x_mean"], red["zeta"]["x_mean"]):
+        print(f"  {xi:<8g} {v:<16.10g} {xi**2 * z:<16.10g} {xi**2 * z**2:<16.10g}")
+    print()
@@ -14,6 +14,8 @@ Models a binary black hole inspiral gravitational wave (simplified).
 
 import math
 import json
+import os
+import sys
 
 # ═══════════════════════════════════════════════════════════
 # ZETA FUNCTION
@@ -197,7 +199,23 @@ print("  Computing ζ-embedded waveform...")
 #   r_orbit(t) ~ (t_merge - t)^(1/4) * r_isco
 # At each r_orbit, compute ζ and apply it to the strain.
 
-r_isco = 3 * r_s_total  # innermost stable circular orbit
+# Innermost stable circular orbit of the ζ-embedded metric (same s(r) as above),
+# from the batch solver in analysis/kretschner/orbit_extrema.py. Falls back to
+# the Schwarzschild value 3 r_s when NumPy / the solver is not available or
+# finds no ISCO.
+try:
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                    "..", "..", "analysis", "kretschner"))
+    from orbit_extrema import orbit_extrema
+    r_isco_over_rs = float(orbit_extrema("ζ Embedded", {"r_s": 1.0})["r_isco"][0])
+except ImportError:
+    r_isco_over_rs = math.nan
+if math.isfinite(r_isco_over_rs):
+    print(f"  r_isco = {r_isco_over_rs:.8f} r_s  (ζ-embedded metric, orbit_extrema.py)")
+else:
+    r_isco_over_rs = 3.0
+    print("  r_isco = 3 r_s  (Schwarzschild fallback — no ISCO from orbit_extrema.py)")
+r_isco = r_isco_over_rs * r_s_total  # innermost stable circular orbit
 
 zeta_strain = []
 zeta_timedil = []
@@ -395,6 +413,7 @@ output = {
     'gr_freq': [gr_freq[i] for i in range(0, len(times), step)],
     'source': 'GW150914-like',
     'peak_delta_pct': max_delta / max_gr * 100,
+    'r_isco_over_rs': r_isco_over_rs,
 }
 
 with open('ligo_sim_data.json', 'w') as f:
@@ -0,0 +1,17 @@
+// Lookup tiles written by analysis/metric-structure/export_tiles.py (see data/manifest.json):
+// gzip of little-endian float32, field-major [field 0: n][field 1: n]…
+// Resolves to one Float32Array per field; rejects when the browser has no
+// DecompressionStream or the fetch fails (e.g. file://), so pages fall back
+// to their own JavaScript ζ.
+function loadTile(url, nFields, n) {
+  if (typeof DecompressionStream === 'undefined') return Promise.reject(new Error('no DecompressionStream'));
+  return fetch(url).then(function(res) {
+    if (!res.ok) throw new Error('HTTP ' + res.status);
+    return new Response(res.body.pipeThrough(new DecompressionStream('gzip'))).arrayBuffer();
+  }).then(function(buf) {
+    if (buf.byteLength !== nFields * n * 4) throw new Error('tile size ' + buf.byteLength);
+    var fields = [];
+    for (var i = 0; i < nFields; i++) fields.push(new Float32Array(buf, i * n * 4, n));
+    return fields;
+  });
+}